@@ -21,11 +21,11 @@ def _percentile_score(value: float, all_values: list[float]) -> float:
     """Return 0-100 percentile score of value within all_values."""
     if not all_values or value is None:
         return 50.0
-    sorted_vals = sorted(all_values)
-    n = len(sorted_vals)
+    n = len(all_values)
     if n == 1:
         return 50.0
-    count_below = sum(1 for v in sorted_vals if v < value)
+    # Only the rank is needed, so count in one vectorized pass instead of sorting
+    count_below = int(np.count_nonzero(np.asarray(all_values, dtype=np.float64) < value))
     return min(100.0, (count_below / (n - 1)) * 100)
 
 
@@ -140,12 +140,12 @@ def compute_composite_score(page2_data: dict) -> dict:
 
 def _find_user_unemployment_series(trends: dict, user_education: str) -> list[dict]:
     """Find the unemployment series matching user's education level."""
-    from config import EDUCATION_OPTIONS, UNEMP_EDU
+    from config import EDUCATION_OPTIONS, UNEMP_EDU_BY_ID
 
     user_edu_id = EDUCATION_OPTIONS.get(user_education, {}).get("unemp")
-    for ename, eid in UNEMP_EDU.items():
-        if eid == user_edu_id and ename in trends:
-            return trends[ename]
+    ename = UNEMP_EDU_BY_ID.get(user_edu_id)
+    if ename in trends:
+        return trends[ename]
     # Fallback: first available
     if trends:
         return next(iter(trends.values()))
@@ -553,7 +553,8 @@ def compute_field_competitiveness(page2_data: dict) -> dict:
 
     Returns: {employment_rank, income_rank, total_fields,
               emp_quartile, inc_quartile, strengths, weaknesses,
-              field_rankings: [{field, employment_rate, median_income, combined_rank}]}
+              field_rankings: [{field, employment_rate, median_income,
+                              emp_str, inc_str, combined_rank}]}
     """
     labour = page2_data.get("labour_force", {})
     income = page2_data.get("income", {})
@@ -585,10 +586,14 @@ def compute_field_competitiveness(page2_data: dict) -> dict:
     for f in all_fields:
         er = emp_rank_map.get(f, total_fields)
         ir = inc_rank_map.get(f, total_fields)
+        emp = emp_map.get(f)
+        inc = inc_map.get(f)
         field_rankings.append({
             "field": f,
-            "employment_rate": emp_map.get(f),
-            "median_income": inc_map.get(f),
+            "employment_rate": emp,
+            "median_income": inc,
+            "emp_str": f"{emp:.1f}%" if emp is not None else "N/A",
+            "inc_str": f"${inc:,.0f}" if inc is not None else "N/A",
             "emp_rank": er,
             "inc_rank": ir,
             "combined_rank": er + ir,
@@ -14,8 +14,9 @@ import streamlit as st
 # Clear any stale cached data from previous code versions
 st.cache_data.clear()
 
+from cache_keys import content_key
 from config import FIELD_OPTIONS, EDUCATION_OPTIONS, GEO_OPTIONS
-from cip_codes import CIP_TO_BROAD, CIP_SERIES, CIP_SUBSERIES, CIP_CODES
+from cip_codes import CIP_TO_BROAD, CIP_SERIES, CIP_SERIES_SET, CIP_SUBSERIES, CIP_CODES
 from field_matcher import match_fields, resolve_subfield
 from processors import (
     fetch_cip_employment_distribution,
@@ -67,15 +68,6 @@ from analysis_charts import (
 )
 from styles import GLOBAL_CSS
 
-st.set_page_config(
-    page_title="YF \u2014 Career Exploration",
-    page_icon="\u2B50",
-    layout="wide",
-)
-
-# Inject global modern styles
-st.markdown(GLOBAL_CSS, unsafe_allow_html=True)
-
 
 # ── Page 1: User Profile & Field Matching ─────────────────────────
 
@@ -203,7 +195,7 @@ def render_profile_page():
         series_options = {
             code: f"{code}. {CIP_SERIES.get(code, code)}"
             for code in series_for_broad
-            if code in CIP_SERIES
+            if code in CIP_SERIES_SET
         }
         if series_options:
             series_labels = ["(All series)"] + list(series_options.values())
@@ -694,6 +686,44 @@ def render_analysis_page():
 # ── Page 3: Deep Career Analysis ─────────────────────────────────
 
 
+def _render_roi_details(roi):
+    """Best ROI highlight + detail list, emitted as a single element."""
+    best = roi.get("best_roi")
+    parts = ['<div class="yf-roi-banner">']
+    if best:
+        parts.append(
+            f"<p><strong>Best ROI:</strong> {best['from_level']} to {best['to_level']} — "
+            f"${best['income_premium']:,.0f}/yr premium, "
+            f"break-even in {best['break_even_years']:.1f} years</p>"
+        )
+    detail_items = "".join(
+        f"<li><strong>{level['from_level']} -&gt; {level['to_level']}</strong>: "
+        f"Premium ${level['income_premium']:,.0f}/yr ({level['premium_pct']:+.1f}%), "
+        f"Cost ${level['total_cost']:,.0f} over {level['duration_years']}yr, "
+        f"Break-even: {level['break_even_years']:.1f}yr</li>" if level['break_even_years'] else
+        f"<li><strong>{level['from_level']} -&gt; {level['to_level']}</strong>: "
+        f"No positive return</li>"
+        for level in roi["levels"]
+    )
+    parts.append(
+        f"<details><summary>ROI Details</summary><ul>{detail_items}</ul></details>"
+    )
+    parts.append("</div>")
+    st.markdown("".join(parts), unsafe_allow_html=True)
+
+
+def _render_field_rankings(field_rankings):
+    """Full field rankings in a collapsed expander."""
+    with st.expander("Full Field Rankings"):
+        # One markdown block for all rows; "$" is escaped so that adjacent
+        # income values are not parsed as inline LaTeX.
+        lines = "\n".join(
+            f"{i}. **{fr['field']}** — Employment: {fr['emp_str']}, Income: {fr['inc_str']}"
+            for i, fr in enumerate(field_rankings, 1)
+        )
+        st.markdown(lines.replace("$", "\\$"))
+
+
 def render_deep_analysis_page():
     _scroll_to_top()
 
@@ -737,8 +767,23 @@ def render_deep_analysis_page():
             st.rerun()
 
     # ── Run analysis ──────────────────────────────────────────
-    with st.spinner("Running deep analysis algorithms..."):
-        results = run_all_analyses(page2_data)
+    # The analyses are pure functions of page2_data, so reuse the previous
+    # results on reruns with unchanged inputs.
+    sig = content_key(page2_data)
+    cached = st.session_state.get("deep_results")
+    if cached and cached[0] == sig:
+        results = cached[1]
+    else:
+        with st.spinner("Running deep analysis algorithms..."):
+            results = run_all_analyses(page2_data)
+        st.session_state["deep_results"] = (sig, results)
+
+    # Sections without enough data drop their header and anchor; a caption
+    # gives the reason instead
+    roi = results["education_roi"]
+    compete = results["field_competitiveness"]
+    has_roi = "error" not in roi
+    has_compete = "error" not in compete
 
     # ── Fixed header ──────────────────────────────────────────
     sections = [
@@ -748,9 +793,11 @@ def render_deep_analysis_page():
         ("deep-forecast", "Trend Forecast"),
         ("deep-income", "Income Projection"),
         ("deep-risk", "Risk Assessment"),
-        ("deep-roi", "Education ROI"),
-        ("deep-compete", "Competitiveness"),
     ]
+    if has_roi:
+        sections.append(("deep-roi", "Education ROI"))
+    if has_compete:
+        sections.append(("deep-compete", "Competitiveness"))
 
     nav_links = "".join(
         f'<a href="#{sid}">{label}</a>'
@@ -783,10 +830,8 @@ def render_deep_analysis_page():
     for col, (name, val) in zip(cols, components.items()):
         col.metric(name, f"{val:.0f}/100")
 
-    st.divider()
-
     # ── Section 2: Career Quadrant ────────────────────────────
-    st.markdown('<div id="deep-quadrant"></div>', unsafe_allow_html=True)
+    st.markdown('<div id="deep-quadrant" class="yf-section-break"></div>', unsafe_allow_html=True)
     st.header("Career Quadrant — Employability vs Income")
     quadrant = results["career_quadrant"]
     if "error" not in quadrant:
@@ -809,10 +854,8 @@ def render_deep_analysis_page():
     else:
         st.warning(quadrant["error"])
 
-    st.divider()
-
     # ── Section 2b: Subfield Quadrant ─────────────────────────
-    st.markdown('<div id="deep-subfield"></div>', unsafe_allow_html=True)
+    st.markdown('<div id="deep-subfield" class="yf-section-break"></div>', unsafe_allow_html=True)
     sf_quad = results["subfield_quadrant"]
     if "error" not in sf_quad:
         sf_broad = sf_quad.get("broad_field", broad_field)
@@ -844,10 +887,8 @@ def render_deep_analysis_page():
         st.header(f"Within-Field Comparison — {broad_field}")
         st.info(sf_quad["error"])
 
-    st.divider()
-
     # ── Section 3: Trend Forecasts ────────────────────────────
-    st.markdown('<div id="deep-forecast"></div>', unsafe_allow_html=True)
+    st.markdown('<div id="deep-forecast" class="yf-section-break"></div>', unsafe_allow_html=True)
     st.header("Trend Forecasts")
 
     unemp_fc = results["unemployment_forecast"]
@@ -863,10 +904,8 @@ def render_deep_analysis_page():
         if "interpretation" in vac_fc:
             st.info(f"**Vacancies:** {vac_fc['interpretation']}")
 
-    st.divider()
-
     # ── Section 3: Income Growth Projection ───────────────────
-    st.markdown('<div id="deep-income"></div>', unsafe_allow_html=True)
+    st.markdown('<div id="deep-income" class="yf-section-break"></div>', unsafe_allow_html=True)
     st.header("Income Growth Projection")
     proj = results["income_projection"]
     if "error" not in proj:
@@ -890,10 +929,8 @@ def render_deep_analysis_page():
     else:
         st.warning(proj["error"])
 
-    st.divider()
-
     # ── Section 4: Risk Assessment ────────────────────────────
-    st.markdown('<div id="deep-risk"></div>', unsafe_allow_html=True)
+    st.markdown('<div id="deep-risk" class="yf-section-break"></div>', unsafe_allow_html=True)
     st.header("Career Stability & Risk Assessment")
     risk = results["risk_assessment"]
     st.plotly_chart(risk_assessment_chart(risk), use_container_width=True)
@@ -905,49 +942,24 @@ def render_deep_analysis_page():
 
     st.info(risk.get("interpretation", ""))
 
-    st.divider()
-
     # ── Section 5: Education ROI ──────────────────────────────
-    st.markdown('<div id="deep-roi"></div>', unsafe_allow_html=True)
-    st.header("Education ROI Analysis")
-    roi = results["education_roi"]
-    if "error" not in roi:
+    if has_roi:
+        st.markdown('<div id="deep-roi" class="yf-section-break"></div>', unsafe_allow_html=True)
+        st.header("Education ROI Analysis")
         col1, col2 = st.columns(2)
         with col1:
             st.plotly_chart(education_roi_waterfall(roi), use_container_width=True)
         with col2:
             st.plotly_chart(break_even_timeline(roi), use_container_width=True)
 
-        # Best ROI highlight
-        best = roi.get("best_roi")
-        if best:
-            st.success(
-                f"**Best ROI:** {best['from_level']} to {best['to_level']} — "
-                f"${best['income_premium']:,.0f}/yr premium, "
-                f"break-even in {best['break_even_years']:.1f} years"
-            )
-
-        # Detail table
-        with st.expander("ROI Details"):
-            for level in roi["levels"]:
-                st.write(
-                    f"**{level['from_level']} -> {level['to_level']}**: "
-                    f"Premium ${level['income_premium']:,.0f}/yr ({level['premium_pct']:+.1f}%), "
-                    f"Cost ${level['total_cost']:,.0f} over {level['duration_years']}yr, "
-                    f"Break-even: {level['break_even_years']:.1f}yr" if level['break_even_years'] else
-                    f"**{level['from_level']} -> {level['to_level']}**: "
-                    f"No positive return"
-                )
+        _render_roi_details(roi)
     else:
-        st.warning(roi["error"])
-
-    st.divider()
+        st.caption(f"Education ROI analysis skipped: {roi['error']}")
 
     # ── Section 6: Field Competitiveness ──────────────────────
-    st.markdown('<div id="deep-compete"></div>', unsafe_allow_html=True)
-    st.header("Field Competitiveness")
-    compete = results["field_competitiveness"]
-    if "error" not in compete:
+    if has_compete:
+        st.markdown('<div id="deep-compete" class="yf-section-break"></div>', unsafe_allow_html=True)
+        st.header("Field Competitiveness")
         col1, col2, col3 = st.columns(3)
         col1.metric(
             "Employment Rank",
@@ -968,18 +980,13 @@ def render_deep_analysis_page():
         if not compete.get("strengths") and not compete.get("weaknesses"):
             st.info("Your field ranks in the middle range across all metrics.")
 
-        # Rankings table
-        with st.expander("Full Field Rankings"):
-            for i, fr in enumerate(compete["field_rankings"], 1):
-                emp = f"{fr['employment_rate']:.1f}%" if fr.get("employment_rate") is not None else "N/A"
-                inc = f"${fr['median_income']:,.0f}" if fr.get("median_income") is not None else "N/A"
-                st.write(f"{i}. **{fr['field']}** — Employment: {emp}, Income: {inc}")
+        _render_field_rankings(compete["field_rankings"])
     else:
-        st.warning(compete["error"])
+        st.caption(f"Field competitiveness analysis skipped: {compete['error']}")
 
     # Footer
-    st.divider()
     st.markdown(
+        '<div class="yf-section-break"></div>'
         '<div class="yf-footer">Deep analysis powered by algorithmic models applied to Statistics Canada data. '
         'Projections are estimates based on historical trends and should not be taken as guarantees.</div>',
         unsafe_allow_html=True,
@@ -1504,7 +1511,7 @@ def render_career_exploration_page():
             series_options = {
                 code: f"{code}. {CIP_SERIES.get(code, code)}"
                 for code in series_for_broad
-                if code in CIP_SERIES
+                if code in CIP_SERIES_SET
             }
             chosen_series = None
             if series_options:
@@ -2549,29 +2556,35 @@ def render_ce_wages_page():
 # ── Router ────────────────────────────────────────────────────────
 
 
+PAGES = {
+    "profile": render_profile_page,
+    "analysis": render_analysis_page,
+    "deep_analysis": render_deep_analysis_page,
+    "cip_distribution": render_cip_distribution_page,
+    "career_exploration": render_career_exploration_page,
+    "ce_analysis": render_ce_analysis_page,
+    "ce_job_analysis": render_ce_job_analysis_page,
+    "ce_skills": render_ce_skills_page,
+    "ce_wages": render_ce_wages_page,
+}
+
+
 def main(default_page: str = "profile"):
-    if "wizard_page" not in st.session_state:
-        st.session_state["wizard_page"] = default_page
-
-    page = st.session_state["wizard_page"]
-    if page == "deep_analysis":
-        render_deep_analysis_page()
-    elif page == "cip_distribution":
-        render_cip_distribution_page()
-    elif page == "ce_analysis":
-        render_ce_analysis_page()
-    elif page == "ce_job_analysis":
-        render_ce_job_analysis_page()
-    elif page == "ce_skills":
-        render_ce_skills_page()
-    elif page == "ce_wages":
-        render_ce_wages_page()
-    elif page == "analysis":
-        render_analysis_page()
-    elif page == "career_exploration":
-        render_career_exploration_page()
-    else:
-        render_profile_page()
+    # Page config and styles are emitted per run rather than at import time:
+    # entry points such as app_ce.py import this module once, so module-level
+    # Streamlit calls would be skipped on every rerun after the first.
+    st.set_page_config(
+        page_title="YF \u2014 Career Exploration",
+        page_icon="\u2B50",
+        layout="wide",
+    )
+
+    # Inject global modern styles
+    st.markdown(GLOBAL_CSS, unsafe_allow_html=True)
+
+    st.session_state.setdefault("wizard_page", default_page)
+
+    PAGES.get(st.session_state["wizard_page"], render_profile_page)()
 
 
 if __name__ == "__main__":
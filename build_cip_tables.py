@@ -0,0 +1,72 @@
+"""Generate cip_tables.py from the Statistics Canada CIP 2021 structure CSV.
+
+Run after replacing cip-2021-structure.csv:
+
+    python build_cip_tables.py
+
+The app imports the generated literals instead of parsing the CSV (about
+1 MB, mostly class definitions) at startup.
+"""
+
+import csv
+import io
+import json
+import os
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
+_CSV_PATH = os.path.join(_DIR, "cip-2021-structure.csv")
+_OUT_PATH = os.path.join(_DIR, "cip_tables.py")
+
+_HEADER = '''"""CIP 2021 code tables (series, subseries, class).
+
+Generated from cip-2021-structure.csv by build_cip_tables.py — do not edit.
+"""
+'''
+
+
+def _load_csv() -> tuple[dict[str, str], dict[str, str], dict[str, str]]:
+    """Parse the official CIP 2021 structure CSV into three dicts."""
+    series: dict[str, str] = {}
+    subseries: dict[str, str] = {}
+    classes: dict[str, str] = {}
+
+    # One binary read; the BOM is stripped by hand rather than by utf-8-sig
+    with open(_CSV_PATH, "rb") as f:
+        text = f.read().removeprefix(b"\xef\xbb\xbf").decode("utf-8")
+
+    # Positional rows: no per-row dict as with csv.DictReader
+    reader = csv.reader(io.StringIO(text))
+    header = next(reader)
+    code_i = header.index("Code")
+    title_i = header.index("Class title")
+    level_i = header.index("Level")
+    tables = {"1": series, "2": subseries, "3": classes}
+    for row in reader:
+        table = tables.get(row[level_i].strip())
+        if table is not None:
+            table[row[code_i].strip().rstrip(".")] = row[title_i].strip()
+
+    return series, subseries, classes
+
+
+def _literal(name: str, table: dict[str, str]) -> str:
+    # json.dumps yields double-quoted strings that are valid Python literals
+    lines = [f"{name} = {{"]
+    lines.extend(f"    {json.dumps(k)}: {json.dumps(v, ensure_ascii=False)}," for k, v in table.items())
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    series, subseries, classes = _load_csv()
+    body = "\n\n".join(
+        _literal(name, table)
+        for name, table in (("CIP_SERIES", series), ("CIP_SUBSERIES", subseries), ("CIP_CODES", classes))
+    )
+    with open(_OUT_PATH, "w", encoding="utf-8") as f:
+        f.write(f"{_HEADER}\n{body}\n")
+    print(f"Wrote {_OUT_PATH}: {len(series)} series, {len(subseries)} subseries, {len(classes)} classes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Canonical content digests for in-process caches (chart figures, deep analysis)."""
+
+import hashlib
+import json
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Keys must not depend on dict insertion order
+_ORJSON_KEY_OPTS = (
+    orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if orjson else 0
+)
+
+
+def _json_default(o):
+    if isinstance(o, (set, frozenset)):
+        return sorted(o)
+    if isinstance(o, (np.ndarray, np.generic)):
+        return o.tolist()
+    return str(o)
+
+
+def _dumps_key(obj) -> bytes:
+    """Canonical JSON bytes of obj."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=_ORJSON_KEY_OPTS)
+    return json.dumps(obj, sort_keys=True, default=_json_default).encode()
+
+
+def content_key(obj) -> bytes:
+    """16-byte digest of obj's canonical JSON; equal content gives an equal key."""
+    return hashlib.blake2b(_dumps_key(obj), digest_size=16).digest()
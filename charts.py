@@ -1,6 +1,25 @@
 """Plotly chart creation functions for employment prediction app."""
 
+import functools
+import itertools
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+
+import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
+
+from cache_keys import content_key
+from config import EDUCATION_OPTIONS, UNEMP_EDU_BY_ID
+
+# Serialize figures with orjson when it is installed (optional dependency)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+else:
+    pio.json.config.default_engine = "orjson"
 
 
 # Modern color palette
@@ -19,116 +38,245 @@ SERIES_COLORS = [
     "#8B5CF6", "#14B8A6", "#84CC16", "#F43F5E",
 ]
 
-LAYOUT_DEFAULTS = dict(
-    plot_bgcolor="rgba(0,0,0,0)",
-    paper_bgcolor="rgba(0,0,0,0)",
-    font=dict(size=12, family="Inter, -apple-system, sans-serif", color="#334155"),
-    margin=dict(l=40, r=40, t=60, b=30),
-    hovermode="x unified",
-    hoverlabel=dict(
-        bgcolor="rgba(255,255,255,0.95)",
-        bordercolor="#E2E8F0",
-        font=dict(size=13, family="Inter, sans-serif", color="#1E293B"),
-    ),
-)
+LAYOUT_DEFAULTS = MappingProxyType({
+    "plot_bgcolor": "rgba(0,0,0,0)",
+    "paper_bgcolor": "rgba(0,0,0,0)",
+    "font": {"size": 12, "family": "Inter, -apple-system, sans-serif", "color": "#334155"},
+    "margin": {"l": 40, "r": 40, "t": 60, "b": 30},
+    "hovermode": "x unified",
+    "hoverlabel": {
+        "bgcolor": "rgba(255,255,255,0.95)",
+        "bordercolor": "#E2E8F0",
+        "font": {"size": 13, "family": "Inter, sans-serif", "color": "#1E293B"},
+    },
+})
+
+# Everything _apply_layout sets except the per-chart title and height
+_BASE_LAYOUT = MappingProxyType({
+    **LAYOUT_DEFAULTS,
+    "transition": {"duration": 500, "easing": "cubic-in-out"},
+})
 
 # Plotly animation config for smooth transitions
-ANIMATION_CONFIG = dict(
-    displayModeBar=False,
-    scrollZoom=False,
-)
+ANIMATION_CONFIG = {
+    "displayModeBar": False,
+    "scrollZoom": False,
+}
 
+# Traces are built as plain dicts and figures skip Plotly's per-property
+# validation. Flip to True when debugging a spec that renders incorrectly.
+_VALIDATE = False
 
-def _apply_layout(fig: go.Figure, title: str = "", height: int = 500) -> go.Figure:
-    fig.update_layout(
-        **LAYOUT_DEFAULTS,
-        title=dict(
-            text=title,
-            font=dict(size=17, family="Inter, sans-serif", color="#1E293B", weight=600),
-            x=0.0,
-            xanchor="left",
-        ),
-        height=height,
-        transition=dict(duration=500, easing="cubic-in-out"),
-    )
-    fig.update_xaxes(
-        showgrid=True, gridwidth=1, gridcolor="rgba(148,163,184,0.15)",
-        zeroline=False,
-        tickfont=dict(size=11, color="#64748B"),
-    )
-    fig.update_yaxes(
-        showgrid=True, gridwidth=1, gridcolor="rgba(148,163,184,0.15)",
-        zeroline=False,
-        tickfont=dict(size=11, color="#64748B"),
-    )
-    return fig
 
+def _figure(data: list[dict], layout: dict | None = None) -> go.Figure:
+    return go.Figure({"data": data, "layout": layout or {}}, _validate=_VALIDATE)
 
-def _empty_chart(message: str) -> go.Figure:
-    fig = go.Figure()
-    fig.add_annotation(text=message, xref="paper", yref="paper", x=0.5, y=0.5,
-                       showarrow=False, font=dict(size=16, color="gray"))
-    fig.update_layout(xaxis=dict(visible=False), yaxis=dict(visible=False),
-                      **LAYOUT_DEFAULTS, height=300)
+
+def _f32(values) -> np.ndarray:
+    """Float32 array for numeric trace data; None becomes NaN (a gap in Plotly)."""
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float32)
+
+
+# Bounded LRU of built figures, keyed by a digest of the builder's inputs
+_FIG_CACHE_SIZE = 64
+_fig_cache: OrderedDict[bytes, go.Figure] = OrderedDict()
+_fig_cache_lock = threading.Lock()
+
+
+def _memoize_fig(fn):
+    """Return the cached figure when a builder is called with identical inputs.
+
+    Cached figures are shared between reruns and sessions, so callers must
+    not mutate them.
+    """
+    name = f"{fn.__module__}.{fn.__qualname__}"
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = content_key((name, args, kwargs))
+        with _fig_cache_lock:
+            fig = _fig_cache.get(key)
+            if fig is not None:
+                _fig_cache.move_to_end(key)
+                return fig
+        fig = fn(*args, **kwargs)
+        with _fig_cache_lock:
+            _fig_cache[key] = fig
+            if len(_fig_cache) > _FIG_CACHE_SIZE:
+                _fig_cache.popitem(last=False)
+        return fig
+
+    return wrapper
+
+
+def _field_matches(user_field: str, fields: list[str]) -> np.ndarray:
+    """Boolean mask of fields that are (or contain) the user's field name."""
+    return np.fromiter((user_field in f for f in fields), dtype=bool, count=len(fields))
+
+
+def _pct_text(values: np.ndarray, fmt: str = "%.1f%%") -> list[str]:
+    """Bar labels such as "12.3%", formatted in one vectorized pass."""
+    return np.char.mod(fmt, values).tolist()
+
+
+def _gradient_colors(alphas: np.ndarray) -> list[str]:
+    """Indigo fills whose opacity follows alphas (one per bar)."""
+    return np.char.mod("rgba(99, 102, 241, %s)", alphas).tolist()
+
+
+# Bound str.format method, mapped over plain lists for dollar labels
+_MONEY = "${:,.0f}".format
+
+
+def _dollar_text(values: np.ndarray) -> list[str]:
+    """Bar labels such as "$52,300" (np.char.mod has no thousands separator)."""
+    return list(map(_MONEY, values.tolist()))
+
+
+def _field_labels(text: str, labels: list[str], mask: np.ndarray, x: float) -> list[dict]:
+    """Annotations placing text at x beside each bar whose mask entry is set."""
+    font = {"size": 12, "color": USER_COLOR, "family": "Inter, sans-serif"}
+    return [
+        {"y": label, "x": x, "text": text, "showarrow": False, "font": font, "xanchor": "left"}
+        for label, is_user in zip(labels, mask.tolist()) if is_user
+    ]
+
+
+def _truncate(label: str, n: int = 50) -> str:
+    """Shorten an axis label to n characters plus an ellipsis."""
+    return label if len(label) <= n else f"{label[:n]}..."
+
+
+# Plain dict: Plotly only accepts dicts for nested properties. Never mutated.
+_TITLE_FONT = {"size": 17, "family": "Inter, sans-serif", "color": "#1E293B", "weight": 600}
+
+
+def _title(text: str) -> dict:
+    return {"text": text, "font": _TITLE_FONT, "x": 0.0, "xanchor": "left"}
+
+
+# Grid and tick styling shared by every cartesian axis
+_AXIS_STYLE = MappingProxyType({
+    "showgrid": True, "gridwidth": 1, "gridcolor": "rgba(148,163,184,0.15)",
+    "zeroline": False,
+    "tickfont": {"size": 11, "color": "#64748B"},
+})
+
+
+def _apply_layout(fig: go.Figure, title: str = "", height: int = 500) -> go.Figure:
+    layout = _BASE_LAYOUT | {"title": _title(title), "height": height}
+    # Gauge and polar figures have no cartesian axes to style
+    if any("xaxis" in trace for trace in fig.data):
+        layout["xaxis"] = dict(_AXIS_STYLE)
+        layout["yaxis"] = dict(_AXIS_STYLE)
+    fig.update_layout(layout)
     return fig
 
 
+def _chart(data: list[dict], title: str, height: int, layout: dict | None = None) -> go.Figure:
+    """Build a cartesian figure with its complete layout in one step.
+
+    Same result as _figure() followed by _apply_layout(), without the three
+    update passes. "xaxis"/"yaxis" entries in layout are merged over the
+    shared axis styling; every other key is set as given.
+    """
+    layout = layout or {}
+    full = _BASE_LAYOUT | {"title": _title(title), "height": height} | layout
+    full["xaxis"] = _AXIS_STYLE | layout.get("xaxis", {})
+    full["yaxis"] = _AXIS_STYLE | layout.get("yaxis", {})
+    return _figure(data, full)
+
+
+# Empty-state charts have no data, so grid/hover settings are left out
+_EMPTY_LAYOUT = MappingProxyType({
+    "xaxis": {"visible": False},
+    "yaxis": {"visible": False},
+    "height": 300,
+    "plot_bgcolor": LAYOUT_DEFAULTS["plot_bgcolor"],
+    "paper_bgcolor": LAYOUT_DEFAULTS["paper_bgcolor"],
+    "font": LAYOUT_DEFAULTS["font"],
+    "margin": {"l": 20, "r": 20, "t": 20, "b": 20},
+})
+
+
+@functools.lru_cache(maxsize=32)
+def _empty_chart(message: str) -> go.Figure:
+    """Placeholder figure showing message; one shared instance per message."""
+    return go.Figure({
+        "data": [],
+        "layout": {
+            **_EMPTY_LAYOUT,
+            "annotations": [{
+                "text": message, "xref": "paper", "yref": "paper", "x": 0.5, "y": 0.5,
+                "showarrow": False, "font": {"size": 16, "color": "gray"},
+            }],
+        },
+    }, _validate=_VALIDATE)
+
+
+def _hbar_ranking(rows: list[dict], value_key: str, user_field: str, text_fn, hovertemplate: str, title: str) -> go.Figure:
+    """Horizontal bar per field, with the user's field highlighted."""
+    # Single pass over the rows for values and labels
+    fields, values, labels = [], [], []
+    for d in rows:
+        f = d["field"]
+        fields.append(f)
+        values.append(d[value_key])
+        labels.append(_truncate(f))
+    values_arr = np.asarray(values, dtype=np.float64)
+    colors = np.where(_field_matches(user_field, fields), USER_COLOR, DEFAULT_COLOR).tolist()
+
+    return _chart([{
+        "type": "bar", "x": values_arr.astype(np.float32), "y": labels, "orientation": "h",
+        "marker": {"color": colors, "line": {"width": 0}, "cornerradius": 4},
+        "text": text_fn(values_arr), "textposition": "outside",
+        "hovertemplate": hovertemplate,
+    }], title, height=max(400, len(labels) * 35))
+
+
+@_memoize_fig
 def employment_rate_bar(comparison: list[dict], user_field: str) -> go.Figure:
     """Horizontal bar chart: employment rate across fields, user's highlighted."""
     if not comparison:
         return _empty_chart("No employment rate data available")
+    return _hbar_ranking(
+        comparison, "employment_rate", user_field, _pct_text,
+        "%{y}<br>Employment Rate: %{x:.1f}%<extra></extra>",
+        "Employment Rate by Field of Study",
+    )
 
-    fields = [d["field"] for d in comparison]
-    rates = [d["employment_rate"] for d in comparison]
-    colors = [USER_COLOR if user_field in f else DEFAULT_COLOR for f in fields]
-    labels = [f[:50] + "..." if len(f) > 50 else f for f in fields]
 
-    fig = go.Figure(go.Bar(
-        x=rates, y=labels, orientation="h",
-        marker=dict(color=colors, line=dict(width=0), cornerradius=4),
-        text=[f"{r:.1f}%" for r in rates], textposition="outside",
-        hovertemplate="%{y}<br>Employment Rate: %{x:.1f}%<extra></extra>",
-    ))
-    return _apply_layout(fig, "Employment Rate by Field of Study", height=max(400, len(fields) * 35))
+# Summary keys, labels and colours of the three education_comparison_grouped bars
+_RATE_KEYS = ("employment_rate", "participation_rate", "unemployment_rate")
+_RATE_LABELS = ["Employment Rate", "Participation Rate", "Unemployment Rate"]
+_RATE_COLORS = [ACCENT_GREEN, DEFAULT_COLOR, ACCENT_ROSE]
 
 
+@_memoize_fig
 def education_comparison_grouped(summary: dict, education: str) -> go.Figure:
-    """Grouped bar chart: employment/participation/unemployment rates."""
-    metrics = [
-        ("Employment Rate", summary.get("employment_rate", 0), ACCENT_GREEN),
-        ("Participation Rate", summary.get("participation_rate", 0), DEFAULT_COLOR),
-        ("Unemployment Rate", summary.get("unemployment_rate", 0), ACCENT_ROSE),
-    ]
-
-    fig = go.Figure()
-    for label, value, color in metrics:
-        fig.add_trace(go.Bar(
-            x=[label], y=[value], name=label, marker_color=color,
-            text=[f"{value:.1f}%"], textposition="outside",
-        ))
-    fig.update_layout(showlegend=False, barmode="group")
-    return _apply_layout(fig, f"Key Rates \u2014 {education}", height=400)
+    """Bar chart of employment/participation/unemployment rates (one trace)."""
+    values = _f32([summary.get(key, 0) for key in _RATE_KEYS])
+    return _chart([{
+        "type": "bar", "x": _RATE_LABELS, "y": values,
+        "marker": {"color": _RATE_COLORS},
+        "text": _pct_text(values), "textposition": "outside",
+        "hovertemplate": "%{x}: %{y:.1f}%<extra></extra>",
+    }], f"Key Rates \u2014 {education}", height=400, layout={"showlegend": False})
 
 
+@_memoize_fig
 def income_ranking_bar(ranking: list[dict], user_field: str) -> go.Figure:
     """Horizontal bar chart of median income by field."""
     if not ranking:
         return _empty_chart("No income ranking data available")
-
-    fields = [d["field"] for d in ranking]
-    incomes = [d["median_income"] for d in ranking]
-    colors = [USER_COLOR if user_field in f else DEFAULT_COLOR for f in fields]
-    labels = [f[:50] + "..." if len(f) > 50 else f for f in fields]
-
-    fig = go.Figure(go.Bar(
-        x=incomes, y=labels, orientation="h",
-        marker=dict(color=colors, line=dict(width=0), cornerradius=4),
-        text=[f"${v:,.0f}" for v in incomes], textposition="outside",
-        hovertemplate="%{y}<br>Median Income: $%{x:,.0f}<extra></extra>",
-    ))
-    return _apply_layout(fig, "Median Income Ranking by Field", height=max(400, len(fields) * 35))
+    return _hbar_ranking(
+        ranking, "median_income", user_field, _dollar_text,
+        "%{y}<br>Median Income: $%{x:,.0f}<extra></extra>",
+        "Median Income Ranking by Field",
+    )
 
 
+@_memoize_fig
 def income_by_education_line(by_education: list[dict], field: str) -> go.Figure:
     """Line chart: income vs education level."""
     if not by_education:
@@ -137,284 +285,269 @@ def income_by_education_line(by_education: list[dict], field: str) -> go.Figure:
     edu_labels = [d["education"] for d in by_education]
     incomes = [d["median_income"] for d in by_education]
 
-    fig = go.Figure(go.Scatter(
-        x=edu_labels, y=incomes, mode="lines+markers",
-        marker=dict(size=10, color=HIGHLIGHT_COLOR, line=dict(width=2, color="white")),
-        line=dict(color=HIGHLIGHT_COLOR, width=3, shape="spline"),
-        fill="tozeroy", fillcolor="rgba(99, 102, 241, 0.08)",
-        hovertemplate="%{x}<br>Median Income: $%{y:,.0f}<extra></extra>",
-    ))
-    fig.update_xaxes(tickangle=45)
-    return _apply_layout(fig, f"Income by Education \u2014 {field}", height=450)
+    return _chart([{
+        "type": "scatter", "x": edu_labels, "y": _f32(incomes), "mode": "lines+markers",
+        "marker": {"size": 10, "color": HIGHLIGHT_COLOR, "line": {"width": 2, "color": "white"}},
+        "line": {"color": HIGHLIGHT_COLOR, "width": 3, "shape": "spline"},
+        "fill": "tozeroy", "fillcolor": "rgba(99, 102, 241, 0.08)",
+        "hovertemplate": "%{x}<br>Median Income: $%{y:,.0f}<extra></extra>",
+    }], f"Income by Education \u2014 {field}", height=450, layout={"xaxis": {"tickangle": 45}})
 
 
+@_memoize_fig
 def unemployment_trend_lines(trends: dict, user_education: str) -> go.Figure:
     """Multi-line time series of unemployment rate by education level."""
     if not trends:
         return _empty_chart("No unemployment trend data available")
 
     # Map user education to the matching UNEMP_EDU key
-    from config import EDUCATION_OPTIONS, UNEMP_EDU
     user_edu_id = EDUCATION_OPTIONS.get(user_education, {}).get("unemp")
-    user_edu_name = None
-    for ename, eid in UNEMP_EDU.items():
-        if eid == user_edu_id:
-            user_edu_name = ename
-            break
-
-    fig = go.Figure()
-    color_idx = 0
+    user_edu_name = UNEMP_EDU_BY_ID.get(user_edu_id)
+
+    # One trace per level so unified hover lists every rate for a year;
+    # the user's level is highlighted, the rest are faded series colours.
+    traces = []
+    series_colors = itertools.cycle(SERIES_COLORS)
     for edu_name, series in trends.items():
         dates = [d["date"] for d in series]
-        values = [d["value"] for d in series]
+        values = _f32([d["value"] for d in series])
         is_user = edu_name == user_edu_name
-        c = USER_COLOR if is_user else SERIES_COLORS[color_idx % len(SERIES_COLORS)]
-        color_idx += 1
+        # Every level advances the cycle, so each keeps its colour whichever is the user's
+        c = next(series_colors)
+        if is_user:
+            c = USER_COLOR
 
-        fig.add_trace(go.Scatter(
-            x=dates, y=values, name=edu_name[:40], mode="lines",
-            line=dict(width=3.5 if is_user else 1.5, color=c, shape="spline"),
-            opacity=1.0 if is_user else 0.35,
-            hovertemplate=f"{edu_name[:30]}<br>Year: %{{x}}<br>Rate: %{{y:.1f}}%<extra></extra>",
-        ))
+        traces.append({
+            "type": "scatter", "x": dates, "y": values, "name": edu_name[:40], "mode": "lines",
+            "line": {"width": 3.5 if is_user else 1.5, "color": c, "shape": "spline"},
+            "opacity": 1.0 if is_user else 0.35,
+            "hovertemplate": f"{edu_name[:30]}<br>Year: %{{x}}<br>Rate: %{{y:.1f}}%<extra></extra>",
+        })
 
-    fig.update_layout(legend=dict(orientation="h", yanchor="bottom", y=-0.3, xanchor="center", x=0.5, font_size=10))
-    return _apply_layout(fig, "Unemployment Rate Trends by Education Level", height=500)
+    return _chart(traces, "Unemployment Rate Trends by Education Level", height=500, layout={
+        "legend": {"orientation": "h", "yanchor": "bottom", "y": -0.3, "xanchor": "center", "x": 0.5, "font": {"size": 10}},
+    })
 
 
+@_memoize_fig
 def job_vacancy_dual_axis(trends: list[dict]) -> go.Figure:
     """Dual-axis chart: bars for vacancies, line for avg wage."""
     if not trends:
         return _empty_chart("No job vacancy data available")
 
-    dates = [d["date"] for d in trends]
-    vacancies = [d.get("vacancies") for d in trends]
-    wages = [d.get("avg_wage") for d in trends]
-
-    fig = go.Figure()
-    fig.add_trace(go.Bar(
-        x=dates, y=vacancies, name="Job Vacancies", marker_color=DEFAULT_COLOR, opacity=0.7,
-        hovertemplate="Date: %{x}<br>Vacancies: %{y:,.0f}<extra></extra>",
-    ))
-
-    if any(w is not None for w in wages):
-        fig.add_trace(go.Scatter(
-            x=dates, y=wages, name="Avg Offered Wage", mode="lines+markers",
-            marker=dict(size=6, color=HIGHLIGHT_COLOR),
-            line=dict(color=HIGHLIGHT_COLOR, width=2), yaxis="y2",
-            hovertemplate="Date: %{x}<br>Avg Wage: $%{y:,.2f}/hr<extra></extra>",
-        ))
-        fig.update_layout(yaxis2=dict(title="Avg Offered Wage ($/hr)", overlaying="y", side="right", showgrid=False))
-
-    fig.update_layout(yaxis_title="Job Vacancies",
-                      legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5))
-    return _apply_layout(fig, "Job Vacancies & Offered Wages Over Time", height=450)
-
-
+    dates, vacancies, wages = [], [], []
+    has_wage = False
+    for d in trends:
+        w = d.get("avg_wage")
+        dates.append(d["date"])
+        vacancies.append(d.get("vacancies"))
+        wages.append(w)
+        has_wage = has_wage or w is not None
+
+    traces = [{
+        "type": "bar", "x": dates, "y": _f32(vacancies), "name": "Job Vacancies", "marker": {"color": DEFAULT_COLOR}, "opacity": 0.7,
+        "hovertemplate": "Date: %{x}<br>Vacancies: %{y:,.0f}<extra></extra>",
+    }]
+    layout = {
+        "yaxis": {"title": {"text": "Job Vacancies"}},
+        "legend": {"orientation": "h", "yanchor": "bottom", "y": -0.2, "xanchor": "center", "x": 0.5},
+    }
+
+    if has_wage:
+        traces.append({
+            "type": "scatter", "x": dates, "y": _f32(wages), "name": "Avg Offered Wage", "mode": "lines+markers",
+            "marker": {"size": 6, "color": HIGHLIGHT_COLOR},
+            "line": {"color": HIGHLIGHT_COLOR, "width": 2}, "yaxis": "y2",
+            "hovertemplate": "Date: %{x}<br>Avg Wage: $%{y:,.2f}/hr<extra></extra>",
+        })
+        layout["yaxis2"] = _AXIS_STYLE | {
+            "title": {"text": "Avg Offered Wage ($/hr)"}, "overlaying": "y", "side": "right", "showgrid": False,
+        }
+
+    return _chart(traces, "Job Vacancies & Offered Wages Over Time", height=450, layout=layout)
+
+
+@_memoize_fig
 def graduate_income_trajectory(trajectory: list[dict]) -> go.Figure:
     """Connected dot chart: income at 2yr and 5yr post-graduation."""
     if not trajectory:
         return _empty_chart("No graduate outcome data available")
 
-    years = [d["years_after"] for d in trajectory]
-    incomes = [d["income"] for d in trajectory]
-
-    fig = go.Figure(go.Scatter(
-        x=years, y=incomes, mode="lines+markers+text",
-        marker=dict(size=14, color=USER_COLOR, line=dict(width=2, color="white")),
-        line=dict(color=USER_COLOR, width=3),
-        text=[f"${v:,.0f}" for v in incomes], textposition="top center",
-        hovertemplate="Years After Graduation: %{x}<br>Income: $%{y:,.0f}<extra></extra>",
-    ))
-    fig.update_xaxes(title="Years After Graduation",
-                     tickvals=years, ticktext=[f"{y} years" for y in years])
-    fig.update_yaxes(title="Median Income ($)")
-    return _apply_layout(fig, "Income Growth After Graduation", height=400)
-
-
+    n = len(trajectory)
+    years = np.fromiter((d["years_after"] for d in trajectory), dtype=np.int32, count=n)
+    incomes = np.fromiter((d["income"] for d in trajectory), dtype=np.float64, count=n)
+
+    return _chart([{
+        "type": "scatter", "x": years, "y": incomes.astype(np.float32), "mode": "lines+markers+text",
+        "marker": {"size": 14, "color": USER_COLOR, "line": {"width": 2, "color": "white"}},
+        "line": {"color": USER_COLOR, "width": 3},
+        "text": _dollar_text(incomes), "textposition": "top center",
+        "hovertemplate": "Years After Graduation: %{x}<br>Income: $%{y:,.0f}<extra></extra>",
+    }], "Income Growth After Graduation", height=400, layout={
+        "xaxis": {
+            "title": {"text": "Years After Graduation"},
+            "tickvals": years, "ticktext": np.char.mod("%d years", years).tolist(),
+        },
+        "yaxis": {"title": {"text": "Median Income ($)"}},
+    })
+
+
+# Shared by the two 2yr-vs-5yr grouped income bar charts
+_INCOME_PAIR_LAYOUT = MappingProxyType({
+    "barmode": "group",
+    "legend": {
+        "orientation": "h", "yanchor": "bottom", "y": -0.15,
+        "xanchor": "center", "x": 0.5, "font": {"size": 12},
+    },
+    "xaxis": {"title": {"text": "Median Employment Income ($)"}},
+})
+
+
+@_memoize_fig
 def cip_income_comparison_bar(broad_comparison: list[dict], user_broad_field: str) -> go.Figure:
     """Grouped bar chart: 2yr vs 5yr median income across all broad CIP fields."""
     if not broad_comparison:
         return _empty_chart("No CIP employment distribution data available")
 
-    fields = [d["field"] for d in broad_comparison]
-    labels = [f[:40] + "..." if len(f) > 40 else f for f in fields]
-    income_2yr = [d.get("income_2yr", 0) for d in broad_comparison]
-    income_5yr = [d.get("income_5yr", 0) for d in broad_comparison]
-
-    # Highlight user's field
-    colors_2yr = [
-        "rgba(59, 130, 246, 0.9)" if user_broad_field not in f
-        else "rgba(239, 68, 68, 0.9)"
-        for f in fields
-    ]
-    colors_5yr = [
-        "rgba(99, 102, 241, 0.9)" if user_broad_field not in f
-        else "rgba(239, 68, 68, 0.6)"
-        for f in fields
-    ]
-
-    fig = go.Figure()
-    fig.add_trace(go.Bar(
-        y=labels, x=income_2yr, name="2 Years After Graduation",
-        orientation="h",
-        marker=dict(color=DEFAULT_COLOR, line=dict(width=0), cornerradius=3),
-        text=[f"${v:,.0f}" for v in income_2yr], textposition="outside",
-        hovertemplate="%{y}<br>2yr Income: $%{x:,.0f}<extra></extra>",
-    ))
-    fig.add_trace(go.Bar(
-        y=labels, x=income_5yr, name="5 Years After Graduation",
-        orientation="h",
-        marker=dict(color=HIGHLIGHT_COLOR, line=dict(width=0), cornerradius=3),
-        text=[f"${v:,.0f}" for v in income_5yr], textposition="outside",
-        hovertemplate="%{y}<br>5yr Income: $%{x:,.0f}<extra></extra>",
-    ))
+    fields, labels, income_2yr, income_5yr = [], [], [], []
+    for d in broad_comparison:
+        f = d["field"]
+        fields.append(f)
+        labels.append(_truncate(f, 40))
+        income_2yr.append(d.get("income_2yr", 0))
+        income_5yr.append(d.get("income_5yr", 0))
 
     # Mark user's field with annotation
-    for i, f in enumerate(fields):
-        if user_broad_field in f:
-            fig.add_annotation(
-                y=labels[i], x=max(income_5yr) * 1.15,
-                text="Your Field", showarrow=False,
-                font=dict(size=12, color=USER_COLOR, family="Inter, sans-serif"),
-                xanchor="left",
-            )
-
-    fig.update_layout(
-        barmode="group",
-        legend=dict(
-            orientation="h", yanchor="bottom", y=-0.15,
-            xanchor="center", x=0.5, font_size=12,
-        ),
-        xaxis_title="Median Employment Income ($)",
-    )
-    return _apply_layout(
-        fig,
-        "Median Income by Field of Study — 2yr vs 5yr After Graduation",
-        height=max(500, len(fields) * 55),
-    )
-
-
+    annotations = _field_labels("Your Field", labels, _field_matches(user_broad_field, fields), max(income_5yr) * 1.15)
+
+    return _chart([
+        {
+            "type": "bar", "y": labels, "x": _f32(income_2yr), "name": "2 Years After Graduation",
+            "orientation": "h",
+            "marker": {"color": DEFAULT_COLOR, "line": {"width": 0}, "cornerradius": 3},
+            "text": list(map(_MONEY, income_2yr)), "textposition": "outside",
+            "hovertemplate": "%{y}<br>2yr Income: $%{x:,.0f}<extra></extra>",
+        },
+        {
+            "type": "bar", "y": labels, "x": _f32(income_5yr), "name": "5 Years After Graduation",
+            "orientation": "h",
+            "marker": {"color": HIGHLIGHT_COLOR, "line": {"width": 0}, "cornerradius": 3},
+            "text": list(map(_MONEY, income_5yr)), "textposition": "outside",
+            "hovertemplate": "%{y}<br>5yr Income: $%{x:,.0f}<extra></extra>",
+        },
+    ], "Median Income by Field of Study — 2yr vs 5yr After Graduation", height=max(500, len(fields) * 55),
+        layout=_INCOME_PAIR_LAYOUT | {"annotations": annotations})
+
+
+
+@_memoize_fig
 def cip_subfield_income_bar(subfield_comparison: list[dict], user_field_name: str) -> go.Figure:
     """Grouped bar chart: 2yr vs 5yr income for sub-fields within a broad field."""
     if not subfield_comparison:
         return _empty_chart("No sub-field data available for this category")
 
-    fields = [d["field"] for d in subfield_comparison]
-    labels = [f[:40] + "..." if len(f) > 40 else f for f in fields]
-    income_2yr = [d.get("income_2yr", 0) for d in subfield_comparison]
-    income_5yr = [d.get("income_5yr", 0) for d in subfield_comparison]
-
-    fig = go.Figure()
-    fig.add_trace(go.Bar(
-        y=labels, x=income_2yr, name="2 Years After",
-        orientation="h",
-        marker=dict(color=ACCENT_GREEN, line=dict(width=0), cornerradius=3),
-        text=[f"${v:,.0f}" for v in income_2yr], textposition="outside",
-        hovertemplate="%{y}<br>2yr Income: $%{x:,.0f}<extra></extra>",
-    ))
-    fig.add_trace(go.Bar(
-        y=labels, x=income_5yr, name="5 Years After",
-        orientation="h",
-        marker=dict(color=SECONDARY_COLOR, line=dict(width=0), cornerradius=3),
-        text=[f"${v:,.0f}" for v in income_5yr], textposition="outside",
-        hovertemplate="%{y}<br>5yr Income: $%{x:,.0f}<extra></extra>",
-    ))
+    fields, labels, income_2yr, income_5yr = [], [], [], []
+    for d in subfield_comparison:
+        f = d["field"]
+        fields.append(f)
+        labels.append(_truncate(f, 40))
+        income_2yr.append(d.get("income_2yr", 0))
+        income_5yr.append(d.get("income_5yr", 0))
 
     # Highlight user's field
-    for i, f in enumerate(fields):
-        if user_field_name in f:
-            fig.add_annotation(
-                y=labels[i], x=max(income_5yr) * 1.15 if income_5yr else 0,
-                text="You", showarrow=False,
-                font=dict(size=12, color=USER_COLOR, family="Inter, sans-serif"),
-                xanchor="left",
-            )
-
-    fig.update_layout(
-        barmode="group",
-        legend=dict(
-            orientation="h", yanchor="bottom", y=-0.15,
-            xanchor="center", x=0.5, font_size=12,
-        ),
-        xaxis_title="Median Employment Income ($)",
-    )
-    return _apply_layout(
-        fig,
-        "Sub-field Income Comparison — 2yr vs 5yr After Graduation",
-        height=max(400, len(fields) * 55),
-    )
-
-
+    annotations = _field_labels("You", labels, _field_matches(user_field_name, fields), max(income_5yr) * 1.15)
+
+    return _chart([
+        {
+            "type": "bar", "y": labels, "x": _f32(income_2yr), "name": "2 Years After",
+            "orientation": "h",
+            "marker": {"color": ACCENT_GREEN, "line": {"width": 0}, "cornerradius": 3},
+            "text": list(map(_MONEY, income_2yr)), "textposition": "outside",
+            "hovertemplate": "%{y}<br>2yr Income: $%{x:,.0f}<extra></extra>",
+        },
+        {
+            "type": "bar", "y": labels, "x": _f32(income_5yr), "name": "5 Years After",
+            "orientation": "h",
+            "marker": {"color": SECONDARY_COLOR, "line": {"width": 0}, "cornerradius": 3},
+            "text": list(map(_MONEY, income_5yr)), "textposition": "outside",
+            "hovertemplate": "%{y}<br>5yr Income: $%{x:,.0f}<extra></extra>",
+        },
+    ], "Sub-field Income Comparison — 2yr vs 5yr After Graduation", height=max(400, len(fields) * 55),
+        layout=_INCOME_PAIR_LAYOUT | {"annotations": annotations})
+
+
+
+@_memoize_fig
 def noc_distribution_donut(broad_distribution: list[dict]) -> go.Figure:
     """Donut chart showing NOC broad category distribution for a CIP field."""
     if not broad_distribution:
         return _empty_chart("No occupation distribution data available")
 
-    labels = [d["noc"] for d in broad_distribution]
-    values = [d["percentage"] for d in broad_distribution]
-    counts = [d.get("count") for d in broad_distribution]
-
-    # Shorten labels for the chart
+    values = []
     short_labels = []
-    for label in labels:
-        # Remove the leading digit and space (e.g., "2 Natural and applied sciences" → "Natural and applied sciences")
-        parts = label.split(" ", 1)
-        short_labels.append(parts[1] if len(parts) > 1 else label)
-
-    hover_texts = []
-    for i, label in enumerate(labels):
-        cnt = f"<br>Count: {counts[i]:,}" if counts[i] else ""
-        hover_texts.append(f"{label}<br>Proportion: {values[i]:.1f}%{cnt}")
-
-    # Extract 1-digit NOC codes (e.g. "2 Natural and applied sciences" → "2")
     digit_codes = []
-    for label in labels:
-        parts = label.split(" ", 1)
-        digit_codes.append(parts[0] if parts[0].isdigit() else label[:1])
-
-    fig = go.Figure(go.Pie(
-        labels=short_labels,
-        values=values,
-        hole=0.5,
-        marker=dict(
-            colors=SERIES_COLORS[:len(labels)],
-            line=dict(color="white", width=2),
-        ),
-        text=digit_codes,
-        textinfo="text",
-        textposition="outside",
-        textfont=dict(size=14, family="Inter, sans-serif", color="#334155"),
-        hovertext=hover_texts,
-        hoverinfo="text",
-        sort=False,
-    ))
-    fig.update_layout(
-        showlegend=False,
-    )
-    return _apply_layout(fig, "Occupation Distribution (NOC Broad Categories)", height=450)
-
-
+    hover_texts = []
+    for d in broad_distribution:
+        label = d["noc"]
+        value = d["percentage"]
+        count = d.get("count")
+        values.append(value)
+        # "2 Natural and applied sciences" → short label "Natural and applied sciences", code "2"
+        code, _, name = label.partition(" ")
+        short_labels.append(name or label)
+        digit_codes.append(code if code.isdigit() else label[:1])
+        cnt = f"<br>Count: {count:,}" if count else ""
+        hover_texts.append(f"{label}<br>Proportion: {value:.1f}%{cnt}")
+
+    # Pie traces have no cartesian axes, so the full layout is given up
+    # front instead of going through _chart.
+    return _figure([{
+        "type": "pie",
+        "labels": short_labels,
+        "values": _f32(values),
+        "hole": 0.5,
+        "marker": {
+            "colors": SERIES_COLORS[:len(values)],
+            "line": {"color": "white", "width": 2},
+        },
+        "text": digit_codes,
+        "textinfo": "text",
+        "textposition": "outside",
+        "textfont": {"size": 14, "family": "Inter, sans-serif", "color": "#334155"},
+        "hovertext": hover_texts,
+        "hoverinfo": "text",
+        "sort": False,
+    }], _BASE_LAYOUT | {
+        "title": _title("Occupation Distribution (NOC Broad Categories)"),
+        "height": 450,
+        "showlegend": False,
+    })
+
+
+# Shared by the NOC proportion bar charts
+_PROPORTION_LAYOUT = MappingProxyType({"xaxis": {"title": {"text": "Proportion (%)"}}})
+
+
+@_memoize_fig
 def noc_distribution_bar(broad_distribution: list[dict]) -> go.Figure:
     """Horizontal bar chart showing NOC category proportions."""
     if not broad_distribution:
         return _empty_chart("No occupation distribution data available")
 
-    raw_labels = [d["noc"] for d in broad_distribution]
-    labels = [l[:40] + "..." if len(l) > 40 else l for l in raw_labels]
-    values = [d["percentage"] for d in broad_distribution]
+    labels = [_truncate(d["noc"], 40) for d in broad_distribution]
+    values = np.fromiter((d["percentage"] for d in broad_distribution), dtype=np.float64, count=len(labels))
     colors = SERIES_COLORS[:len(labels)]
 
-    fig = go.Figure(go.Bar(
-        y=labels, x=values, orientation="h",
-        marker=dict(color=colors, line=dict(width=0), cornerradius=4),
-        text=[f"{v:.1f}%" for v in values], textposition="outside",
-        hovertemplate="%{y}<br>Proportion: %{x:.1f}%<extra></extra>",
-    ))
-    fig.update_layout(xaxis_title="Proportion (%)")
-    return _apply_layout(fig, "Employment Direction — Proportion by NOC Category", height=max(400, len(labels) * 40))
+    return _chart([{
+        "type": "bar", "y": labels, "x": values.astype(np.float32), "orientation": "h",
+        "marker": {"color": colors, "line": {"width": 0}, "cornerradius": 4},
+        "text": _pct_text(values), "textposition": "outside",
+        "hovertemplate": "%{y}<br>Proportion: %{x:.1f}%<extra></extra>",
+    }], "Employment Direction — Proportion by NOC Category", height=max(400, len(labels) * 40),
+        layout=_PROPORTION_LAYOUT)
 
 
+@_memoize_fig
 def noc_submajor_bar(submajor_distribution: list[dict], top_n: int = 15) -> go.Figure:
     """Horizontal bar chart showing top NOC sub-major group proportions."""
     if not submajor_distribution:
@@ -423,37 +556,28 @@ def noc_submajor_bar(submajor_distribution: list[dict], top_n: int = 15) -> go.F
     data = submajor_distribution[:top_n]
     data = list(reversed(data))  # Reverse for horizontal bar (highest at top)
 
-    raw_labels = [d["noc"] for d in data]
-    labels = [l[:50] + "..." if len(l) > 50 else l for l in raw_labels]
-    values = [d["percentage"] for d in data]
-    counts = [d.get("count") for d in data]
-
-    hover_texts = []
-    for i in range(len(raw_labels)):
-        cnt = f"<br>Count: {counts[i]:,}" if counts[i] else ""
-        hover_texts.append(f"{raw_labels[i]}<br>Proportion: {values[i]:.1f}%{cnt}")
+    labels, hover_texts = [], []
+    for d in data:
+        raw = d["noc"]
+        count = d.get("count")
+        cnt = f"<br>Count: {count:,}" if count else ""
+        labels.append(_truncate(raw))
+        hover_texts.append(f"{raw}<br>Proportion: {d['percentage']:.1f}%{cnt}")
+    values = np.fromiter((d["percentage"] for d in data), dtype=np.float64, count=len(data))
 
     # Gradient colors from low to high
-    max_val = max(values) if values else 1
-    colors = [
-        f"rgba(99, 102, 241, {0.3 + 0.7 * v / max_val})"
-        for v in values
-    ]
+    colors = _gradient_colors(0.3 + 0.7 * values / (values.max() or 1))
 
-    fig = go.Figure(go.Bar(
-        y=labels, x=values, orientation="h",
-        marker=dict(color=colors, line=dict(width=0), cornerradius=4),
-        text=[f"{v:.1f}%" for v in values], textposition="outside",
-        hovertext=hover_texts, hoverinfo="text",
-    ))
-    fig.update_layout(xaxis_title="Proportion (%)")
-    return _apply_layout(
-        fig,
-        f"Top {min(top_n, len(submajor_distribution))} Specific Occupation Groups (NOC 2-digit)",
-        height=max(450, len(data) * 40),
-    )
+    return _chart([{
+        "type": "bar", "y": labels, "x": values.astype(np.float32), "orientation": "h",
+        "marker": {"color": colors, "line": {"width": 0}, "cornerradius": 4},
+        "text": _pct_text(values), "textposition": "outside",
+        "hovertext": hover_texts, "hoverinfo": "text",
+    }], f"Top {min(top_n, len(submajor_distribution))} Specific Occupation Groups (NOC 2-digit)",
+        height=max(450, len(data) * 40), layout=_PROPORTION_LAYOUT)
 
 
+@_memoize_fig
 def noc_detail_bar(detail_distribution: list[dict], top_n: int = 15, oasis_noc_set: set | None = None) -> go.Figure:
     """Horizontal bar chart showing top specific occupations (5-digit NOC).
 
@@ -465,99 +589,109 @@ def noc_detail_bar(detail_distribution: list[dict], top_n: int = 15, oasis_noc_s
     data = detail_distribution[:top_n]
     data = list(reversed(data))  # Reverse for horizontal bar (highest at top)
 
-    raw_labels = [d["noc"] for d in data]
-    labels = [l[:55] + "..." if len(l) > 55 else l for l in raw_labels]
-    values = [d["percentage"] for d in data]
-    counts = [d.get("count") for d in data]
-
-    hover_texts = []
-    for i in range(len(raw_labels)):
-        cnt = f"<br>Count: {counts[i]:,}" if counts[i] else ""
-        hover_texts.append(f"{raw_labels[i]}<br>Proportion: {values[i]:.1f}%{cnt}")
-
-    # Check which NOCs match OaSIS interests
-    oasis_noc_set = oasis_noc_set or set()
-
-    def _is_oasis_match(noc_label: str) -> bool:
-        code = noc_label.split(" ", 1)[0]
-        return code in oasis_noc_set
-
-    # Color gradient based on value; amber for OaSIS matches
-    max_val = max(values) if values else 1
-    colors = []
-    line_widths = []
-    line_colors = []
-    display_labels = []
-    for i, v in enumerate(values):
-        if _is_oasis_match(raw_labels[i]):
-            colors.append(ACCENT_AMBER)
-            line_widths.append(2)
-            line_colors.append("#B45309")
-            display_labels.append(f"\u2605 {labels[i]}")
-        else:
-            colors.append(f"rgba(99, 102, 241, {0.25 + 0.75 * v / max_val})")
-            line_widths.append(0)
-            line_colors.append("rgba(0,0,0,0)")
-            display_labels.append(labels[i])
-
-    fig = go.Figure(go.Bar(
-        y=display_labels, x=values, orientation="h",
-        marker=dict(
-            color=colors,
-            line=dict(width=line_widths, color=line_colors),
-            cornerradius=4,
-        ),
-        text=[f"{v:.1f}%" for v in values], textposition="outside",
-        hovertext=hover_texts, hoverinfo="text",
-    ))
-    fig.update_layout(xaxis_title="Proportion (%)")
-
-    # Add legend annotation if any OaSIS matches exist
-    if any(_is_oasis_match(l) for l in raw_labels):
-        fig.add_annotation(
-            text="\u2605 = OaSIS Interest Match",
-            xref="paper", yref="paper", x=1.0, y=1.05,
-            showarrow=False,
-            font=dict(size=12, color="#B45309", family="Inter, sans-serif"),
-            xanchor="right",
-        )
-
-    return _apply_layout(
-        fig,
-        f"Top {min(top_n, len(detail_distribution))} Specific Occupations (5-digit NOC)",
-        height=max(500, len(data) * 35),
-    )
-
-
+    # Check which NOCs match OaSIS interests (code prefix extracted once per row)
+    oasis = frozenset(oasis_noc_set or ())
+    matches = [d["noc"].partition(" ")[0] in oasis for d in data]
+
+    display_labels, hover_texts = [], []
+    for d, is_match in zip(data, matches):
+        raw = d["noc"]
+        count = d.get("count")
+        cnt = f"<br>Count: {count:,}" if count else ""
+        label = _truncate(raw, 55)
+        display_labels.append(f"\u2605 {label}" if is_match else label)
+        hover_texts.append(f"{raw}<br>Proportion: {d['percentage']:.1f}%{cnt}")
+    values = np.fromiter((d["percentage"] for d in data), dtype=np.float64, count=len(data))
+    mask = np.array(matches, dtype=bool)
+    has_match = bool(mask.any())
+
+    # Color gradient based on value; amber (with an outline) for OaSIS matches
+    gradient = _gradient_colors(0.25 + 0.75 * values / (values.max() or 1))
+    colors = np.where(mask, ACCENT_AMBER, gradient).tolist()
+    line_widths = np.where(mask, 2, 0).tolist()
+    line_colors = np.where(mask, "#B45309", "rgba(0,0,0,0)").tolist()
+
+    # Legend annotation if any OaSIS matches exist
+    annotations = [{
+        "text": "\u2605 = OaSIS Interest Match",
+        "xref": "paper", "yref": "paper", "x": 1.0, "y": 1.05,
+        "showarrow": False,
+        "font": {"size": 12, "color": "#B45309", "family": "Inter, sans-serif"},
+        "xanchor": "right",
+    }] if has_match else []
+
+    return _chart([{
+        "type": "bar", "y": display_labels, "x": values.astype(np.float32), "orientation": "h",
+        "marker": {
+            "color": colors,
+            "line": {"width": line_widths, "color": line_colors},
+            "cornerradius": 4,
+        },
+        "text": _pct_text(values), "textposition": "outside",
+        "hovertext": hover_texts, "hoverinfo": "text",
+    }], f"Top {min(top_n, len(detail_distribution))} Specific Occupations (5-digit NOC)",
+        height=max(500, len(data) * 35), layout=_PROPORTION_LAYOUT | {"annotations": annotations})
+
+
+@_memoize_fig
 def cip_growth_bar(broad_comparison: list[dict], user_broad_field: str) -> go.Figure:
     """Horizontal bar chart showing income growth percentage (2yr→5yr) by field."""
     data = [d for d in broad_comparison if d.get("growth_pct") is not None]
     if not data:
         return _empty_chart("No income growth data available")
 
-    data.sort(key=lambda x: x["growth_pct"])
-    fields = [d["field"] for d in data]
-    labels = [f[:40] + "..." if len(f) > 40 else f for f in fields]
-    growth = [d["growth_pct"] for d in data]
-    colors = [
-        USER_COLOR if user_broad_field in f else ACCENT_GREEN
-        for f in fields
-    ]
-
-    fig = go.Figure(go.Bar(
-        y=labels, x=growth, orientation="h",
-        marker=dict(color=colors, line=dict(width=0), cornerradius=4),
-        text=[f"{g:+.1f}%" for g in growth], textposition="outside",
-        hovertemplate="%{y}<br>Income Growth (2yr→5yr): %{x:+.1f}%<extra></extra>",
-    ))
-    fig.update_layout(xaxis_title="Income Growth (%)")
-    return _apply_layout(
-        fig,
-        "Income Growth Rate by Field (2yr → 5yr After Graduation)",
-        height=max(400, len(fields) * 35),
+    # Ascending by growth, so the largest bar ends up at the top
+    growth_arr = np.fromiter((d["growth_pct"] for d in data), dtype=np.float64, count=len(data))
+    order = np.argsort(growth_arr, kind="stable")
+    growth_arr = growth_arr[order]
+    fields, labels = [], []
+    for i in order.tolist():
+        f = data[i]["field"]
+        fields.append(f)
+        labels.append(_truncate(f, 40))
+    colors = np.where(_field_matches(user_broad_field, fields), USER_COLOR, ACCENT_GREEN).tolist()
+
+    return _chart([{
+        "type": "bar", "y": labels, "x": growth_arr.astype(np.float32), "orientation": "h",
+        "marker": {"color": colors, "line": {"width": 0}, "cornerradius": 4},
+        "text": _pct_text(growth_arr, "%+.1f%%"), "textposition": "outside",
+        "hovertemplate": "%{y}<br>Income Growth (2yr→5yr): %{x:+.1f}%<extra></extra>",
+    }], "Income Growth Rate by Field (2yr → 5yr After Graduation)", height=max(400, len(labels) * 35),
+        layout={"xaxis": {"title": {"text": "Income Growth (%)"}}})
+
+
+# Bubble counts above which the quadrant chart renders with WebGL
+_WEBGL_MIN_POINTS = 50
+
+# Bubble colour by quadrant index: 2 * (count >= median) + (income >= median)
+_QUADRANT_COLORS = np.array([
+    ACCENT_ROSE,       # fewer people + lower income
+    HIGHLIGHT_COLOR,   # fewer people + high income
+    ACCENT_AMBER,      # many people + lower income
+    ACCENT_GREEN,      # many people + high income
+])
+
+
+# Quadrant corner labels; plain dicts (nested layout values), never mutated
+_QUADRANT_ANNOTATIONS = tuple(
+    {
+        "xref": "paper", "yref": "paper",
+        "x": qx, "y": qy, "text": qlabel, "showarrow": False,
+        "font": {"size": 11, "color": qcolor, "family": "Inter, sans-serif"},
+        "opacity": 0.6, "xanchor": xa, "yanchor": ya,
+        "xshift": -8 if xa == "left" else 8,
+        "yshift": 8 if ya == "bottom" else -8,
+    }
+    for qx, qy, qlabel, qcolor, xa, ya in (
+        (1.0, 1.0, "Many + High Pay", ACCENT_GREEN, "left", "bottom"),
+        (0.0, 1.0, "Few + High Pay", HIGHLIGHT_COLOR, "right", "bottom"),
+        (1.0, 0.0, "Many + Lower Pay", ACCENT_AMBER, "left", "top"),
+        (0.0, 0.0, "Few + Lower Pay", ACCENT_ROSE, "right", "top"),
     )
+)
 
 
+@_memoize_fig
 def noc_quadrant_bubble(
     quadrant_data: list[dict],
     oasis_noc_set: set | None = None,
@@ -578,178 +712,148 @@ def noc_quadrant_bubble(
     if not valid:
         return _empty_chart("Insufficient data for quadrant chart")
 
-    oasis_noc_set = oasis_noc_set or set()
-
-    def _is_oasis(noc_name: str) -> bool:
-        return noc_name.split(" ", 1)[0] in oasis_noc_set
+    oasis = frozenset(oasis_noc_set or ())
 
-    counts = [d["count"] for d in valid]
-    incomes = [d["income"] for d in valid]
-    percentages = [d["percentage"] for d in valid]
+    n = len(valid)
     names = [d["noc"] for d in valid]
+    cnt_arr = np.fromiter((d["count"] for d in valid), dtype=np.int64, count=n)
+    inc_arr = np.fromiter((d["income"] for d in valid), dtype=np.float64, count=n)
+    pct_arr = np.asarray([d["percentage"] for d in valid], dtype=np.float64)
 
-    # Compute medians for quadrant lines
-    sorted_cnt = sorted(counts)
-    sorted_inc = sorted(incomes)
-    median_cnt = sorted_cnt[len(sorted_cnt) // 2]
-    median_inc = sorted_inc[len(sorted_inc) // 2]
+    # Compute medians for quadrant lines (upper median, via quickselect)
+    k = n // 2
+    median_cnt = int(np.partition(cnt_arr, k)[k])
+    median_inc = float(np.partition(inc_arr, k)[k])
 
     # Scale bubble sizes: map percentage to a reasonable marker range (10-55)
-    min_pct = min(percentages)
-    max_pct = max(percentages)
-    pct_range = max_pct - min_pct if max_pct != min_pct else 1
-    sizes = [
-        10 + 45 * (p - min_pct) / pct_range
-        for p in percentages
-    ]
-
-    # Color by quadrant
-    def _quadrant_color(cnt, inc):
-        if cnt >= median_cnt and inc >= median_inc:
-            return ACCENT_GREEN       # Top-right: many people + high income
-        elif cnt < median_cnt and inc >= median_inc:
-            return HIGHLIGHT_COLOR     # Top-left: fewer people + high income
-        elif cnt >= median_cnt and inc < median_inc:
-            return ACCENT_AMBER        # Bottom-right: many people + lower income
-        else:
-            return ACCENT_ROSE         # Bottom-left: fewer people + lower income
+    pct_range = np.ptp(pct_arr) or 1
+    sizes = 10 + 45 * (pct_arr - pct_arr.min()) / pct_range
 
     _hl_label = highlight_label or "OaSIS Interest Match"
     _use_star = highlight_label is None  # stars only for OaSIS mode
     _hl_color = "#0EA5E9" if highlight_label else USER_COLOR  # sky-blue vs red
     _hl_border = "#0369A1" if highlight_label else "#991B1B"
 
-    def _make_hover(i):
-        growth_str = f"{valid[i]['income_growth']:+.0f}%" if valid[i].get("income_growth") is not None else "N/A"
-        young_str = f"${valid[i]['income_young']:,.0f}" if valid[i].get("income_young") else "N/A"
-        tag = f"<br><b>{'\u2605 ' if _use_star else ''}{_hl_label}</b>" if _is_oasis(names[i]) else ""
-        return (
-            f"<b>{names[i]}</b><br>"
-            f"Employment count: {counts[i]:,}<br>"
-            f"Employment share: {percentages[i]:.1f}%<br>"
-            f"Income (25-64): ${incomes[i]:,.0f}<br>"
+    # Determine bubble colors: highlighted matches → special color, others → quadrant color
+    oasis_mask = np.fromiter((name.partition(" ")[0] in oasis for name in names), dtype=bool, count=n)
+    quadrant = 2 * (cnt_arr >= median_cnt) + (inc_arr >= median_inc)
+    bubble_colors = np.where(oasis_mask, _hl_color, _QUADRANT_COLORS[quadrant]).tolist()
+    bubble_line_colors = np.where(oasis_mask, _hl_border, "white").tolist()
+    bubble_line_widths = np.where(oasis_mask, 2.5, 1.5).tolist()
+
+    # Hover text in one pass over the columns
+    star = "\u2605 " if _use_star else ""
+    hl_tag = f"<br><b>{star}{_hl_label}</b>"
+    hover_texts = []
+    for d, name, cnt, pct, inc, is_hl in zip(
+        valid, names, cnt_arr.tolist(), pct_arr.tolist(), inc_arr.tolist(), oasis_mask.tolist()
+    ):
+        growth = d.get("income_growth")
+        young = d.get("income_young")
+        growth_str = f"{growth:+.0f}%" if growth is not None else "N/A"
+        young_str = f"${young:,.0f}" if young else "N/A"
+        hover_texts.append(
+            f"<b>{name}</b><br>"
+            f"Employment count: {cnt:,}<br>"
+            f"Employment share: {pct:.1f}%<br>"
+            f"Income (25-64): ${inc:,.0f}<br>"
             f"Income (15-24): {young_str}<br>"
             f"Income growth: {growth_str}"
-            f"{tag}"
+            f"{hl_tag if is_hl else ''}"
         )
 
-    fig = go.Figure()
-
-    # Determine bubble colors: highlighted matches → special color, others → quadrant color
-    bubble_colors = []
-    bubble_line_colors = []
-    bubble_line_widths = []
-    for i in range(len(valid)):
-        if _is_oasis(names[i]):
-            bubble_colors.append(_hl_color)
-            bubble_line_colors.append(_hl_border)
-            bubble_line_widths.append(2.5)
-        else:
-            bubble_colors.append(_quadrant_color(counts[i], incomes[i]))
-            bubble_line_colors.append("white")
-            bubble_line_widths.append(1.5)
-
-    # All points as regular bubbles
-    fig.add_trace(go.Scatter(
-        x=counts,
-        y=incomes,
-        mode="markers",
-        marker=dict(
-            size=sizes,
-            color=bubble_colors,
-            opacity=0.75,
-            line=dict(width=bubble_line_widths, color=bubble_line_colors),
-        ),
-        hovertext=[_make_hover(i) for i in range(len(valid))],
-        hoverinfo="text",
-        showlegend=False,
-    ))
-
-    # Overlay stars inside matched bubbles (OaSIS mode only)
-    oasis_idx = [i for i in range(len(valid)) if _is_oasis(names[i])]
-    if _use_star:
-        for i in oasis_idx:
-            fig.add_annotation(
-                x=counts[i], y=incomes[i],
-                text="\u2605",
-                showarrow=False,
-                font=dict(size=max(10, int(sizes[i] * 0.45)), color="white"),
-                xanchor="center", yanchor="middle",
-            )
-
-    # Quadrant divider lines
-    fig.add_hline(
-        y=median_inc, line_dash="dash", line_color="rgba(100,116,139,0.4)",
-        line_width=1.5,
-        annotation_text=f"Median income: ${median_inc:,.0f}",
-        annotation_position="top left",
-        annotation_font=dict(size=10, color="#64748B"),
-    )
-    fig.add_vline(
-        x=median_cnt, line_dash="dash", line_color="rgba(100,116,139,0.4)",
-        line_width=1.5,
-        annotation_text=f"Median count: {median_cnt:,}",
-        annotation_position="top right",
-        annotation_font=dict(size=10, color="#64748B"),
-    )
-
-    # Quadrant labels — inset near the median crosshair
-    quadrant_labels = [
-        (1.0, 1.0, "Many + High Pay", ACCENT_GREEN, "left", "bottom"),
-        (0.0, 1.0, "Few + High Pay", HIGHLIGHT_COLOR, "right", "bottom"),
-        (1.0, 0.0, "Many + Lower Pay", ACCENT_AMBER, "left", "top"),
-        (0.0, 0.0, "Few + Lower Pay", ACCENT_ROSE, "right", "top"),
+    # All points as regular bubbles; WebGL once SVG markers get expensive
+    trace_type = "scattergl" if n > _WEBGL_MIN_POINTS else "scatter"
+    traces = [{
+        "type": trace_type,
+        "x": cnt_arr.astype(np.int32),
+        "y": inc_arr.astype(np.float32),
+        "mode": "markers",
+        "marker": {
+            "size": sizes.astype(np.float32),
+            "color": bubble_colors,
+            "opacity": 0.75,
+            "line": {"width": bubble_line_widths, "color": bubble_line_colors},
+        },
+        "hovertext": hover_texts,
+        "hoverinfo": "text",
+        "showlegend": False,
+    }]
+
+    # Overlay stars inside matched bubbles (OaSIS mode only), as one text trace
+    oasis_idx = np.flatnonzero(oasis_mask)
+    if _use_star and oasis_idx.size:
+        traces.append({
+            "type": trace_type,
+            "x": cnt_arr[oasis_idx].astype(np.int32),
+            "y": inc_arr[oasis_idx].astype(np.float32),
+            "mode": "text",
+            "text": ["\u2605"] * oasis_idx.size,
+            "textposition": "middle center",
+            "textfont": {"size": np.maximum(10, (sizes[oasis_idx] * 0.45).astype(np.int32)), "color": "white"},
+            "hoverinfo": "skip",
+            "showlegend": False,
+        })
+
+    # Quadrant divider lines at the medians, with their value labels
+    divider = {"dash": "dash", "color": "rgba(100,116,139,0.4)", "width": 1.5}
+    divider_font = {"size": 10, "color": "#64748B"}
+    shapes = [
+        {"type": "line", "xref": "paper", "x0": 0, "x1": 1, "y0": median_inc, "y1": median_inc, "line": divider},
+        {"type": "line", "yref": "paper", "y0": 0, "y1": 1, "x0": median_cnt, "x1": median_cnt, "line": divider},
+    ]
+    annotations = [
+        {"text": f"Median income: ${median_inc:,.0f}", "xref": "paper", "x": 0, "y": median_inc,
+         "xanchor": "left", "yanchor": "bottom", "showarrow": False, "font": divider_font},
+        {"text": f"Median count: {median_cnt:,}", "yref": "paper", "y": 1, "x": median_cnt,
+         "xanchor": "left", "yanchor": "top", "showarrow": False, "font": divider_font},
     ]
-    for qx, qy, qlabel, qcolor, xa, ya in quadrant_labels:
-        fig.add_annotation(
-            xref="paper", yref="paper",
-            x=qx, y=qy, text=qlabel, showarrow=False,
-            font=dict(size=11, color=qcolor, family="Inter, sans-serif"),
-            opacity=0.6, xanchor=xa, yanchor=ya,
-            xshift=-8 if xa == "left" else 8,
-            yshift=8 if ya == "bottom" else -8,
-        )
 
-    fig.update_layout(
-        xaxis_title="Employment Count (number of people)",
-        yaxis_title="Median Income — Age 25-64 ($)",
-        showlegend=False,
-    )
+    # Quadrant labels — inset near the median crosshair
+    annotations.extend(_QUADRANT_ANNOTATIONS)
 
     # Add legend annotation if highlighted matches exist
-    if oasis_idx:
+    if oasis_idx.size:
         legend_prefix = "<b>\u2605</b> = " if _use_star else "\u25CF = "
-        fig.add_annotation(
-            text=f"{legend_prefix}{_hl_label}",
-            xref="paper", yref="paper", x=1.0, y=1.05,
-            showarrow=False,
-            font=dict(size=12, color=_hl_color, family="Inter, sans-serif"),
-            xanchor="right",
-        )
-
-    return _apply_layout(
-        fig,
-        "Occupation Quadrant — Employment Count vs Income (bubble = share %)",
-        height=600,
-    )
-
-
+        annotations.append({
+            "text": f"{legend_prefix}{_hl_label}",
+            "xref": "paper", "yref": "paper", "x": 1.0, "y": 1.05,
+            "showarrow": False,
+            "font": {"size": 12, "color": _hl_color, "family": "Inter, sans-serif"},
+            "xanchor": "right",
+        })
+
+    return _chart(traces, "Occupation Quadrant — Employment Count vs Income (bubble = share %)", height=600, layout={
+        "xaxis": {"title": {"text": "Employment Count (number of people)"}},
+        "yaxis": {"title": {"text": "Median Income — Age 25-64 ($)"}},
+        "showlegend": False,
+        "shapes": shapes,
+        "annotations": annotations,
+    })
+
+
+# radar_overview always has the same five axes, so everything except the
+# r values is built once at import
+_RADAR_THETA = ["Employment Rate", "Income Ranking", "Low Unemployment", "Job Demand", "Income Growth", "Employment Rate"]
+_RADAR_TRACE = MappingProxyType({
+    "type": "scatterpolar", "theta": _RADAR_THETA, "fill": "toself",
+    "fillcolor": "rgba(239, 68, 68, 0.12)",
+    "line": {"color": USER_COLOR, "width": 2.5},
+    "marker": {"size": 7, "color": USER_COLOR, "line": {"width": 2, "color": "white"}},
+    "hovertemplate": "%{theta}: %{r:.0f}/100<extra></extra>",
+})
+_RADAR_LAYOUT = MappingProxyType(_BASE_LAYOUT | {
+    "title": _title("Overall Field Assessment"),
+    "height": 450,
+    "polar": {
+        "radialaxis": {"visible": True, "range": [0, 100], "gridcolor": "rgba(148,163,184,0.2)"},
+        "angularaxis": {"gridcolor": "rgba(148,163,184,0.2)"},
+    },
+})
+
+
+@_memoize_fig
 def radar_overview(employment_rate, income_percentile, low_unemployment, vacancy_score, income_growth) -> go.Figure:
     """5-axis radar chart for overall field assessment (all values 0-100)."""
-    categories = ["Employment Rate", "Income Ranking", "Low Unemployment", "Job Demand", "Income Growth"]
-    values = [employment_rate, income_percentile, low_unemployment, vacancy_score, income_growth]
-    values_closed = values + [values[0]]
-    categories_closed = categories + [categories[0]]
-
-    fig = go.Figure(go.Scatterpolar(
-        r=values_closed, theta=categories_closed, fill="toself",
-        fillcolor="rgba(239, 68, 68, 0.12)",
-        line=dict(color=USER_COLOR, width=2.5),
-        marker=dict(size=7, color=USER_COLOR, line=dict(width=2, color="white")),
-        hovertemplate="%{theta}: %{r:.0f}/100<extra></extra>",
-    ))
-    fig.update_layout(polar=dict(
-        radialaxis=dict(visible=True, range=[0, 100], gridcolor="rgba(148,163,184,0.2)"),
-        angularaxis=dict(gridcolor="rgba(148,163,184,0.2)"),
-    ))
-    return _apply_layout(fig, "Overall Field Assessment", height=450)
+    r = [employment_rate, income_percentile, low_unemployment, vacancy_score, income_growth, employment_rate]
+    return _figure([_RADAR_TRACE | {"r": r}], dict(_RADAR_LAYOUT))
@@ -1,7 +1,8 @@
 """Comprehensive CIP (Classification of Instructional Programs) code tables.
 
 Source: Statistics Canada CIP Canada 2021 Version 1.0
-File:   cip-2021-structure.csv (downloaded from statcan.gc.ca)
+File:   cip-2021-structure.csv (downloaded from statcan.gc.ca), precompiled
+        into cip_tables.py by build_cip_tables.py
 
 Provides three levels:
   - Level 1 (series):    2-digit  "XX"       — 50 entries
@@ -9,77 +10,61 @@ Provides three levels:
   - Level 3 (class):     6-digit  "XX.XXXX"  — 2119 entries
 """
 
-import csv
-import os
-
-_CSV_PATH = os.path.join(os.path.dirname(__file__), "cip-2021-structure.csv")
-
-# 2-digit CIP series → broad field name used in config.FIELD_OPTIONS
-CIP_TO_BROAD: dict[str, str] = {
-    "01": "Agriculture, natural resources and conservation",
-    "03": "Agriculture, natural resources and conservation",
-    "04": "Architecture, engineering, and related trades",
-    "05": "Social and behavioural sciences and law",
-    "09": "Social and behavioural sciences and law",
-    "10": "Visual and performing arts, and communications technologies",
-    "11": "Mathematics, computer and information sciences",
-    "12": "Personal, protective and transportation services",
-    "13": "Education",
-    "14": "Architecture, engineering, and related trades",
-    "15": "Architecture, engineering, and related trades",
-    "16": "Humanities",
-    "19": "Social and behavioural sciences and law",
-    "22": "Social and behavioural sciences and law",
-    "23": "Humanities",
-    "24": "Humanities",
-    "25": "Mathematics, computer and information sciences",
-    "26": "Physical and life sciences and technologies",
-    "27": "Mathematics, computer and information sciences",
-    "29": "Architecture, engineering, and related trades",
-    "30": "Physical and life sciences and technologies",
-    "31": "Health and related fields",
-    "38": "Humanities",
-    "39": "Humanities",
-    "40": "Physical and life sciences and technologies",
-    "41": "Physical and life sciences and technologies",
-    "42": "Social and behavioural sciences and law",
-    "43": "Personal, protective and transportation services",
-    "44": "Business, management and public administration",
-    "45": "Social and behavioural sciences and law",
-    "46": "Architecture, engineering, and related trades",
-    "47": "Architecture, engineering, and related trades",
-    "48": "Architecture, engineering, and related trades",
-    "49": "Personal, protective and transportation services",
-    "50": "Visual and performing arts, and communications technologies",
-    "51": "Health and related fields",
-    "52": "Business, management and public administration",
-    "54": "Humanities",
-    "55": "Humanities",
-    "60": "Health and related fields",
-    "61": "Health and related fields",
+import sys
+from types import MappingProxyType
+
+import cip_tables
+
+
+def _interned(table: dict[str, str]) -> MappingProxyType:
+    """Read-only copy of a code table, every key and title passed through sys.intern."""
+    return MappingProxyType({sys.intern(k): sys.intern(v) for k, v in table.items()})
+
+
+# Broad field names used in config.FIELD_OPTIONS, each stored once
+_BROAD: tuple[str, ...] = tuple(map(sys.intern, (
+    "Agriculture, natural resources and conservation",               # 0
+    "Architecture, engineering, and related trades",                 # 1
+    "Business, management and public administration",                # 2
+    "Education",                                                     # 3
+    "Health and related fields",                                     # 4
+    "Humanities",                                                    # 5
+    "Mathematics, computer and information sciences",                # 6
+    "Personal, protective and transportation services",              # 7
+    "Physical and life sciences and technologies",                   # 8
+    "Social and behavioural sciences and law",                       # 9
+    "Visual and performing arts, and communications technologies",   # 10
+)))
+
+# 2-digit CIP series → index into _BROAD
+_CIP_TO_BROAD_IDX: dict[str, int] = {
+    "01": 0, "03": 0, "04": 1, "05": 9, "09": 9, "10": 10, "11": 6, "12": 7,
+    "13": 3, "14": 1, "15": 1, "16": 5, "19": 9, "22": 9, "23": 5, "24": 5,
+    "25": 6, "26": 8, "27": 6, "29": 1, "30": 8, "31": 4, "38": 5, "39": 5,
+    "40": 8, "41": 8, "42": 9, "43": 7, "44": 2, "45": 9, "46": 1, "47": 1,
+    "48": 1, "49": 7, "50": 10, "51": 4, "52": 2, "54": 5, "55": 5, "60": 4,
+    "61": 4,
 }
 
+# 2-digit CIP series → broad field name (read-only view over the two tables above)
+CIP_TO_BROAD = MappingProxyType({code: _BROAD[i] for code, i in _CIP_TO_BROAD_IDX.items()})
+
 
-def _load_csv() -> tuple[dict[str, str], dict[str, str], dict[str, str]]:
-    """Parse the official CIP 2021 structure CSV into three dicts."""
-    series: dict[str, str] = {}
-    subseries: dict[str, str] = {}
-    classes: dict[str, str] = {}
+def cip_to_broad(series_code: str) -> str | None:
+    """Broad field name for a 2-digit CIP series, or None if it has none."""
+    i = _CIP_TO_BROAD_IDX.get(series_code)
+    return None if i is None else _BROAD[i]
 
-    with open(_CSV_PATH, encoding="utf-8-sig") as f:
-        for row in csv.DictReader(f):
-            code = row["Code"].strip().rstrip(".")
-            title = row["Class title"].strip()
-            level = row["Level"].strip()
-            if level == "1":
-                series[code] = title
-            elif level == "2":
-                subseries[code] = title
-            elif level == "3":
-                classes[code] = title
 
-    return series, subseries, classes
+# ── Code tables ────────────────────────────────────────────────
 
+# Interned, so lookups with interned keys short-circuit on identity and
+# titles repeated across levels and in CIP_TO_BROAD share one object
+CIP_SERIES = _interned(cip_tables.CIP_SERIES)
+CIP_SUBSERIES = _interned(cip_tables.CIP_SUBSERIES)
+CIP_CODES = _interned(cip_tables.CIP_CODES)
 
-# Loaded once at import time
-CIP_SERIES, CIP_SUBSERIES, CIP_CODES = _load_csv()
+# Code-only frozensets for pure membership tests
+CIP_SERIES_SET = frozenset(CIP_SERIES)
+CIP_SUBSERIES_SET = frozenset(CIP_SUBSERIES)
+CIP_CODES_SET = frozenset(CIP_CODES)
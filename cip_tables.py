@@ -0,0 +1,2636 @@
+"""CIP 2021 code tables (series, subseries, class).
+
+Generated from cip-2021-structure.csv by build_cip_tables.py — do not edit.
+"""
+
+CIP_SERIES = {
+    "01": "Agricultural and veterinary sciences/services/operations and related fields",
+    "03": "Natural resources and conservation",
+    "04": "Architecture and related services",
+    "05": "Area, ethnic, cultural, gender, and group studies",
+    "09": "Communication, journalism and related programs",
+    "10": "Communications technologies/technicians and support services",
+    "11": "Computer and information sciences and support services",
+    "12": "Culinary, entertainment, and personal services",
+    "13": "Education",
+    "14": "Engineering",
+    "15": "Engineering/engineering-related technologies/technicians",
+    "16": "Indigenous and foreign languages, literatures, and linguistics",
+    "19": "Family and consumer sciences/human sciences",
+    "21": "Pre-technology education/pre-industrial arts programs",
+    "22": "Legal professions and studies",
+    "23": "English language and literature/letters",
+    "24": "Liberal arts and sciences, general studies and humanities",
+    "25": "Library science",
+    "26": "Biological and biomedical sciences",
+    "27": "Mathematics and statistics",
+    "28": "Military science, leadership and operational art",
+    "29": "Military technologies and applied sciences",
+    "30": "Multidisciplinary/interdisciplinary studies",
+    "31": "Parks, recreation, leisure, fitness, and kinesiology",
+    "32": "Basic skills and general exam preparation (not for credit)",
+    "33": "Citizenship activities (not for credit)",
+    "34": "Health-related knowledge and skills (not for credit)",
+    "35": "Interpersonal and social skills (not for credit)",
+    "36": "Leisure and recreational activities and non-commercial vehicle operation (not for credit)",
+    "37": "Personal awareness and self-improvement (not for credit)",
+    "38": "Philosophy and religious studies",
+    "39": "Theology and religious vocations",
+    "40": "Physical sciences",
+    "41": "Science technologies/technicians",
+    "42": "Psychology",
+    "43": "Security and protective services",
+    "44": "Public administration and social service professions",
+    "45": "Social sciences",
+    "46": "Construction trades",
+    "47": "Mechanic and repair technologies/technicians",
+    "48": "Precision production",
+    "49": "Transportation and materials moving",
+    "50": "Visual and performing arts",
+    "51": "Health professions and related programs",
+    "52": "Business, management, marketing and related support services",
+    "53": "High school/secondary diploma and certificate programs",
+    "54": "History",
+    "55": "French language and literature/letters",
+    "60": "Health professions residency/fellowship programs",
+    "61": "Medical residency/fellowship programs",
+}
+
+CIP_SUBSERIES = {
+    "01.00": "Agriculture, general",
+    "01.01": "Agricultural business and management",
+    "01.02": "Agricultural mechanization",
+    "01.03": "Agricultural production operations",
+    "01.04": "Agricultural and food products processing",
+    "01.05": "Agricultural and domestic animal services",
+    "01.06": "Applied horticulture/horticultural business services",
+    "01.07": "International agriculture",
+    "01.08": "Agricultural public services",
+    "01.09": "Animal sciences",
+    "01.10": "Food science and technology",
+    "01.11": "Plant sciences",
+    "01.12": "Soil sciences",
+    "01.13": "Agriculture/veterinary preparatory programs",
+    "01.80": "Veterinary medicine (DVM)",
+    "01.81": "Veterinary biomedical and clinical sciences (Cert., MS, MSc, PhD)",
+    "01.82": "Veterinary administrative services",
+    "01.83": "Veterinary/animal health technologies/technicians",
+    "01.99": "Agricultural and veterinary sciences/services/operations and related fields, other",
+    "03.01": "Natural resources conservation and research",
+    "03.02": "Environmental/natural resources management and policy",
+    "03.03": "Fishing and fisheries sciences and management",
+    "03.05": "Forestry",
+    "03.06": "Wildlife and wildlands science and management",
+    "03.99": "Natural resources and conservation, other",
+    "04.02": "Architecture",
+    "04.03": "City/urban, community and regional planning",
+    "04.04": "Environmental design/architecture",
+    "04.05": "Interior architecture",
+    "04.06": "Landscape architecture (BS, BSc, BSLA, BLA, MSLA, MLA, PhD)",
+    "04.08": "Architectural history, criticism, and conservation",
+    "04.09": "Architectural sciences and technology",
+    "04.10": "Real estate development",
+    "04.99": "Architecture and related services, other",
+    "05.01": "Area studies",
+    "05.02": "Ethnic, cultural minority, gender, and group studies",
+    "05.99": "Area, ethnic, cultural, gender, and group studies, other",
+    "09.01": "Communication and media studies",
+    "09.04": "Journalism",
+    "09.07": "Radio, television and digital communication",
+    "09.09": "Public relations, advertising and applied communication",
+    "09.10": "Publishing",
+    "09.99": "Communication, journalism and related programs, other",
+    "10.01": "Communications technology/technician",
+    "10.02": "Audiovisual communications technologies/technicians",
+    "10.03": "Graphic communications",
+    "10.99": "Communications technologies/technicians and support services, other",
+    "11.01": "Computer and information sciences and support services, general",
+    "11.02": "Computer programming",
+    "11.03": "Data processing and data processing technology/technician",
+    "11.04": "Information science/studies",
+    "11.05": "Computer systems analysis/analyst",
+    "11.06": "Data entry/microcomputer applications",
+    "11.07": "Computer science",
+    "11.08": "Computer software and media applications",
+    "11.09": "Computer systems networking and telecommunications",
+    "11.10": "Computer/information technology administration and management",
+    "11.99": "Computer and information sciences and support services, other",
+    "12.03": "Funeral service and mortuary science",
+    "12.04": "Cosmetology and related personal grooming services",
+    "12.05": "Culinary arts and related services",
+    "12.06": "Casino operations and services",
+    "12.99": "Culinary, entertainment, and personal services, other",
+    "13.01": "Education, general",
+    "13.02": "Bilingual, multilingual and multicultural education",
+    "13.03": "Curriculum and instruction",
+    "13.04": "Educational administration and supervision",
+    "13.05": "Educational/instructional media design",
+    "13.06": "Educational assessment, evaluation and research",
+    "13.07": "International and comparative education",
+    "13.09": "Social and philosophical foundations of education",
+    "13.10": "Special education and teaching",
+    "13.11": "Student counselling and personnel services",
+    "13.12": "Teacher education and professional development, specific levels and methods",
+    "13.13": "Teacher education and professional development, specific subject areas",
+    "13.14": "Teaching English or French as a second or foreign language",
+    "13.15": "Teaching assistants/aides",
+    "13.99": "Education, other",
+    "14.01": "General engineering",
+    "14.02": "Aerospace, aeronautical and astronautical/space engineering",
+    "14.03": "Agricultural engineering",
+    "14.04": "Architectural engineering",
+    "14.05": "Biomedical/medical engineering",
+    "14.06": "Ceramic sciences and engineering",
+    "14.07": "Chemical engineering",
+    "14.08": "Civil engineering",
+    "14.09": "Computer engineering",
+    "14.10": "Electrical, electronics and communications engineering",
+    "14.11": "Engineering mechanics",
+    "14.12": "Engineering physics/applied physics",
+    "14.13": "Engineering science",
+    "14.14": "Environmental/environmental health engineering",
+    "14.18": "Materials engineering",
+    "14.19": "Mechanical engineering",
+    "14.20": "Metallurgical engineering",
+    "14.21": "Mining and mineral engineering",
+    "14.22": "Naval architecture and marine engineering",
+    "14.23": "Nuclear engineering",
+    "14.24": "Ocean engineering",
+    "14.25": "Petroleum engineering",
+    "14.27": "Systems engineering",
+    "14.28": "Textile sciences and engineering",
+    "14.32": "Polymer/plastics engineering",
+    "14.33": "Construction engineering",
+    "14.34": "Forest engineering",
+    "14.35": "Industrial engineering",
+    "14.36": "Manufacturing engineering",
+    "14.37": "Operations research",
+    "14.38": "Surveying engineering",
+    "14.39": "Geological/geophysical engineering",
+    "14.40": "Paper science and engineering",
+    "14.41": "Electromechanical engineering",
+    "14.42": "Mechatronics, robotics, and automation engineering",
+    "14.43": "Biochemical engineering",
+    "14.44": "Engineering chemistry",
+    "14.45": "Biological/biosystems engineering",
+    "14.47": "Electrical and computer engineering",
+    "14.48": "Energy systems engineering",
+    "14.99": "Engineering, other",
+    "15.00": "General engineering technologies/technicians",
+    "15.01": "Architectural engineering technology/technician",
+    "15.02": "Civil engineering technology/technician",
+    "15.03": "Electrical/electronic engineering technologies/technicians",
+    "15.04": "Electromechanical technologies/technicians",
+    "15.05": "Environmental control technologies/technicians",
+    "15.06": "Industrial production technologies/technicians",
+    "15.07": "Quality control and safety technologies/technicians",
+    "15.08": "Mechanical engineering related technologies/technicians",
+    "15.09": "Mining and petroleum technologies/technicians",
+    "15.10": "Construction engineering technology/technician",
+    "15.11": "Engineering-related technologies/technicians",
+    "15.12": "Computer engineering technologies/technicians",
+    "15.13": "Drafting/design engineering technologies/technicians",
+    "15.14": "Nuclear engineering technology/technician",
+    "15.15": "Engineering-related fields",
+    "15.16": "Nanotechnology",
+    "15.17": "Energy systems technologies/technicians",
+    "15.99": "Engineering/engineering-related technologies/technicians, other",
+    "16.01": "Linguistic, comparative and related language studies and services",
+    "16.02": "African languages, literatures and linguistics",
+    "16.03": "East Asian languages, literatures and linguistics",
+    "16.04": "Slavic, Baltic and Albanian languages, literatures and linguistics",
+    "16.05": "Germanic languages, literatures and linguistics",
+    "16.06": "Modern Greek language and literature",
+    "16.07": "South Asian languages, literatures and linguistics",
+    "16.08": "Iranian languages, literatures and linguistics",
+    "16.09": "Romance languages, literatures and linguistics",
+    "16.10": "Indigenous languages, literatures, and linguistics of the Americas",
+    "16.11": "Middle/Near Eastern and Semitic languages, literatures and linguistics",
+    "16.12": "Classics and classical languages, literatures and linguistics",
+    "16.13": "Celtic languages, literatures and linguistics",
+    "16.14": "Southeast Asian and Australasian/Pacific languages, literatures and linguistics",
+    "16.15": "Turkic, Uralic-Altaic, Caucasian and Central Asian languages, literatures and linguistics",
+    "16.16": "Sign language",
+    "16.17": "Second language learning",
+    "16.18": "Armenian languages, literatures, and linguistics",
+    "16.99": "Indigenous and foreign languages, literatures and linguistics, other",
+    "19.01": "Family and consumer sciences/human sciences, general",
+    "19.02": "Family and consumer sciences/human sciences business services",
+    "19.04": "Family and consumer economics and related services",
+    "19.05": "Foods, nutrition and related services",
+    "19.06": "Housing and human environments",
+    "19.07": "Human development, family studies and related services",
+    "19.09": "Apparel and textiles",
+    "19.10": "Work and family studies",
+    "19.99": "Family and consumer sciences/human sciences, other",
+    "21.01": "Pre-technology education/pre-industrial arts programs",
+    "22.00": "Non-professional legal studies",
+    "22.01": "Law (LLB, JD, BCL)",
+    "22.02": "Legal research and advanced professional studies (post-LLB/JD)",
+    "22.03": "Legal support services",
+    "22.99": "Legal professions and studies, other",
+    "23.01": "English language and literature, general",
+    "23.13": "English rhetoric and composition/writing studies",
+    "23.14": "English literature",
+    "23.99": "English language and literature/letters, other",
+    "24.01": "Liberal arts and sciences, general studies and humanities",
+    "25.01": "Library science and administration",
+    "25.03": "Library and archives assisting",
+    "25.99": "Library science, other",
+    "26.01": "Biology, general",
+    "26.02": "Biochemistry/biophysics and molecular biology",
+    "26.03": "Botany/plant biology",
+    "26.04": "Cell/cellular biology and anatomical sciences",
+    "26.05": "Microbiological sciences and immunology",
+    "26.07": "Zoology/animal biology",
+    "26.08": "Genetics",
+    "26.09": "Physiology, pathology and related sciences",
+    "26.10": "Pharmacology and toxicology",
+    "26.11": "Biomathematics, bioinformatics, and computational biology",
+    "26.12": "Biotechnology",
+    "26.13": "Ecology, evolution, systematics and population biology",
+    "26.14": "Molecular medicine",
+    "26.15": "Neurobiology and neurosciences",
+    "26.99": "Biological and biomedical sciences, other",
+    "27.01": "Mathematics",
+    "27.03": "Applied mathematics",
+    "27.05": "Statistics",
+    "27.06": "Applied statistics",
+    "27.99": "Mathematics and statistics, other",
+    "28.08": "Military science, leadership and operational art",
+    "29.05": "Military technologies and applied sciences",
+    "30.00": "Inclusive postsecondary education",
+    "30.01": "Biological and physical sciences",
+    "30.05": "Peace studies and conflict resolution",
+    "30.06": "Systems science and theory",
+    "30.08": "Mathematics and computer science",
+    "30.10": "Biopsychology",
+    "30.11": "Gerontology",
+    "30.12": "Historic preservation and conservation",
+    "30.13": "Medieval and renaissance studies",
+    "30.14": "Museology/museum studies",
+    "30.15": "Science, technology and society",
+    "30.16": "Accounting and computer science",
+    "30.17": "Behavioural sciences",
+    "30.18": "Natural sciences",
+    "30.19": "Nutrition sciences",
+    "30.20": "International/globalization studies",
+    "30.21": "Holocaust and related studies",
+    "30.22": "Classical and ancient studies",
+    "30.23": "Intercultural/multicultural and diversity studies",
+    "30.25": "Cognitive science",
+    "30.26": "Cultural studies/critical theory and analysis",
+    "30.27": "Human biology",
+    "30.28": "Dispute resolution",
+    "30.29": "Maritime studies",
+    "30.30": "Computational science",
+    "30.31": "Human computer interaction",
+    "30.32": "Marine sciences",
+    "30.33": "Sustainability studies",
+    "30.34": "Anthrozoology",
+    "30.35": "Climate science",
+    "30.36": "Cultural studies and comparative literature",
+    "30.37": "Design for human health",
+    "30.38": "Earth systems science",
+    "30.39": "Economics and computer science",
+    "30.40": "Economics and foreign language/literature",
+    "30.41": "Environmental geosciences",
+    "30.42": "Geoarchaeology",
+    "30.43": "Geobiology",
+    "30.44": "Geography and environmental studies",
+    "30.45": "History and language/literature",
+    "30.46": "History and political science",
+    "30.47": "Linguistics and anthropology",
+    "30.48": "Linguistics and computer science",
+    "30.49": "Mathematical economics",
+    "30.50": "Mathematics and atmospheric/oceanic science",
+    "30.51": "Integrated philosophy, politics, and economics",
+    "30.52": "Digital humanities and textual studies",
+    "30.53": "Thanatology",
+    "30.70": "Data science",
+    "30.71": "Data analytics",
+    "30.99": "Multidisciplinary/interdisciplinary studies, other",
+    "31.01": "Parks, recreation, and leisure studies",
+    "31.03": "Parks, recreation, and leisure facilities management",
+    "31.05": "Sports, kinesiology, and physical education/physical fitness",
+    "31.06": "Outdoor education",
+    "31.99": "Parks, recreation, leisure, fitness, and kinesiology, other",
+    "32.01": "Basic skills (not for credit)",
+    "32.02": "Exam preparation and test-taking skills (not for credit)",
+    "32.99": "Basic skills and general exam preparation, other (not for credit)",
+    "33.01": "Citizenship activities (not for credit)",
+    "34.01": "Health-related knowledge and skills (not for credit)",
+    "35.01": "Interpersonal and social skills (not for credit)",
+    "36.01": "Leisure and recreational activities (not for credit)",
+    "36.02": "Non-commercial vehicle operation (not for credit)",
+    "36.99": "Leisure and recreational activities and non-commercial vehicle operation, other (not for credit)",
+    "37.01": "Personal awareness and self-improvement (not for credit)",
+    "38.00": "Philosophy and religious studies, general",
+    "38.01": "Philosophy, logic and ethics",
+    "38.02": "Religion/religious studies",
+    "38.99": "Philosophy and religious studies, other",
+    "39.02": "Bible/Biblical studies",
+    "39.03": "Missions/missionary studies and missiology",
+    "39.04": "Religious education",
+    "39.05": "Religious music and worship",
+    "39.06": "Theological and ministerial studies",
+    "39.07": "Pastoral counselling and specialized ministries",
+    "39.08": "Religious institution administration and law",
+    "39.99": "Theology and religious vocations, other",
+    "40.01": "Physical sciences, general",
+    "40.02": "Astronomy and astrophysics",
+    "40.04": "Atmospheric sciences and meteorology",
+    "40.05": "Chemistry",
+    "40.06": "Geological and Earth sciences/geosciences",
+    "40.08": "Physics",
+    "40.10": "Materials sciences",
+    "40.11": "Physics and astronomy",
+    "40.99": "Physical sciences, other",
+    "41.00": "Science technologies/technicians, general",
+    "41.01": "Biology and biotechnology technologies/technicians",
+    "41.02": "Nuclear and industrial radiologic technologies/technicians",
+    "41.03": "Physical science technologies/technicians",
+    "41.99": "Science technologies/technicians, other",
+    "42.01": "Psychology, general",
+    "42.27": "Research and experimental psychology",
+    "42.28": "Clinical, counselling and applied psychology",
+    "42.99": "Psychology, other",
+    "43.01": "Criminal justice and corrections",
+    "43.02": "Fire protection",
+    "43.03": "Security and protective services, specialized programs",
+    "43.04": "Security science and technology",
+    "43.99": "Security and protective services, other",
+    "44.00": "Human services, general",
+    "44.02": "Community organization and advocacy",
+    "44.04": "Public administration",
+    "44.05": "Public policy analysis",
+    "44.07": "Social work",
+    "44.99": "Public administration and social service professions, other",
+    "45.01": "General social sciences",
+    "45.02": "Anthropology",
+    "45.03": "Archaeology",
+    "45.04": "Criminology",
+    "45.05": "Demography",
+    "45.06": "Economics",
+    "45.07": "Geography and cartography",
+    "45.09": "International relations and national security studies",
+    "45.10": "Political science and government",
+    "45.11": "Sociology",
+    "45.12": "Urban studies/affairs",
+    "45.13": "Sociology and anthropology",
+    "45.15": "Geography and anthropology",
+    "45.99": "Social sciences, other",
+    "46.00": "Construction trades, general",
+    "46.01": "Masonry/mason",
+    "46.02": "Carpentry/carpenter",
+    "46.03": "Electrical and power transmission installers",
+    "46.04": "Building/construction finishing, management and inspection",
+    "46.05": "Plumbing and related water supply services",
+    "46.99": "Construction trades, other",
+    "47.00": "Mechanics and repairers, general",
+    "47.01": "Electrical/electronics maintenance and repair technologies/technicians",
+    "47.02": "Heating, air conditioning, ventilation and refrigeration maintenance technology/technician",
+    "47.03": "Heavy/industrial equipment maintenance technologies/technicians",
+    "47.04": "Precision systems maintenance and repair technologies/technicians",
+    "47.06": "Vehicle maintenance and repair technologies/technicians",
+    "47.07": "Energy systems maintenance and repair technologies/technicians",
+    "47.99": "Mechanic and repair technologies/technicians, other",
+    "48.00": "Precision production trades, general",
+    "48.03": "Leatherworking and upholstery",
+    "48.05": "Precision metal working",
+    "48.07": "Woodworking",
+    "48.08": "Boilermaking/boilermaker",
+    "48.99": "Precision production, other",
+    "49.01": "Air transportation",
+    "49.02": "Ground transportation",
+    "49.03": "Marine transportation",
+    "49.99": "Transportation and materials moving, other",
+    "50.01": "Visual, digital and performing arts, general",
+    "50.02": "Crafts/craft design, folk art and artisanry",
+    "50.03": "Dance",
+    "50.04": "Design and applied arts",
+    "50.05": "Drama/theatre arts and stagecraft",
+    "50.06": "Film/video and photographic arts",
+    "50.07": "Fine arts and art studies",
+    "50.09": "Music",
+    "50.10": "Arts, entertainment, and media management",
+    "50.11": "Community/environmental/socially-engaged art",
+    "50.99": "Visual and performing arts, other",
+    "51.00": "General health services/allied health/health sciences",
+    "51.01": "Chiropractic (DC)",
+    "51.02": "Communication disorders sciences and services",
+    "51.04": "Dentistry (DDS, DMD)",
+    "51.05": "Advanced/graduate dentistry and oral sciences (Cert., MS, MSc, PhD)",
+    "51.06": "Dental support services and allied professions",
+    "51.07": "Health and medical administrative services",
+    "51.08": "Allied health and medical assisting services",
+    "51.09": "Allied health diagnostic, intervention and treatment professions",
+    "51.10": "Clinical/medical laboratory science/research and allied professions",
+    "51.11": "Health/medical preparatory programs",
+    "51.12": "Medicine",
+    "51.14": "Medical clinical sciences/graduate medical studies",
+    "51.15": "Mental and social health services and allied professions",
+    "51.17": "Optometry (OD)",
+    "51.18": "Ophthalmic and optometric support services and allied professions",
+    "51.20": "Pharmacy, pharmaceutical sciences and administration",
+    "51.22": "Public health",
+    "51.23": "Rehabilitation and therapeutic professions",
+    "51.26": "Health aides/attendants/orderlies",
+    "51.27": "Medical illustration and informatics",
+    "51.31": "Dietetics and clinical nutrition services",
+    "51.32": "Health professions education, ethics, and humanities",
+    "51.33": "Alternative and complementary medicine and medical systems",
+    "51.34": "Alternative and complementary medical support services",
+    "51.35": "Somatic bodywork and related therapeutic services",
+    "51.36": "Movement and mind-body therapies",
+    "51.37": "Energy-based and biologically-based therapies",
+    "51.38": "Registered nursing, nursing administration, nursing research and clinical nursing",
+    "51.39": "Practical nursing, vocational nursing and nursing assistants",
+    "51.99": "Health professions and related programs, other",
+    "52.01": "Business/commerce, general",
+    "52.02": "Business administration, management and operations",
+    "52.03": "Accounting and related services",
+    "52.04": "Business operations support and assistant services",
+    "52.05": "Business/corporate communications",
+    "52.06": "Business/managerial economics",
+    "52.07": "Entrepreneurial and small business operations",
+    "52.08": "Finance and financial management services",
+    "52.09": "Hospitality administration/management",
+    "52.10": "Human resources management and services",
+    "52.11": "International business/trade/commerce",
+    "52.12": "Management information systems and services",
+    "52.13": "Management sciences and quantitative methods",
+    "52.14": "Marketing",
+    "52.15": "Real estate",
+    "52.16": "Taxation",
+    "52.17": "Insurance",
+    "52.18": "General sales, merchandising and related marketing operations",
+    "52.19": "Specialized sales, merchandising and marketing operations",
+    "52.20": "Construction management",
+    "52.21": "Telecommunications management",
+    "52.99": "Business, management, marketing and related support services, other",
+    "53.01": "High school/secondary diploma programs",
+    "53.02": "High school/secondary certificate programs",
+    "54.01": "History",
+    "55.01": "French language and literature, general",
+    "55.13": "French rhetoric and composition/writing studies",
+    "55.14": "French literature",
+    "55.99": "French language and literature/letters, other",
+    "60.01": "Dental residency/fellowship programs",
+    "60.03": "Veterinary residency/fellowship programs",
+    "60.07": "Nurse practitioner residency/fellowship programs",
+    "60.08": "Pharmacy residency/fellowship programs",
+    "60.09": "Physician assistant residency/fellowship programs",
+    "60.99": "Health professions residency/fellowship programs, other",
+    "61.01": "Combined medical residency/fellowship programs",
+    "61.02": "Multiple-pathway medical fellowship programs",
+    "61.03": "Allergy and immunology residency/fellowship programs",
+    "61.04": "Anesthesiology residency/fellowship programs",
+    "61.05": "Dermatology residency/fellowship programs",
+    "61.06": "Emergency medicine residency/fellowship programs",
+    "61.07": "Family medicine residency/fellowship programs",
+    "61.08": "Internal medicine residency/fellowship programs",
+    "61.09": "Medical genetics and genomics residency/fellowship programs",
+    "61.10": "Neurological surgery residency/fellowship programs",
+    "61.11": "Neurology residency/fellowship programs",
+    "61.12": "Nuclear medicine residency/fellowship programs",
+    "61.13": "Obstetrics and gynecology residency/fellowship programs",
+    "61.14": "Ophthalmology residency/fellowship programs",
+    "61.15": "Orthopedic surgery residency/fellowship programs",
+    "61.16": "Osteopathic medicine residency/fellowship programs",
+    "61.17": "Otolaryngology residency/fellowship programs",
+    "61.18": "Pathology residency/fellowship programs",
+    "61.19": "Pediatrics residency/fellowship programs",
+    "61.20": "Physical medicine and rehabilitation residency/fellowship programs",
+    "61.21": "Plastic surgery residency/fellowship programs",
+    "61.22": "Podiatric medicine residency/fellowship programs",
+    "61.23": "Preventive medicine residency/fellowship programs",
+    "61.24": "Psychiatry residency/fellowship programs",
+    "61.25": "Radiation oncology residency/fellowship programs",
+    "61.26": "Radiology residency/fellowship programs",
+    "61.27": "Surgery residency/fellowship programs",
+    "61.28": "Urology residency/fellowship programs",
+    "61.99": "Medical residency/fellowship programs, other",
+}
+
+CIP_CODES = {
+    "01.0000": "Agriculture, general",
+    "01.0101": "Agricultural business and management, general",
+    "01.0102": "Agribusiness/agricultural business operations",
+    "01.0103": "Agricultural economics",
+    "01.0104": "Farm/farm and ranch management",
+    "01.0105": "Agricultural/farm supplies retailing and wholesaling",
+    "01.0106": "Agricultural business technology/technician",
+    "01.0199": "Agricultural business and management, other",
+    "01.0201": "Agricultural mechanization, general",
+    "01.0204": "Agricultural power machinery operation",
+    "01.0205": "Agricultural mechanics and equipment/machine technology/technician",
+    "01.0207": "Irrigation management technology/technician",
+    "01.0299": "Agricultural mechanization, other",
+    "01.0301": "Agricultural production operations, general",
+    "01.0302": "Animal/livestock husbandry and production",
+    "01.0303": "Aquaculture",
+    "01.0304": "Crop production",
+    "01.0306": "Dairy husbandry and production",
+    "01.0307": "Horse husbandry/equine science and management",
+    "01.0308": "Agroecology and sustainable agriculture",
+    "01.0310": "Apiculture",
+    "01.0399": "Agricultural production operations, other",
+    "01.0401": "Agricultural and food products processing, general",
+    "01.0480": "Cannabis product processing and inspection",
+    "01.0499": "Agricultural and food products processing, other",
+    "01.0504": "Dog/pet/animal grooming",
+    "01.0505": "Animal training",
+    "01.0507": "Equestrian/equine studies",
+    "01.0508": "Taxidermy/taxidermist",
+    "01.0509": "Farrier science",
+    "01.0599": "Agricultural and domestic animal services, other",
+    "01.0601": "Applied horticulture/horticulture operations, general",
+    "01.0603": "Ornamental horticulture",
+    "01.0604": "Greenhouse operations and management",
+    "01.0605": "Landscaping and groundskeeping",
+    "01.0606": "Plant nursery operations and management",
+    "01.0607": "Turf and turfgrass management",
+    "01.0608": "Floriculture/floristry operations and management",
+    "01.0609": "Public horticulture",
+    "01.0610": "Urban and community horticulture",
+    "01.0680": "Cannabis production operations and management",
+    "01.0699": "Applied horticulture/horticultural business services, other",
+    "01.0701": "International agriculture",
+    "01.0801": "Agricultural and extension education services",
+    "01.0802": "Agricultural communication/journalism",
+    "01.0899": "Agricultural public services, other",
+    "01.0901": "Animal sciences, general",
+    "01.0902": "Agricultural animal breeding",
+    "01.0903": "Animal health",
+    "01.0904": "Animal nutrition",
+    "01.0905": "Dairy science",
+    "01.0906": "Livestock management",
+    "01.0907": "Poultry science",
+    "01.0999": "Animal sciences, other",
+    "01.1001": "Food science",
+    "01.1002": "Food technology and processing",
+    "01.1003": "Brewing science",
+    "01.1004": "Viticulture and enology",
+    "01.1005": "Zymology/fermentation science",
+    "01.1099": "Food science and technology, other",
+    "01.1101": "Plant sciences, general",
+    "01.1102": "Agronomy and crop science",
+    "01.1103": "Horticultural science",
+    "01.1104": "Agricultural and horticultural plant breeding",
+    "01.1105": "Plant protection and integrated pest management",
+    "01.1106": "Range science and management",
+    "01.1180": "Cannabis product development and plant breeding",
+    "01.1199": "Plant sciences, other",
+    "01.1201": "Soil science and agronomy, general",
+    "01.1202": "Soil chemistry and physics",
+    "01.1203": "Soil microbiology",
+    "01.1299": "Soil sciences, other",
+    "01.1302": "Pre-veterinary studies",
+    "01.1399": "Agriculture/veterinary preparatory programs, other",
+    "01.8001": "Veterinary medicine (DVM)",
+    "01.8101": "Veterinary sciences/veterinary clinical sciences, general (Cert., MS, MSc, PhD)",
+    "01.8102": "Comparative and laboratory animal medicine (Cert., MS, MSc, PhD)",
+    "01.8103": "Large animal/food animal and equine surgery and medicine (Cert., MS, MSc, PhD)",
+    "01.8104": "Small/companion animal surgery and medicine (Cert., MS, MSc, PhD)",
+    "01.8105": "Veterinary anatomy (Cert., MS, MSc, PhD)",
+    "01.8106": "Veterinary infectious diseases (Cert., MS, MSc, PhD)",
+    "01.8107": "Veterinary microbiology and immunobiology (Cert., MS, MSc, PhD)",
+    "01.8108": "Veterinary pathology and pathobiology (Cert., MS, MSc, PhD)",
+    "01.8109": "Veterinary physiology (Cert., MS, MSc, PhD)",
+    "01.8110": "Veterinary preventive medicine, epidemiology and public health (Cert., MS, MSc, PhD)",
+    "01.8111": "Veterinary toxicology and pharmacology (Cert., MS, MSc, PhD)",
+    "01.8199": "Veterinary biomedical and clinical sciences, other (Cert., MS, MSc, PhD)",
+    "01.8201": "Veterinary administrative services, general",
+    "01.8202": "Veterinary office management/administration",
+    "01.8203": "Veterinary reception/receptionist",
+    "01.8204": "Veterinary administrative/executive assistant and veterinary secretary",
+    "01.8299": "Veterinary administrative services, other",
+    "01.8301": "Veterinary/animal health technology/technician and veterinary assistant",
+    "01.8399": "Veterinary/animal health technologies/technicians, other",
+    "01.9999": "Agricultural and veterinary sciences/services/operations and related fields, other",
+    "03.0101": "Natural resources/conservation, general",
+    "03.0103": "Environmental studies",
+    "03.0104": "Environmental science",
+    "03.0199": "Natural resources conservation and research, other",
+    "03.0201": "Environmental/natural resources management and policy, general",
+    "03.0204": "Environmental/natural resource economics",
+    "03.0205": "Water, wetlands and marine resources management",
+    "03.0206": "Land use planning and management/development",
+    "03.0207": "Environmental/natural resource recreation and tourism",
+    "03.0208": "Environmental/natural resources law enforcement and protective services",
+    "03.0209": "Energy and environmental policy/environmental energy policy",
+    "03.0210": "Bioenergy resource development and management",
+    "03.0299": "Environmental/natural resources management and policy, other",
+    "03.0301": "Fishing and fisheries sciences and management",
+    "03.0501": "Forestry, general",
+    "03.0502": "Forest sciences and biology",
+    "03.0506": "Forest management/forest resources management",
+    "03.0508": "Urban forestry",
+    "03.0509": "Wood science and wood products/pulp and paper technology/technician",
+    "03.0510": "Forest resources production and management",
+    "03.0511": "Forest technology/technician",
+    "03.0599": "Forestry, other",
+    "03.0601": "Wildlife, fish and wildlands science and management",
+    "03.9999": "Natural resources and conservation, other",
+    "04.0200": "Pre-architecture studies",
+    "04.0201": "Architecture (BArch, BA, BS, BSc, MArch, MA, MS, MSc, DArch, PhD)",
+    "04.0202": "Advanced architectural design (MArch, MA, MS, MSc, DArch, PhD)",
+    "04.0299": "Architecture, other",
+    "04.0301": "City/urban, community and regional planning",
+    "04.0401": "Environmental design/architecture, general",
+    "04.0402": "Healthcare environment design/architecture",
+    "04.0403": "Sustainable design/architecture",
+    "04.0499": "Environmental design/architecture, other",
+    "04.0501": "Interior architecture",
+    "04.0601": "Landscape architecture (BS, BSc, BSLA, BLA, MSLA, MLA, PhD)",
+    "04.0801": "Architectural history and criticism, general",
+    "04.0802": "Architectural conservation",
+    "04.0803": "Architectural studies",
+    "04.0899": "Architectural history, criticism, and conservation, other",
+    "04.0901": "Architectural technology/technician",
+    "04.0902": "Architectural and building sciences/technology (BArch, BA, BS, BSc, MArch, MA, MS, MSc, DArch, PhD)",
+    "04.0999": "Architectural sciences and technology, other",
+    "04.1001": "Real estate development",
+    "04.9999": "Architecture and related services, other",
+    "05.0101": "African studies",
+    "05.0102": "American/United States studies/civilization",
+    "05.0103": "Asian studies/civilization",
+    "05.0104": "East Asian studies",
+    "05.0105": "Russian, Central European, East European and Eurasian studies",
+    "05.0106": "European studies/civilization",
+    "05.0107": "Latin American studies",
+    "05.0108": "Near and Middle Eastern studies",
+    "05.0109": "Pacific/Australasian/Oceanian studies",
+    "05.0110": "Russian studies",
+    "05.0111": "Scandinavian studies",
+    "05.0112": "South Asian studies",
+    "05.0113": "Southeast Asian studies",
+    "05.0114": "Western European studies",
+    "05.0115": "Canadian studies",
+    "05.0116": "Balkan studies",
+    "05.0117": "Baltic studies",
+    "05.0118": "Slavic studies",
+    "05.0119": "Caribbean studies",
+    "05.0120": "Ural-Altaic and Central Asian studies",
+    "05.0121": "Commonwealth studies",
+    "05.0122": "Regional studies (U.S., Canadian, foreign)",
+    "05.0123": "Chinese studies",
+    "05.0124": "French studies",
+    "05.0125": "German studies",
+    "05.0126": "Italian studies",
+    "05.0127": "Japanese studies",
+    "05.0128": "Korean studies",
+    "05.0129": "Polish studies",
+    "05.0130": "Spanish and Iberian studies",
+    "05.0131": "Tibetan studies",
+    "05.0132": "Ukraine studies",
+    "05.0133": "Irish studies",
+    "05.0134": "Latin American and Caribbean studies",
+    "05.0135": "Appalachian studies",
+    "05.0136": "Arctic studies",
+    "05.0199": "Area studies, other",
+    "05.0200": "Ethnic studies",
+    "05.0201": "African American/Black studies",
+    "05.0202": "Indigenous peoples of the Americas studies",
+    "05.0203": "Hispanic American, Puerto Rican and Mexican American/Chicano studies",
+    "05.0206": "Asian American/Asian Canadian studies",
+    "05.0207": "Women's studies",
+    "05.0208": "Gay/lesbian studies",
+    "05.0209": "Folklore studies",
+    "05.0210": "Disability studies",
+    "05.0211": "Deaf studies",
+    "05.0212": "Comparative group studies",
+    "05.0299": "Ethnic, cultural minority, gender, and group studies, other",
+    "05.9999": "Area, ethnic, cultural, gender, and group studies, other",
+    "09.0100": "Communication, general",
+    "09.0101": "Speech communication and rhetoric",
+    "09.0102": "Mass communication/media studies",
+    "09.0199": "Communication and media studies, other",
+    "09.0401": "Journalism, general",
+    "09.0402": "Broadcast journalism",
+    "09.0404": "Photojournalism",
+    "09.0405": "Business and economic journalism",
+    "09.0406": "Cultural journalism",
+    "09.0407": "Science/health/environmental journalism",
+    "09.0499": "Journalism, other",
+    "09.0701": "Radio and television",
+    "09.0702": "Digital communication and media/multimedia",
+    "09.0799": "Radio, television and digital communication, other",
+    "09.0900": "Public relations, advertising and applied communication, general",
+    "09.0901": "Organizational communication, general",
+    "09.0902": "Public relations/image management",
+    "09.0903": "Advertising",
+    "09.0904": "Political communication",
+    "09.0905": "Health communication",
+    "09.0906": "Sports communication",
+    "09.0907": "International and intercultural communication",
+    "09.0908": "Technical and scientific communication",
+    "09.0909": "Communication management and strategic communications",
+    "09.0999": "Public relations, advertising and applied communication, other",
+    "09.1001": "Publishing",
+    "09.9999": "Communication, journalism and related programs, other",
+    "10.0105": "Communications technology/technician",
+    "10.0201": "Photographic and film/video technology/technician",
+    "10.0202": "Radio and television broadcasting technology/technician",
+    "10.0203": "Recording arts technology/technician",
+    "10.0204": "Voice writing technology/technician",
+    "10.0299": "Audiovisual communications technologies/technicians, other",
+    "10.0301": "Graphic communications, general",
+    "10.0302": "Printing management",
+    "10.0303": "Prepress/desktop publishing and digital imaging design",
+    "10.0304": "Animation, interactive technology, video graphics and special effects",
+    "10.0305": "Graphic and printing equipment operator, general production",
+    "10.0306": "Platemaker/imager",
+    "10.0307": "Printing press operator",
+    "10.0308": "Computer typography and composition equipment operator",
+    "10.0399": "Graphic communications, other",
+    "10.9999": "Communications technologies/technicians and support services, other",
+    "11.0101": "Computer and information sciences, general",
+    "11.0102": "Artificial intelligence",
+    "11.0103": "Information technology",
+    "11.0104": "Informatics",
+    "11.0105": "Human-centred technology design",
+    "11.0199": "Computer and information sciences and support services, general, other",
+    "11.0201": "Computer programming/programmer, general",
+    "11.0202": "Computer programming, specific applications",
+    "11.0203": "Computer programming, vendor/product certification",
+    "11.0204": "Computer game programming",
+    "11.0205": "Computer programming, specific platforms",
+    "11.0299": "Computer programming, other",
+    "11.0301": "Data processing and data processing technology/technician",
+    "11.0401": "Information science/studies",
+    "11.0501": "Computer systems analysis/analyst",
+    "11.0601": "Data entry/microcomputer applications, general",
+    "11.0602": "Word processing",
+    "11.0699": "Data entry/microcomputer applications, other",
+    "11.0701": "Computer science",
+    "11.0801": "Web page, digital/multimedia and information resources design",
+    "11.0802": "Data modelling/warehousing and database administration",
+    "11.0803": "Computer graphics",
+    "11.0804": "Modelling, virtual environments and simulation",
+    "11.0899": "Computer software and media applications, other",
+    "11.0901": "Computer systems networking and telecommunications, general",
+    "11.0902": "Cloud computing",
+    "11.0999": "Computer systems networking and telecommunications, other",
+    "11.1001": "Network and system administration/administrator",
+    "11.1002": "System, networking and LAN/WAN management/manager",
+    "11.1003": "Computer and information systems security/auditing/information assurance",
+    "11.1004": "Web/multimedia management and webmaster",
+    "11.1005": "Information technology project management",
+    "11.1006": "Computer support specialist",
+    "11.1099": "Computer/information technology administration and management, other",
+    "11.9999": "Computer and information sciences and support services, other",
+    "12.0301": "Funeral service and mortuary science, general",
+    "12.0302": "Funeral direction/service",
+    "12.0303": "Mortuary science and embalming/embalmer",
+    "12.0399": "Funeral service and mortuary science, other",
+    "12.0401": "Cosmetology/cosmetologist, general",
+    "12.0402": "Barbering/barber",
+    "12.0404": "Electrolysis/electrology and electrolysis technician",
+    "12.0406": "Makeup artist/specialist",
+    "12.0407": "Hair styling/stylist and hair design",
+    "12.0408": "Facial treatment specialist/facialist",
+    "12.0409": "Aesthetician/esthetician and skin care specialist",
+    "12.0410": "Nail technician/specialist and manicurist",
+    "12.0411": "Permanent cosmetics/makeup and tattooing",
+    "12.0412": "Salon/beauty salon management/manager",
+    "12.0413": "Cosmetology, barber/styling and nail instructor",
+    "12.0414": "Master aesthetician/esthetician",
+    "12.0499": "Cosmetology and related personal grooming services, other",
+    "12.0500": "Cooking and related culinary arts, general",
+    "12.0501": "Baking and pastry arts/baker/pastry chef",
+    "12.0502": "Bartending/bartender",
+    "12.0503": "Culinary arts/chef training",
+    "12.0504": "Restaurant, culinary and catering management/manager",
+    "12.0505": "Food preparation/professional cooking/kitchen assistant",
+    "12.0506": "Meat cutting/meat cutter",
+    "12.0507": "Food service, waiter/waitress and dining room management/manager",
+    "12.0508": "Institutional food workers",
+    "12.0509": "Culinary science",
+    "12.0510": "Wine steward/sommelier",
+    "12.0580": "Cannabis edibles",
+    "12.0599": "Culinary arts and related services, other",
+    "12.0601": "Casino operations and services, general",
+    "12.0602": "Casino dealing",
+    "12.0699": "Casino operations and services, other",
+    "12.9999": "Culinary, entertainment, and personal services, other",
+    "13.0101": "Education, general",
+    "13.0201": "Bilingual and multilingual education",
+    "13.0202": "Multicultural education",
+    "13.0203": "Indigenous education",
+    "13.0299": "Bilingual, multilingual and multicultural education, other",
+    "13.0301": "Curriculum and instruction",
+    "13.0401": "Educational leadership and administration, general",
+    "13.0402": "Administration of special education",
+    "13.0403": "Adult and continuing education administration",
+    "13.0404": "Educational, instructional and curriculum supervision",
+    "13.0406": "Higher education/higher education administration",
+    "13.0407": "Community college and general and vocational college (CEGEP) administration",
+    "13.0408": "Elementary and middle school administration/principalship",
+    "13.0409": "Secondary school administration/principalship",
+    "13.0410": "Urban education and leadership",
+    "13.0411": "Superintendency and educational system administration",
+    "13.0412": "International school administration/leadership",
+    "13.0413": "Education entrepreneurship",
+    "13.0414": "Early childhood program administration",
+    "13.0499": "Educational administration and supervision, other",
+    "13.0501": "Educational/instructional technology",
+    "13.0601": "Educational evaluation and research",
+    "13.0603": "Educational statistics and research methods",
+    "13.0604": "Educational assessment, testing and measurement",
+    "13.0607": "Learning sciences",
+    "13.0608": "Institutional research",
+    "13.0699": "Educational assessment, evaluation and research, other",
+    "13.0701": "International and comparative education",
+    "13.0901": "Social and philosophical foundations of education",
+    "13.1001": "Special education and teaching, general",
+    "13.1003": "Education/teaching of individuals with hearing impairments including deafness",
+    "13.1004": "Education/teaching of the gifted and talented",
+    "13.1005": "Education/teaching of individuals with emotional disturbances",
+    "13.1006": "Education/teaching of individuals with intellectual disabilities",
+    "13.1007": "Education/teaching of individuals with multiple disabilities",
+    "13.1008": "Education/teaching of individuals with orthopedic and other physical health impairments",
+    "13.1009": "Education/teaching of individuals with vision impairments including blindness",
+    "13.1011": "Education/teaching of individuals with specific learning disabilities",
+    "13.1012": "Education/teaching of individuals with speech or language impairments",
+    "13.1013": "Education/teaching of individuals with autism",
+    "13.1014": "Education/teaching of individuals who are developmentally delayed",
+    "13.1015": "Education/teaching of individuals in early childhood special education programs",
+    "13.1016": "Education/teaching of individuals with traumatic brain injuries",
+    "13.1017": "Education/teaching of individuals in elementary special education programs",
+    "13.1018": "Education/teaching of individuals in junior high/middle school special education programs",
+    "13.1019": "Education/teaching of individuals in secondary special education programs",
+    "13.1099": "Special education and teaching, other",
+    "13.1101": "Counsellor education/school counselling and guidance services",
+    "13.1102": "College student counselling and personnel services",
+    "13.1199": "Student counselling and personnel services, other",
+    "13.1201": "Adult and continuing education and teaching",
+    "13.1202": "Elementary education and teaching",
+    "13.1203": "Junior high/intermediate/middle school education and teaching",
+    "13.1205": "Secondary education and teaching",
+    "13.1206": "Teacher education, multiple levels",
+    "13.1207": "Montessori teacher education",
+    "13.1208": "Waldorf/Steiner teacher education",
+    "13.1209": "Kindergarten/preschool education and teaching",
+    "13.1210": "Early childhood education and teaching",
+    "13.1211": "Online educator/online teaching",
+    "13.1212": "International Baccalaureate teaching and learning",
+    "13.1213": "Science, technology, engineering, and mathematics (STEM) educational methods",
+    "13.1214": "Postsecondary/college/university teaching",
+    "13.1299": "Teacher education and professional development, specific levels and methods, other",
+    "13.1301": "Agricultural teacher education",
+    "13.1302": "Art teacher education",
+    "13.1303": "Business and innovation/entrepreneurship teacher education",
+    "13.1304": "Driver and safety teacher education",
+    "13.1305": "English/English language arts teacher education",
+    "13.1306": "Indigenous and foreign language teacher education",
+    "13.1307": "Health teacher education",
+    "13.1308": "Family and consumer sciences/home economics teacher education",
+    "13.1309": "Technology teacher education/industrial arts teacher education",
+    "13.1310": "Sales and marketing operations/marketing and distribution teacher education",
+    "13.1311": "Mathematics teacher education",
+    "13.1312": "Music teacher education",
+    "13.1314": "Physical education teaching and coaching",
+    "13.1315": "Reading teacher education",
+    "13.1316": "Science teacher education/general science teacher education",
+    "13.1317": "Social science teacher education",
+    "13.1318": "Social studies teacher education",
+    "13.1319": "Technical teacher education",
+    "13.1320": "Trade and industrial teacher education",
+    "13.1321": "Computer teacher education",
+    "13.1322": "Biology teacher education",
+    "13.1323": "Chemistry teacher education",
+    "13.1324": "Drama and dance teacher education",
+    "13.1325": "French language/French language arts teacher education",
+    "13.1326": "German language teacher education",
+    "13.1327": "Health occupations teacher education",
+    "13.1328": "History teacher education",
+    "13.1329": "Physics teacher education",
+    "13.1330": "Spanish language teacher education",
+    "13.1331": "Speech teacher education",
+    "13.1332": "Geography teacher education",
+    "13.1333": "Latin teacher education",
+    "13.1334": "School librarian/school library media specialist",
+    "13.1335": "Psychology teacher education",
+    "13.1337": "Earth science teacher education",
+    "13.1338": "Environmental teacher education",
+    "13.1339": "Communication arts and literature teacher education",
+    "13.1399": "Teacher education and professional development, specific subject areas, other",
+    "13.1401": "Teaching English as a second or foreign language/ESL language instructor",
+    "13.1402": "Teaching French as a second or foreign language",
+    "13.1499": "Teaching English or French as a second or foreign language, other",
+    "13.1501": "Teaching assistants/aides, general",
+    "13.1502": "Adult literacy tutor/instructor",
+    "13.1599": "Teaching assistants/aides, other",
+    "13.9999": "Education, other",
+    "14.0101": "Engineering, general",
+    "14.0102": "Pre-engineering",
+    "14.0103": "Applied engineering",
+    "14.0201": "Aerospace, aeronautical and astronautical/space engineering, general",
+    "14.0202": "Astronautical engineering",
+    "14.0299": "Aerospace, aeronautical, and astronautical/space engineering, other",
+    "14.0301": "Agricultural engineering",
+    "14.0401": "Architectural engineering",
+    "14.0501": "Biomedical/medical engineering",
+    "14.0601": "Ceramic sciences and engineering",
+    "14.0701": "Chemical engineering",
+    "14.0702": "Chemical and biomolecular engineering",
+    "14.0799": "Chemical engineering, other",
+    "14.0801": "Civil engineering, general",
+    "14.0802": "Geotechnical and geoenvironmental engineering",
+    "14.0803": "Structural engineering",
+    "14.0804": "Transportation and highway engineering",
+    "14.0805": "Water resources engineering",
+    "14.0899": "Civil engineering, other",
+    "14.0901": "Computer engineering, general",
+    "14.0902": "Computer hardware engineering",
+    "14.0903": "Computer software engineering",
+    "14.0999": "Computer engineering, other",
+    "14.1001": "Electrical and electronics engineering",
+    "14.1003": "Laser and optical engineering",
+    "14.1004": "Telecommunications engineering",
+    "14.1099": "Electrical, electronics and communications engineering, other",
+    "14.1101": "Engineering mechanics",
+    "14.1201": "Engineering physics/applied physics",
+    "14.1301": "Engineering science",
+    "14.1401": "Environmental/environmental health engineering",
+    "14.1801": "Materials engineering",
+    "14.1901": "Mechanical engineering",
+    "14.2001": "Metallurgical engineering",
+    "14.2101": "Mining and mineral engineering",
+    "14.2201": "Naval architecture and marine engineering",
+    "14.2301": "Nuclear engineering",
+    "14.2401": "Ocean engineering",
+    "14.2501": "Petroleum engineering",
+    "14.2701": "Systems engineering",
+    "14.2801": "Textile sciences and engineering",
+    "14.3201": "Polymer/plastics engineering",
+    "14.3301": "Construction engineering",
+    "14.3401": "Forest engineering",
+    "14.3501": "Industrial engineering",
+    "14.3601": "Manufacturing engineering",
+    "14.3701": "Operations research",
+    "14.3801": "Surveying engineering",
+    "14.3901": "Geological/geophysical engineering",
+    "14.4001": "Paper science and engineering",
+    "14.4101": "Electromechanical engineering",
+    "14.4201": "Mechatronics, robotics, and automation engineering",
+    "14.4301": "Biochemical engineering",
+    "14.4401": "Engineering chemistry",
+    "14.4501": "Biological/biosystems engineering",
+    "14.4701": "Electrical and computer engineering",
+    "14.4801": "Energy systems engineering, general",
+    "14.4802": "Power plant engineering",
+    "14.4899": "Energy systems engineering, other",
+    "14.9999": "Engineering, other",
+    "15.0000": "Engineering technology/technician, general",
+    "15.0001": "Applied engineering technology/technician, general",
+    "15.0101": "Architectural engineering technology/technician",
+    "15.0201": "Civil engineering technology/technician",
+    "15.0303": "Electrical, electronic, and communications engineering technology/technician",
+    "15.0304": "Laser and optical technology/technician",
+    "15.0305": "Telecommunications technology/technician",
+    "15.0306": "Integrated circuit design technology/technician",
+    "15.0307": "Audio/sound engineering technology/technician",
+    "15.0399": "Electrical/electronic engineering technologies/technicians, other",
+    "15.0401": "Biomedical technology/technician",
+    "15.0403": "Electromechanical/electromechanical engineering technology/technician",
+    "15.0404": "Instrumentation technology/technician",
+    "15.0405": "Robotics technology/technician",
+    "15.0406": "Automation engineer technology/technician",
+    "15.0407": "Mechatronics, robotics, and automation engineering technology/technician",
+    "15.0499": "Electromechanical technologies/technicians, other",
+    "15.0501": "Heating, ventilation, air conditioning and refrigeration engineering technology/technician",
+    "15.0506": "Water quality and wastewater treatment management and recycling technology/technician",
+    "15.0507": "Environmental/environmental engineering technology/technician",
+    "15.0508": "Hazardous materials management and waste technology/technician",
+    "15.0599": "Environmental control technologies/technicians, other",
+    "15.0607": "Plastics and polymer engineering technology/technician",
+    "15.0611": "Metallurgical technology/technician",
+    "15.0612": "Industrial technology/technician",
+    "15.0613": "Manufacturing engineering technology/technician",
+    "15.0614": "Welding engineering technology/technician",
+    "15.0615": "Chemical engineering technology/technician",
+    "15.0616": "Semiconductor manufacturing technology/technician",
+    "15.0617": "Composite materials technology/technician",
+    "15.0699": "Industrial production technologies/technicians, other",
+    "15.0701": "Occupational safety and health technology/technician",
+    "15.0702": "Quality control technology/technician",
+    "15.0703": "Industrial safety technology/technician",
+    "15.0704": "Hazardous materials information systems technology/technician",
+    "15.0705": "Process safety technology/technician",
+    "15.0799": "Quality control and safety technologies/technicians, other",
+    "15.0801": "Aeronautical/aerospace engineering technology/technician",
+    "15.0803": "Automotive engineering technology/technician",
+    "15.0805": "Mechanical/mechanical engineering technology/technician",
+    "15.0806": "Marine engineering technology/technician",
+    "15.0807": "Motorsports engineering technology/technician",
+    "15.0899": "Mechanical engineering related technologies/technicians, other",
+    "15.0901": "Mining technology/technician",
+    "15.0903": "Petroleum technology/technician",
+    "15.0999": "Mining and petroleum technologies/technicians, other",
+    "15.1001": "Construction engineering technology/technician",
+    "15.1102": "Surveying technology/surveying",
+    "15.1103": "Hydraulics and fluid power technology/technician",
+    "15.1199": "Engineering-related technologies/technicians, other",
+    "15.1201": "Computer engineering technology/technician, general",
+    "15.1202": "Computer/computer systems technology/technician",
+    "15.1203": "Computer hardware technology/technician",
+    "15.1204": "Computer software technology/technician",
+    "15.1299": "Computer engineering technologies/technicians, other",
+    "15.1301": "Drafting and design technology/technician, general",
+    "15.1302": "CAD/CADD drafting and/or design technology/technician",
+    "15.1303": "Architectural drafting and architectural CAD/CADD",
+    "15.1304": "Civil drafting and civil engineering CAD/CADD",
+    "15.1305": "Electrical/electronics drafting and electrical/electronics CAD/CADD",
+    "15.1306": "Mechanical drafting and mechanical drafting CAD/CADD",
+    "15.1307": "3D modelling and design technology/technician",
+    "15.1399": "Drafting/design engineering technologies/technicians, other",
+    "15.1401": "Nuclear engineering technology/technician",
+    "15.1501": "Engineering/industrial management",
+    "15.1502": "Engineering design",
+    "15.1503": "Packaging science",
+    "15.1599": "Engineering-related fields, other",
+    "15.1601": "Nanotechnology",
+    "15.1701": "Energy systems technology/technician, general",
+    "15.1702": "Power plant technology/technician",
+    "15.1703": "Solar energy technology/technician",
+    "15.1704": "Wind energy technology/technician",
+    "15.1705": "Hydroelectric energy technology/technician",
+    "15.1706": "Geothermal energy technology/technician",
+    "15.1799": "Energy systems technologies/technicians, other",
+    "15.9999": "Engineering/engineering-related technologies/technicians, other",
+    "16.0101": "Indigenous and foreign languages and literatures, general",
+    "16.0102": "Linguistics",
+    "16.0103": "Language interpretation and translation",
+    "16.0104": "Comparative literature",
+    "16.0105": "Applied linguistics",
+    "16.0199": "Linguistic, comparative and related language studies and services, other",
+    "16.0201": "African languages, literatures and linguistics",
+    "16.0300": "East Asian languages, literatures and linguistics, general",
+    "16.0301": "Chinese language and literature",
+    "16.0302": "Japanese language and literature",
+    "16.0303": "Korean language and literature",
+    "16.0304": "Tibetan language and literature",
+    "16.0399": "East Asian languages, literatures and linguistics, other",
+    "16.0400": "Slavic languages, literatures and linguistics, general",
+    "16.0401": "Baltic languages, literatures and linguistics",
+    "16.0402": "Russian language and literature",
+    "16.0404": "Albanian language and literature",
+    "16.0405": "Bulgarian language and literature",
+    "16.0406": "Czech language and literature",
+    "16.0407": "Polish language and literature",
+    "16.0408": "Bosnian, Serbian, and Croatian languages and literatures",
+    "16.0409": "Slovak language and literature",
+    "16.0410": "Ukrainian language and literature",
+    "16.0499": "Slavic, Baltic and Albanian languages, literatures and linguistics, other",
+    "16.0500": "Germanic languages, literatures and linguistics, general",
+    "16.0501": "German language and literature",
+    "16.0502": "Scandinavian languages, literatures and linguistics",
+    "16.0503": "Danish language and literature",
+    "16.0504": "Dutch/Flemish language and literature",
+    "16.0505": "Norwegian language and literature",
+    "16.0506": "Swedish language and literature",
+    "16.0599": "Germanic languages, literatures and linguistics, other",
+    "16.0601": "Modern Greek language and literature",
+    "16.0700": "South Asian languages, literatures and linguistics, general",
+    "16.0701": "Hindi language and literature",
+    "16.0702": "Sanskrit and classical Indian languages, literatures and linguistics",
+    "16.0704": "Bengali language and literature",
+    "16.0705": "Punjabi language and literature",
+    "16.0706": "Tamil language and literature",
+    "16.0707": "Urdu language and literature",
+    "16.0799": "South Asian languages, literatures and linguistics, other",
+    "16.0801": "Iranian languages, literatures and linguistics",
+    "16.0900": "Romance languages, literatures and linguistics, general",
+    "16.0902": "Italian language and literature",
+    "16.0904": "Portuguese language and literature",
+    "16.0905": "Spanish language and literature",
+    "16.0906": "Romanian language and literature",
+    "16.0907": "Catalan language and literature",
+    "16.0908": "Hispanic and Latin American languages, literatures and linguistics, general",
+    "16.0999": "Romance languages, literatures and linguistics, other",
+    "16.1001": "Indigenous languages, literatures, and linguistics of the Americas",
+    "16.1100": "Middle/Near Eastern and Semitic languages, literatures and linguistics, general",
+    "16.1101": "Arabic language and literature",
+    "16.1102": "Hebrew language and literature",
+    "16.1103": "Ancient Near Eastern and Biblical languages, literatures and linguistics",
+    "16.1199": "Middle/Near Eastern and Semitic languages, literatures and linguistics, other",
+    "16.1200": "Classics and classical languages, literatures and linguistics, general",
+    "16.1202": "Ancient/classical Greek language and literature",
+    "16.1203": "Latin language and literature",
+    "16.1299": "Classics and classical languages, literatures and linguistics, other",
+    "16.1301": "Celtic languages, literatures and linguistics",
+    "16.1400": "Southeast Asian languages, literatures and linguistics, general",
+    "16.1401": "Australian/Oceanic/Pacific languages, literatures and linguistics",
+    "16.1402": "Indonesian/Malay languages and literatures",
+    "16.1403": "Burmese language and literature",
+    "16.1404": "Philippine/Tagalog language and literature",
+    "16.1405": "Khmer/Cambodian language and literature",
+    "16.1406": "Lao language and literature",
+    "16.1407": "Thai language and literature",
+    "16.1408": "Vietnamese language and literature",
+    "16.1409": "Hawaiian language and literature",
+    "16.1499": "Southeast Asian and Australasian/Pacific languages, literatures and linguistics, other",
+    "16.1501": "Turkish language and literature",
+    "16.1502": "Uralic languages, literatures and linguistics",
+    "16.1503": "Hungarian/Magyar language and literature",
+    "16.1504": "Mongolian language and literature",
+    "16.1599": "Turkic, Uralic-Altaic, Caucasian and Central Asian languages, literatures and linguistics, other",
+    "16.1601": "American Sign Language (ASL)/Langue des signes québécoise (LSQ)",
+    "16.1602": "Linguistics of sign language",
+    "16.1603": "Sign language interpretation and translation",
+    "16.1699": "Sign language, other",
+    "16.1701": "English as a second language",
+    "16.1702": "French as a second language",
+    "16.1799": "Second language learning, other",
+    "16.1801": "Armenian languages, literatures, and linguistics",
+    "16.9999": "Indigenous and foreign languages, literatures and linguistics, other",
+    "19.0101": "Family and consumer sciences/human sciences, general",
+    "19.0201": "Business, family and consumer sciences/human sciences",
+    "19.0202": "Family and consumer sciences/human sciences communication",
+    "19.0203": "Consumer merchandising/retailing management",
+    "19.0299": "Family and consumer sciences/human sciences business services, other",
+    "19.0401": "Family resource management studies, general",
+    "19.0402": "Consumer economics",
+    "19.0403": "Consumer services and advocacy",
+    "19.0499": "Family and consumer economics and related services, other",
+    "19.0501": "Foods, nutrition and wellness studies, general",
+    "19.0504": "Human nutrition",
+    "19.0505": "Foodservice systems administration/management",
+    "19.0599": "Foods, nutrition and related services, other",
+    "19.0601": "Housing and human environments, general",
+    "19.0604": "Facilities planning and management",
+    "19.0605": "Home furnishings and equipment installers",
+    "19.0699": "Housing and human environments, other",
+    "19.0701": "Human development and family studies, general",
+    "19.0702": "Adult development and aging",
+    "19.0704": "Family systems",
+    "19.0706": "Child development",
+    "19.0707": "Family and community services",
+    "19.0708": "Child care and support services management",
+    "19.0709": "Child care provider/assistant",
+    "19.0710": "Developmental services worker",
+    "19.0711": "Early childhood and family studies",
+    "19.0712": "Parent education services",
+    "19.0799": "Human development, family studies and related services, other",
+    "19.0901": "Apparel and textiles, general",
+    "19.0902": "Apparel and textile manufacture",
+    "19.0904": "Textile science",
+    "19.0905": "Apparel and textile marketing management",
+    "19.0906": "Fashion and fabric consultant",
+    "19.0999": "Apparel and textiles, other",
+    "19.1001": "Work and family studies",
+    "19.9999": "Family and consumer sciences/human sciences, other",
+    "21.0101": "Pre-technology education/pre-industrial arts programs",
+    "22.0000": "Legal studies",
+    "22.0001": "Pre-law studies",
+    "22.0099": "Non-professional legal studies, other",
+    "22.0101": "Law (LLB, JD, BCL)",
+    "22.0201": "Advanced legal research/studies, general (LLM, MCL, MLI, MSL, LLD, JSD/SJD)",
+    "22.0202": "Programs for foreign lawyers (LLM, MCL)",
+    "22.0203": "American/US law/legal studies/jurisprudence (LLM, MCJ, LLD, JSD/SJD)",
+    "22.0204": "Canadian law/legal studies/jurisprudence (LLM, MCJ, LLD, JSD/SJD)",
+    "22.0205": "Banking, corporate, finance and securities law (LLM, LLD, JSD/SJD)",
+    "22.0206": "Comparative law (LLM, MCL, LLD, JSD/SJD)",
+    "22.0207": "Energy, environment and natural resources law (LLM, MS, MSc, LLD, JSD/SJD)",
+    "22.0208": "Health law (LLM, MJ, LLD, JSD/SJD)",
+    "22.0209": "International law and legal studies (LLM, LLD, JSD/SJD)",
+    "22.0210": "International business, trade and tax law (LLM, LLD, JSD/SJD)",
+    "22.0211": "Tax law/taxation (LLM, LLD, JSD/SJD)",
+    "22.0212": "Intellectual property law (LLM, LLD, JSD/SJD)",
+    "22.0213": "Patent law (LLM, LLD, JSD/SJD)",
+    "22.0214": "Agriculture law (JM/MJ, LLM, MA, ML, MSL/MLS, LLD, JSD/SJD, PhD)",
+    "22.0215": "Arts and entertainment law (LLM, LLD, JSD/SJD)",
+    "22.0216": "Compliance law (JM/MJ, LLM, ML, MSL/MLS, LLD, JSD/SJD, PhD)",
+    "22.0217": "Criminal law and procedure (LLM, LLD, JSD/SJD)",
+    "22.0218": "Entrepreneurship law (LLM, LLD, JSD/SJD)",
+    "22.0219": "Family/child/elder law (LLM, LLD, JSD/SJD)",
+    "22.0220": "Human resources law/labour and employment law (LLM, LLD, JSD/SJD)",
+    "22.0221": "Insurance law (LLM, LLD, JSD/SJD)",
+    "22.0222": "Real estate and land development law (LLM, LLD, JSD/SJD)",
+    "22.0223": "Transportation law (LLM, LLD, JSD/SJD)",
+    "22.0224": "Tribal/Indigenous law (LLM, LLD, JSD/SJD)",
+    "22.0299": "Legal research and advanced professional studies, other (post-LLB/JD)",
+    "22.0301": "Legal administrative assistant/secretary",
+    "22.0302": "Legal assistant/paralegal",
+    "22.0303": "Court reporting and captioning/court reporter",
+    "22.0304": "Court interpreter",
+    "22.0305": "Scopist",
+    "22.0399": "Legal support services, other",
+    "22.9999": "Legal professions and studies, other",
+    "23.0101": "English language and literature, general",
+    "23.1301": "English writing, general",
+    "23.1302": "English creative writing",
+    "23.1303": "English professional, technical, business, and scientific writing",
+    "23.1304": "English rhetoric and composition",
+    "23.1399": "English rhetoric and composition/writing studies, other",
+    "23.1401": "English literature, general",
+    "23.1402": "American literature",
+    "23.1403": "Canadian literature, English",
+    "23.1404": "British and Commonwealth literature, English",
+    "23.1405": "Children's and adolescent literature, English",
+    "23.1499": "English literature, other",
+    "23.9999": "English language and literature/letters, other",
+    "24.0101": "Liberal arts and sciences/liberal studies",
+    "24.0102": "General studies",
+    "24.0103": "Humanities/humanistic studies",
+    "24.0199": "Liberal arts and sciences, general studies and humanities, other",
+    "25.0101": "Library and information science",
+    "25.0102": "Children and youth library services",
+    "25.0103": "Archives/archival administration",
+    "25.0199": "Library science and administration, other",
+    "25.0301": "Library and archives assisting",
+    "25.9999": "Library science, other",
+    "26.0101": "Biology/biological sciences, general",
+    "26.0102": "Biomedical sciences, general",
+    "26.0202": "Biochemistry",
+    "26.0203": "Biophysics",
+    "26.0204": "Molecular biology",
+    "26.0205": "Molecular biochemistry",
+    "26.0206": "Molecular biophysics",
+    "26.0207": "Structural biology",
+    "26.0208": "Photobiology",
+    "26.0209": "Radiation biology/radiobiology",
+    "26.0210": "Biochemistry and molecular biology",
+    "26.0299": "Biochemistry/biophysics and molecular biology, other",
+    "26.0301": "Botany/plant biology, general",
+    "26.0305": "Plant pathology/phytopathology",
+    "26.0307": "Plant physiology",
+    "26.0308": "Plant molecular biology",
+    "26.0399": "Botany/plant biology, other",
+    "26.0401": "Cell/cellular biology and histology",
+    "26.0403": "Anatomy",
+    "26.0404": "Developmental biology and embryology",
+    "26.0406": "Cell/cellular and molecular biology",
+    "26.0407": "Cell biology and anatomy",
+    "26.0499": "Cell/cellular biology and anatomical sciences, other",
+    "26.0502": "Microbiology, general",
+    "26.0503": "Medical microbiology and bacteriology",
+    "26.0504": "Virology",
+    "26.0505": "Parasitology",
+    "26.0506": "Mycology",
+    "26.0507": "Immunology",
+    "26.0508": "Microbiology and immunology",
+    "26.0509": "Infectious disease and global health",
+    "26.0599": "Microbiological sciences and immunology, other",
+    "26.0701": "Zoology/animal biology, general",
+    "26.0702": "Entomology",
+    "26.0707": "Animal physiology",
+    "26.0708": "Animal behaviour and ethology",
+    "26.0709": "Wildlife biology",
+    "26.0799": "Zoology/animal biology, other",
+    "26.0801": "Genetics, general",
+    "26.0802": "Molecular genetics",
+    "26.0803": "Microbial and eukaryotic genetics",
+    "26.0804": "Animal genetics",
+    "26.0805": "Plant genetics",
+    "26.0806": "Human/medical genetics",
+    "26.0807": "Genome sciences/genomics",
+    "26.0899": "Genetics, other",
+    "26.0901": "Physiology, general",
+    "26.0902": "Molecular physiology",
+    "26.0903": "Cell physiology",
+    "26.0904": "Endocrinology",
+    "26.0905": "Reproductive biology",
+    "26.0907": "Cardiovascular science",
+    "26.0908": "Exercise physiology",
+    "26.0909": "Vision science/physiological optics",
+    "26.0910": "Pathology/experimental pathology",
+    "26.0911": "Oncology and cancer biology",
+    "26.0912": "Aerospace physiology and medicine",
+    "26.0913": "Biomechanics",
+    "26.0999": "Physiology, pathology and related sciences, other",
+    "26.1001": "Pharmacology",
+    "26.1002": "Molecular pharmacology",
+    "26.1003": "Neuropharmacology",
+    "26.1004": "Toxicology",
+    "26.1005": "Molecular toxicology",
+    "26.1006": "Environmental toxicology",
+    "26.1007": "Pharmacology and toxicology, integrated",
+    "26.1099": "Pharmacology and toxicology, other",
+    "26.1101": "Biometry/biometrics",
+    "26.1102": "Biostatistics",
+    "26.1103": "Bioinformatics",
+    "26.1104": "Computational biology",
+    "26.1199": "Biomathematics, bioinformatics, and computational biology, other",
+    "26.1201": "Biotechnology",
+    "26.1301": "Ecology",
+    "26.1302": "Marine biology and biological oceanography",
+    "26.1303": "Evolutionary biology",
+    "26.1304": "Aquatic biology/limnology",
+    "26.1305": "Environmental biology",
+    "26.1306": "Population biology",
+    "26.1307": "Conservation biology",
+    "26.1308": "Systematic biology/biological systematics",
+    "26.1309": "Epidemiology",
+    "26.1310": "Ecology and evolutionary biology",
+    "26.1311": "Epidemiology and biostatistics",
+    "26.1399": "Ecology, evolution, systematics and population biology, other",
+    "26.1401": "Molecular medicine",
+    "26.1501": "Neuroscience",
+    "26.1502": "Neuroanatomy",
+    "26.1503": "Neurobiology and anatomy",
+    "26.1504": "Neurobiology and behaviour",
+    "26.1599": "Neurobiology and neurosciences, other",
+    "26.9999": "Biological and biomedical sciences, other",
+    "27.0101": "Mathematics, general",
+    "27.0102": "Algebra and number theory",
+    "27.0103": "Analysis and functional analysis",
+    "27.0104": "Geometry/geometric analysis",
+    "27.0105": "Topology and foundations",
+    "27.0199": "Mathematics, other",
+    "27.0301": "Applied mathematics, general",
+    "27.0303": "Computational mathematics",
+    "27.0304": "Computational and applied mathematics",
+    "27.0305": "Financial mathematics",
+    "27.0306": "Mathematical biology",
+    "27.0399": "Applied mathematics, other",
+    "27.0501": "Statistics, general",
+    "27.0502": "Mathematical statistics and probability",
+    "27.0503": "Mathematics and statistics",
+    "27.0599": "Statistics, other",
+    "27.0601": "Applied statistics, general",
+    "27.9999": "Mathematics and statistics, other",
+    "28.0801": "Military science, leadership and operational art",
+    "29.0501": "Military technologies and applied sciences",
+    "30.0001": "Inclusive postsecondary education",
+    "30.0101": "Biological and physical sciences",
+    "30.0501": "Peace studies and conflict resolution",
+    "30.0601": "Systems science and theory",
+    "30.0801": "Mathematics and computer science",
+    "30.1001": "Biopsychology",
+    "30.1101": "Gerontology",
+    "30.1201": "Historic preservation and conservation, general",
+    "30.1202": "Cultural resource management and policy analysis",
+    "30.1299": "Historic preservation and conservation, other",
+    "30.1301": "Medieval and renaissance studies",
+    "30.1401": "Museology/museum studies",
+    "30.1501": "Science, technology and society",
+    "30.1601": "Accounting and computer science",
+    "30.1701": "Behavioural sciences",
+    "30.1801": "Natural sciences",
+    "30.1901": "Nutrition sciences",
+    "30.2001": "International/globalization studies",
+    "30.2101": "Holocaust and related studies",
+    "30.2201": "Ancient studies/civilization",
+    "30.2202": "Classical, ancient Mediterranean and Near Eastern studies and archaeology",
+    "30.2299": "Classical and ancient studies, other",
+    "30.2301": "Intercultural/multicultural and diversity studies",
+    "30.2501": "Cognitive science, general",
+    "30.2502": "Contemplative studies/inquiry",
+    "30.2599": "Cognitive science, other",
+    "30.2601": "Cultural studies/critical theory and analysis",
+    "30.2701": "Human biology",
+    "30.2801": "Dispute resolution",
+    "30.2901": "Maritime studies",
+    "30.3001": "Computational science",
+    "30.3101": "Human computer interaction",
+    "30.3201": "Marine sciences",
+    "30.3301": "Sustainability studies",
+    "30.3401": "Anthrozoology",
+    "30.3501": "Climate science",
+    "30.3601": "Cultural studies and comparative literature",
+    "30.3701": "Design for human health",
+    "30.3801": "Earth systems science",
+    "30.3901": "Economics and computer science",
+    "30.4001": "Economics and foreign language/literature",
+    "30.4101": "Environmental geosciences",
+    "30.4201": "Geoarchaeology",
+    "30.4301": "Geobiology",
+    "30.4401": "Geography and environmental studies",
+    "30.4501": "History and language/literature",
+    "30.4601": "History and political science",
+    "30.4701": "Linguistics and anthropology",
+    "30.4801": "Linguistics and computer science",
+    "30.4901": "Mathematical economics",
+    "30.5001": "Mathematics and atmospheric/oceanic science",
+    "30.5101": "Integrated philosophy, politics, and economics",
+    "30.5201": "Digital humanities and textual studies, general",
+    "30.5202": "Digital humanities",
+    "30.5203": "Textual studies",
+    "30.5299": "Digital humanities and textual studies, other",
+    "30.5301": "Thanatology",
+    "30.7001": "Data science, general",
+    "30.7099": "Data science, other",
+    "30.7101": "Data analytics, general",
+    "30.7102": "Business analytics",
+    "30.7103": "Data visualization",
+    "30.7104": "Financial analytics",
+    "30.7199": "Data analytics, other",
+    "30.9999": "Multidisciplinary/interdisciplinary studies, other",
+    "31.0101": "Parks, recreation, and leisure studies",
+    "31.0301": "Parks, recreation, and leisure facilities management, general",
+    "31.0302": "Golf course operation and grounds management",
+    "31.0399": "Parks, recreation, and leisure facilities management, other",
+    "31.0501": "Sports, kinesiology, and physical education/physical fitness, general",
+    "31.0504": "Sport and fitness administration/management",
+    "31.0505": "Exercise science and kinesiology",
+    "31.0507": "Physical fitness technician",
+    "31.0508": "Sports studies",
+    "31.0599": "Sports, kinesiology, and physical education/physical fitness, other",
+    "31.0601": "Outdoor education",
+    "31.9999": "Parks, recreation, leisure, fitness, and kinesiology, other",
+    "32.0101": "Basic skills, general (not for credit)",
+    "32.0104": "Numeracy and computational skills (not for credit)",
+    "32.0105": "Job-seeking/changing skills (not for credit)",
+    "32.0107": "Career exploration/awareness skills (not for credit)",
+    "32.0108": "Literacy and communication skills (not for credit)",
+    "32.0109": "Second language learning (not for credit)",
+    "32.0110": "Basic computer skills (not for credit)",
+    "32.0111": "Workforce development and training (not for credit)",
+    "32.0112": "Accent reduction/modification (not for credit)",
+    "32.0199": "Basic skills, other (not for credit)",
+    "32.0201": "Exam preparation and test-taking skills, general (not for credit)",
+    "32.0202": "High school equivalency/GED exam preparation (not for credit)",
+    "32.0203": "Undergraduate entrance/placement examination preparation (not for credit)",
+    "32.0204": "Graduate/professional school entrance examination preparation (not for credit)",
+    "32.0205": "Professional certification/licensure examination preparation (not for credit)",
+    "32.0299": "Exam preparation and test-taking skills, other (not for credit)",
+    "32.9999": "Basic skills and general exam preparation, other (not for credit)",
+    "33.0101": "Citizenship activities, general (not for credit)",
+    "33.0102": "American citizenship education (not for credit)",
+    "33.0103": "Community awareness (not for credit)",
+    "33.0104": "Community involvement (not for credit)",
+    "33.0105": "Canadian citizenship education (not for credit)",
+    "33.0106": "Personal emergency preparedness (not for credit)",
+    "33.0199": "Citizenship activities, other (not for credit)",
+    "34.0102": "Birthing and parenting knowledge and skills (not for credit)",
+    "34.0103": "Personal health improvement and maintenance (not for credit)",
+    "34.0104": "Addiction prevention and treatment (not for credit)",
+    "34.0105": "Meditation/mind-body wellness (not for credit)",
+    "34.0199": "Health-related knowledge and skills, other (not for credit)",
+    "35.0101": "Interpersonal and social skills, general (not for credit)",
+    "35.0102": "Interpersonal relationships skills (not for credit)",
+    "35.0103": "Business and social skills (not for credit)",
+    "35.0105": "Life coaching (not for credit)",
+    "35.0199": "Interpersonal and social skills, other (not for credit)",
+    "36.0101": "Leisure and recreational activities, general (not for credit)",
+    "36.0102": "Handicrafts and model-making (not for credit)",
+    "36.0103": "Board, card and role-playing games (not for credit)",
+    "36.0105": "Home maintenance and improvement (not for credit)",
+    "36.0106": "Nature appreciation (not for credit)",
+    "36.0107": "Pet ownership and care (not for credit)",
+    "36.0108": "Sports and exercise (not for credit)",
+    "36.0109": "Travel and exploration (not for credit)",
+    "36.0110": "Art (not for credit)",
+    "36.0111": "Collecting (not for credit)",
+    "36.0112": "Cooking and other domestic skills (not for credit)",
+    "36.0113": "Computer games and programming skills (not for credit)",
+    "36.0114": "Dancing (not for credit)",
+    "36.0115": "Music (not for credit)",
+    "36.0116": "Reading (not for credit)",
+    "36.0117": "Theatre (not for credit)",
+    "36.0118": "Writing (not for credit)",
+    "36.0120": "Beekeeping (not for credit)",
+    "36.0121": "Firearms training/safety (not for credit)",
+    "36.0122": "Floral design/arrangement (not for credit)",
+    "36.0123": "Master gardener/gardening (not for credit)",
+    "36.0199": "Leisure and recreational activities, other (not for credit)",
+    "36.0202": "Aircraft pilot (private) (not for credit)",
+    "36.0203": "Automobile driver education (not for credit)",
+    "36.0204": "Helicopter pilot (private) (not for credit)",
+    "36.0205": "Motorcycle rider education (not for credit)",
+    "36.0206": "Personal watercraft/boating education (not for credit)",
+    "36.0207": "Remote aircraft pilot (not for credit)",
+    "36.0299": "Non-commercial vehicle operation, other (not for credit)",
+    "36.9999": "Leisure and recreational activities and non-commercial vehicle operation, other (not for credit)",
+    "37.0101": "Self-awareness and personal assessment (not for credit)",
+    "37.0102": "Stress management and coping skills (not for credit)",
+    "37.0103": "Personal decision-making skills (not for credit)",
+    "37.0104": "Self-esteem and values clarification (not for credit)",
+    "37.0106": "Investing/wealth management/retirement planning (not for credit)",
+    "37.0107": "Self-defence (not for credit)",
+    "37.0199": "Personal awareness and self-improvement, other (not for credit)",
+    "38.0001": "Philosophy and religious studies, general",
+    "38.0101": "Philosophy",
+    "38.0102": "Logic",
+    "38.0103": "Ethics",
+    "38.0104": "Applied and professional ethics",
+    "38.0199": "Philosophy, logic and ethics, other",
+    "38.0201": "Religion/religious studies, general",
+    "38.0202": "Buddhist studies",
+    "38.0203": "Christian studies",
+    "38.0204": "Hindu studies",
+    "38.0205": "Islamic studies",
+    "38.0206": "Jewish/Judaic studies",
+    "38.0207": "Talmudic studies",
+    "38.0208": "Catholic studies",
+    "38.0209": "Mormon studies",
+    "38.0299": "Religion/religious studies, other",
+    "38.9999": "Philosophy and religious studies, other",
+    "39.0201": "Bible/Biblical studies",
+    "39.0301": "Missions/missionary studies",
+    "39.0302": "Church planting",
+    "39.0399": "Missions/missionary studies and missiology, other",
+    "39.0401": "Religious education",
+    "39.0501": "Religious/sacred music",
+    "39.0502": "Christian contemporary worship music/worship ministry",
+    "39.0599": "Religious music and worship, other",
+    "39.0601": "Theology/theological studies",
+    "39.0602": "Divinity/ministry (BDiv, MDiv)",
+    "39.0604": "Pre-theology/pre-ministerial studies",
+    "39.0605": "Rabbinical studies (MHL/Rav)",
+    "39.0699": "Theological and ministerial studies, other",
+    "39.0701": "Pastoral studies/counselling",
+    "39.0702": "Youth ministry",
+    "39.0703": "Urban ministry",
+    "39.0704": "Women's ministry",
+    "39.0705": "Lay ministry",
+    "39.0706": "Chaplain/chaplaincy studies",
+    "39.0799": "Pastoral counselling and specialized ministries, other",
+    "39.0801": "Religious institution administration and management",
+    "39.0802": "Religious/canon law",
+    "39.0899": "Religious institution administration and law, other",
+    "39.9999": "Theology and religious vocations, other",
+    "40.0101": "Physical sciences, general",
+    "40.0201": "Astronomy",
+    "40.0202": "Astrophysics",
+    "40.0203": "Planetary astronomy and science",
+    "40.0299": "Astronomy and astrophysics, other",
+    "40.0401": "Atmospheric sciences and meteorology, general",
+    "40.0402": "Atmospheric chemistry and climatology",
+    "40.0403": "Atmospheric physics and dynamics",
+    "40.0404": "Meteorology",
+    "40.0499": "Atmospheric sciences and meteorology, other",
+    "40.0501": "Chemistry, general",
+    "40.0502": "Analytical chemistry",
+    "40.0503": "Inorganic chemistry",
+    "40.0504": "Organic chemistry",
+    "40.0506": "Physical chemistry",
+    "40.0507": "Polymer chemistry",
+    "40.0508": "Chemical physics",
+    "40.0509": "Environmental chemistry",
+    "40.0510": "Forensic chemistry",
+    "40.0511": "Theoretical chemistry",
+    "40.0512": "Cheminformatics/chemistry informatics",
+    "40.0599": "Chemistry, other",
+    "40.0601": "Geology/Earth science, general",
+    "40.0602": "Geochemistry",
+    "40.0603": "Geophysics and seismology",
+    "40.0604": "Paleontology",
+    "40.0605": "Hydrology and water resources science",
+    "40.0606": "Geochemistry and petrology",
+    "40.0607": "Oceanography, chemical and physical",
+    "40.0699": "Geological and Earth sciences/geosciences, other",
+    "40.0801": "Physics, general",
+    "40.0802": "Atomic/molecular physics",
+    "40.0804": "Elementary particle physics",
+    "40.0805": "Plasma and high-temperature physics",
+    "40.0806": "Nuclear physics",
+    "40.0807": "Optics/optical sciences",
+    "40.0808": "Condensed matter and materials physics",
+    "40.0809": "Acoustics",
+    "40.0810": "Theoretical and mathematical physics",
+    "40.0899": "Physics, other",
+    "40.1001": "Materials science",
+    "40.1002": "Materials chemistry",
+    "40.1099": "Materials sciences, other",
+    "40.1101": "Physics and astronomy",
+    "40.9999": "Physical sciences, other",
+    "41.0000": "Science technologies/technicians, general",
+    "41.0101": "Biology and biotechnology technologies/technicians",
+    "41.0204": "Industrial radiologic technology/technician",
+    "41.0205": "Nuclear/nuclear power technology/technician",
+    "41.0299": "Nuclear and industrial radiologic technologies/technicians, other",
+    "41.0301": "Chemical technology/technician",
+    "41.0303": "Chemical process technology",
+    "41.0399": "Physical science technologies/technicians, other",
+    "41.9999": "Science technologies/technicians, other",
+    "42.0101": "Psychology, general",
+    "42.2701": "Cognitive psychology and psycholinguistics",
+    "42.2702": "Comparative psychology",
+    "42.2703": "Developmental and child psychology",
+    "42.2704": "Experimental psychology",
+    "42.2705": "Personality psychology",
+    "42.2706": "Behavioural neuroscience",
+    "42.2707": "Social psychology",
+    "42.2708": "Psychometrics and quantitative psychology",
+    "42.2709": "Psychopharmacology",
+    "42.2710": "Developmental and adolescent psychology",
+    "42.2799": "Research and experimental psychology, other",
+    "42.2801": "Clinical psychology",
+    "42.2802": "Community psychology",
+    "42.2803": "Counselling psychology",
+    "42.2804": "Industrial and organizational psychology",
+    "42.2805": "School psychology",
+    "42.2806": "Educational psychology",
+    "42.2807": "Clinical child psychology",
+    "42.2808": "Environmental psychology",
+    "42.2809": "Geropsychology",
+    "42.2810": "Health/medical psychology",
+    "42.2811": "Family psychology",
+    "42.2812": "Forensic psychology",
+    "42.2813": "Applied psychology",
+    "42.2814": "Applied behaviour analysis",
+    "42.2815": "Performance and sport psychology",
+    "42.2816": "Somatic psychology",
+    "42.2817": "Transpersonal/spiritual psychology",
+    "42.2899": "Clinical, counselling and applied psychology, other",
+    "42.9999": "Psychology, other",
+    "43.0100": "Criminal justice and corrections, general",
+    "43.0102": "Corrections",
+    "43.0103": "Criminal justice/law enforcement administration",
+    "43.0104": "Criminal justice/safety studies",
+    "43.0107": "Criminal justice/police science",
+    "43.0109": "Security and loss prevention services",
+    "43.0110": "Juvenile corrections",
+    "43.0112": "Securities services administration/management",
+    "43.0113": "Corrections administration",
+    "43.0114": "Law enforcement investigation and interviewing",
+    "43.0115": "Law enforcement record keeping and evidence management",
+    "43.0119": "Critical incident response/special police operations",
+    "43.0120": "Protective services operations",
+    "43.0121": "Suspension and debarment investigation",
+    "43.0122": "Maritime law enforcement",
+    "43.0123": "Cultural/archaeological resources protection",
+    "43.0199": "Criminal justice and corrections, other",
+    "43.0201": "Fire prevention and safety technology/technician",
+    "43.0202": "Fire services administration",
+    "43.0203": "Fire science/firefighting",
+    "43.0204": "Fire systems technology",
+    "43.0205": "Fire/arson investigation and prevention",
+    "43.0206": "Wildland/forest firefighting and investigation",
+    "43.0299": "Fire protection, other",
+    "43.0302": "Crisis/emergency/disaster management",
+    "43.0399": "Security and protective services, specialized programs, other",
+    "43.0401": "Security science and technology, general",
+    "43.0402": "Criminalistics and criminal science",
+    "43.0403": "Cyber/computer forensics and counterterrorism",
+    "43.0404": "Cybersecurity defense strategy/policy",
+    "43.0405": "Financial forensics and fraud investigation",
+    "43.0406": "Forensic science and technology",
+    "43.0407": "Geospatial intelligence",
+    "43.0408": "Law enforcement intelligence analysis",
+    "43.0499": "Security science and technology, other",
+    "43.9999": "Security and protective services, other",
+    "44.0000": "Human services, general",
+    "44.0201": "Community organization and advocacy",
+    "44.0401": "Public administration, general",
+    "44.0402": "Public works management",
+    "44.0403": "Public transportation and infrastructure planning/studies",
+    "44.0499": "Public administration, other",
+    "44.0501": "Public policy analysis, general",
+    "44.0502": "Education policy analysis",
+    "44.0503": "Health policy analysis",
+    "44.0504": "International public policy analysis",
+    "44.0580": "Cannabis-related public policy analysis",
+    "44.0599": "Public policy analysis, other",
+    "44.0701": "Social work, general",
+    "44.0702": "Youth services/administration",
+    "44.0703": "Forensic social work",
+    "44.0799": "Social work, other",
+    "44.9999": "Public administration and social service professions, other",
+    "45.0101": "Social sciences, general",
+    "45.0102": "Research methodology and quantitative methods",
+    "45.0103": "Survey research/methodology",
+    "45.0199": "General social sciences, other",
+    "45.0201": "Anthropology, general",
+    "45.0202": "Physical and biological anthropology",
+    "45.0203": "Medical anthropology",
+    "45.0204": "Cultural anthropology",
+    "45.0205": "Forensic anthropology",
+    "45.0299": "Anthropology, other",
+    "45.0301": "Archaeology",
+    "45.0401": "Criminology",
+    "45.0501": "Demography and population studies",
+    "45.0502": "Applied demography",
+    "45.0599": "Demography, other",
+    "45.0601": "Economics, general",
+    "45.0602": "Applied economics",
+    "45.0603": "Econometrics and quantitative economics",
+    "45.0604": "Development economics and international development",
+    "45.0605": "International economics",
+    "45.0699": "Economics, other",
+    "45.0701": "Geography",
+    "45.0702": "Geographic information science and cartography",
+    "45.0799": "Geography and cartography, other",
+    "45.0901": "International relations and affairs",
+    "45.0902": "National security policy studies",
+    "45.0999": "International relations and national security studies, other",
+    "45.1001": "Political science and government, general",
+    "45.1002": "American government and politics (United States)",
+    "45.1003": "Canadian government and politics",
+    "45.1004": "Political economy",
+    "45.1099": "Political science and government, other",
+    "45.1101": "Sociology, general",
+    "45.1102": "Applied/public sociology",
+    "45.1103": "Rural sociology",
+    "45.1199": "Sociology, other",
+    "45.1201": "Urban studies/affairs",
+    "45.1301": "Sociology and anthropology",
+    "45.1501": "Geography and anthropology",
+    "45.9999": "Social sciences, other",
+    "46.0000": "Construction trades, general",
+    "46.0101": "Masonry/mason",
+    "46.0201": "Carpentry/carpenter",
+    "46.0301": "Electrical and power transmission installation/installer, general",
+    "46.0302": "Electrician",
+    "46.0303": "Lineworker",
+    "46.0399": "Electrical and power transmission installers, other",
+    "46.0401": "Building/property maintenance",
+    "46.0402": "Concrete finishing/concrete finisher",
+    "46.0403": "Building/home/construction inspection/inspector",
+    "46.0404": "Drywall installation/drywaller",
+    "46.0406": "Glazier",
+    "46.0408": "Painting/painter and wall coverer",
+    "46.0410": "Roofer",
+    "46.0411": "Metal building assembly/assembler",
+    "46.0412": "Building/construction site management/manager",
+    "46.0413": "Carpet, floor, and tile worker",
+    "46.0414": "Insulator",
+    "46.0415": "Building construction technology/technician",
+    "46.0499": "Building/construction finishing, management and inspection, other",
+    "46.0502": "Pipefitting/pipefitter and sprinkler fitter",
+    "46.0503": "Plumbing technology/plumber",
+    "46.0504": "Well drilling/driller",
+    "46.0505": "Blasting/blaster",
+    "46.0599": "Plumbing and related water supply services, other",
+    "46.9999": "Construction trades, other",
+    "47.0000": "Mechanics and repairers, general",
+    "47.0101": "General electrical/electronics equipment installation and repair technology/technician",
+    "47.0102": "Business machine repair",
+    "47.0103": "Communications systems installation and repair technology/technician",
+    "47.0104": "Computer installation and repair technology/technician",
+    "47.0105": "Industrial electronics technology/technician",
+    "47.0106": "Appliance installation and repair technology/technician",
+    "47.0110": "Security system installation, repair and inspection technology/technician",
+    "47.0199": "Electrical/electronics maintenance and repair technologies/technicians, other",
+    "47.0201": "Heating, air conditioning, ventilation and refrigeration maintenance technology/technician",
+    "47.0302": "Heavy equipment maintenance technology/technician",
+    "47.0303": "Industrial mechanics and maintenance technology/technician",
+    "47.0399": "Heavy/industrial equipment maintenance technologies/technicians, other",
+    "47.0402": "Gunsmithing/gunsmith",
+    "47.0403": "Locksmithing and safe repair",
+    "47.0404": "Musical instrument fabrication and repair",
+    "47.0408": "Watchmaking and jewellery making",
+    "47.0409": "Parts and warehousing operations and maintenance technology/technician",
+    "47.0499": "Precision systems maintenance and repair technologies/technicians, other",
+    "47.0600": "Vehicle maintenance and repair technology/technician, general",
+    "47.0603": "Autobody/collision and repair technology/technician",
+    "47.0604": "Automobile/automotive mechanics technology/technician",
+    "47.0605": "Diesel mechanics technology/technician",
+    "47.0606": "Small engine mechanics and repair technology/technician",
+    "47.0607": "Airframe mechanics and aircraft maintenance technology/technician",
+    "47.0608": "Aircraft powerplant technology/technician",
+    "47.0609": "Avionics maintenance technology/technician",
+    "47.0610": "Bicycle mechanics and repair technology/technician",
+    "47.0611": "Motorcycle maintenance and repair technology/technician",
+    "47.0612": "Vehicle emissions inspection and maintenance technology/technician",
+    "47.0613": "Medium/heavy vehicle and truck technology/technician",
+    "47.0614": "Alternative fuel vehicle technology/technician",
+    "47.0615": "Engine machinist",
+    "47.0616": "Marine maintenance/fitter and ship repair technology/technician",
+    "47.0617": "High performance and custom engine technician/mechanic",
+    "47.0618": "Recreation vehicle (RV) service technician",
+    "47.0699": "Vehicle maintenance and repair technologies/technicians, other",
+    "47.0701": "Energy systems installation and repair technology/technician, general",
+    "47.0703": "Solar energy system installation and repair technology/technician",
+    "47.0704": "Wind energy system installation and repair technology/technician",
+    "47.0705": "Hydroelectric energy system installation and repair technology/technician",
+    "47.0706": "Geothermal energy system installation and repair technology/technician",
+    "47.0799": "Energy systems maintenance and repair technologies/technicians, other",
+    "47.9999": "Mechanic and repair technologies/technicians, other",
+    "48.0000": "Precision production trades, general",
+    "48.0303": "Upholstery/upholsterer",
+    "48.0304": "Shoe, boot and leather repair",
+    "48.0399": "Leatherworking and upholstery, other",
+    "48.0501": "Machine tool technology/machinist",
+    "48.0503": "Machine shop technology/assistant",
+    "48.0506": "Sheet metal technology/sheetworking",
+    "48.0507": "Tool and die technology/technician",
+    "48.0508": "Welding technology/welder",
+    "48.0509": "Ironworking/ironworker",
+    "48.0510": "Computer numerically controlled (CNC) machinist technology/CNC machinist",
+    "48.0511": "Metal fabricator",
+    "48.0599": "Precision metal working, other",
+    "48.0701": "Woodworking, general",
+    "48.0702": "Furniture design and manufacturing",
+    "48.0703": "Cabinetmaking and millwork",
+    "48.0704": "Wooden boatbuilding technology/technician",
+    "48.0799": "Woodworking, other",
+    "48.0801": "Boilermaking/boilermaker",
+    "48.9999": "Precision production, other",
+    "49.0101": "Aeronautics/aviation/aerospace science and technology, general",
+    "49.0102": "Airline/commercial/professional pilot and flight crew",
+    "49.0104": "Aviation/airway management and operations",
+    "49.0105": "Air traffic controller",
+    "49.0106": "Airline flight attendant",
+    "49.0108": "Flight instructor",
+    "49.0109": "Remote aircraft pilot",
+    "49.0199": "Air transportation, other",
+    "49.0202": "Construction/heavy equipment/earthmoving equipment operation",
+    "49.0205": "Truck and bus driver/commercial vehicle operator and instructor",
+    "49.0206": "Mobile crane operation/operator",
+    "49.0207": "Flagging and traffic control",
+    "49.0208": "Railroad and railway transportation",
+    "49.0209": "Forklift operation/operator",
+    "49.0299": "Ground transportation, other",
+    "49.0303": "Commercial fishing",
+    "49.0304": "Diver, professional and instructor",
+    "49.0309": "Nautical science/merchant marine officer",
+    "49.0399": "Marine transportation, other",
+    "49.9999": "Transportation and materials moving, other",
+    "50.0101": "Visual and performing arts, general",
+    "50.0102": "Digital arts, general",
+    "50.0201": "Crafts/craft design, folk art and artisanry",
+    "50.0301": "Dance, general",
+    "50.0302": "Ballet",
+    "50.0399": "Dance, other",
+    "50.0401": "Design and visual communications, general",
+    "50.0402": "Commercial and advertising art",
+    "50.0404": "Industrial and product design",
+    "50.0406": "Commercial photography",
+    "50.0407": "Fashion/apparel design",
+    "50.0408": "Interior design",
+    "50.0409": "Graphic design",
+    "50.0410": "Illustration",
+    "50.0411": "Game and interactive media design",
+    "50.0499": "Design and applied arts, other",
+    "50.0501": "Drama and dramatics/theatre arts, general",
+    "50.0502": "Technical theatre/theatre design and technology",
+    "50.0504": "Playwriting and screenwriting",
+    "50.0505": "Theatre literature, history and criticism",
+    "50.0506": "Acting",
+    "50.0507": "Directing and theatrical production",
+    "50.0509": "Musical theatre",
+    "50.0510": "Costume design",
+    "50.0511": "Comedy writing and performance",
+    "50.0512": "Theatre and dance",
+    "50.0599": "Drama/theatre arts and stagecraft, other",
+    "50.0601": "Film/cinema/video studies",
+    "50.0602": "Cinematography and film/video production",
+    "50.0605": "Photography",
+    "50.0607": "Documentary production",
+    "50.0699": "Film/video and photographic arts, other",
+    "50.0701": "Art/art studies, general",
+    "50.0702": "Fine/studio arts, general",
+    "50.0703": "Art history, criticism and conservation",
+    "50.0705": "Drawing",
+    "50.0706": "Intermedia/multimedia",
+    "50.0708": "Painting",
+    "50.0709": "Sculpture",
+    "50.0710": "Printmaking",
+    "50.0711": "Ceramic arts and ceramics",
+    "50.0712": "Fibre, textile and weaving arts",
+    "50.0713": "Jewellery arts",
+    "50.0714": "Metal arts",
+    "50.0799": "Fine arts and art studies, other",
+    "50.0901": "Music, general",
+    "50.0902": "Music history, literature and theory",
+    "50.0903": "Music performance, general",
+    "50.0904": "Music theory and composition",
+    "50.0905": "Musicology and ethnomusicology",
+    "50.0906": "Conducting",
+    "50.0907": "Keyboard instruments",
+    "50.0908": "Voice and opera",
+    "50.0910": "Jazz/jazz studies",
+    "50.0911": "Stringed instruments",
+    "50.0912": "Music pedagogy",
+    "50.0913": "Music technology",
+    "50.0914": "Brass instruments",
+    "50.0915": "Woodwind instruments",
+    "50.0916": "Percussion instruments",
+    "50.0917": "Sound arts",
+    "50.0999": "Music, other",
+    "50.1001": "Arts, entertainment, and media management, general",
+    "50.1002": "Fine and studio arts management",
+    "50.1003": "Music management",
+    "50.1004": "Theatre/theatre arts management",
+    "50.1099": "Arts, entertainment, and media management, other",
+    "50.1101": "Community/environmental/socially-engaged art",
+    "50.9999": "Visual and performing arts, other",
+    "51.0000": "Health services/allied health/health sciences, general",
+    "51.0001": "Health and wellness, general",
+    "51.0101": "Chiropractic (DC)",
+    "51.0201": "Communication sciences and disorders, general",
+    "51.0202": "Audiology/audiologist",
+    "51.0203": "Speech-language pathology/pathologist",
+    "51.0204": "Audiology/audiologist and speech-language pathology/pathologist",
+    "51.0299": "Communication disorders sciences and services, other",
+    "51.0401": "Dentistry (DDS, DMD)",
+    "51.0501": "Dental clinical sciences, general (MS, MSc, PhD)",
+    "51.0502": "Advanced general dentistry (Cert., MS, MSc, PhD)",
+    "51.0503": "Oral biology and oral and maxillofacial pathology (MS, MSc, PhD)",
+    "51.0504": "Dental public health and education (Cert., MS, MSc, MPH, PhD, DPH)",
+    "51.0505": "Dental materials (MS, MSc, PhD)",
+    "51.0506": "Endodontics/endodontology (Cert., MS, MSc, PhD)",
+    "51.0507": "Oral/maxillofacial surgery (Cert., MS, MSc, PhD)",
+    "51.0508": "Orthodontics/orthodontology (Cert., MS, MSc, PhD)",
+    "51.0509": "Pediatric dentistry/pedodontics (Cert., MS, MSc, PhD)",
+    "51.0510": "Periodontics/periodontology (Cert., MS, MSc, PhD)",
+    "51.0511": "Prosthodontics/prosthodontology (Cert., MS, MSc, PhD)",
+    "51.0512": "Digital dentistry (Cert., MS, MSc, PhD)",
+    "51.0513": "Geriatric dentistry (Cert., MS, MSc, PhD)",
+    "51.0514": "Implantology/implant dentistry (Cert., MS, MSc, PhD)",
+    "51.0599": "Advanced/graduate dentistry and oral sciences, other (Cert., MS, MSc, PhD)",
+    "51.0601": "Dental assisting/assistant",
+    "51.0602": "Dental hygiene/hygienist",
+    "51.0603": "Dental laboratory technology/technician",
+    "51.0699": "Dental support services and allied professions, other",
+    "51.0701": "Health/health care administration/management",
+    "51.0702": "Hospital and health care facilities administration/management",
+    "51.0703": "Health unit coordinator/ward clerk",
+    "51.0704": "Health unit manager/ward supervisor",
+    "51.0705": "Medical office management/administration",
+    "51.0706": "Health information/medical records administration/administrator",
+    "51.0707": "Health information/medical records technology/technician",
+    "51.0708": "Medical transcription/transcriptionist",
+    "51.0709": "Medical office computer specialist/assistant",
+    "51.0710": "Medical office assistant/specialist",
+    "51.0711": "Medical/health management and clinical assistant/specialist",
+    "51.0712": "Medical reception/receptionist",
+    "51.0713": "Medical insurance coding specialist/coder",
+    "51.0714": "Medical insurance specialist/medical biller",
+    "51.0715": "Health/medical claims examiner",
+    "51.0716": "Medical administrative/executive assistant and medical secretary",
+    "51.0717": "Medical staff services technology/technician",
+    "51.0718": "Long term care administration/management",
+    "51.0719": "Clinical research coordinator",
+    "51.0720": "Regulatory science/affairs",
+    "51.0721": "Disease registry data management",
+    "51.0722": "Healthcare innovation",
+    "51.0723": "Healthcare information privacy assurance and security",
+    "51.0799": "Health and medical administrative services, other",
+    "51.0801": "Medical/clinical assistant",
+    "51.0802": "Clinical/medical laboratory assistant",
+    "51.0803": "Occupational therapist assistant",
+    "51.0805": "Pharmacy technician/assistant",
+    "51.0806": "Physical therapy assistant",
+    "51.0809": "Anesthesiologist assistant",
+    "51.0810": "Emergency care attendant (EMT ambulance)",
+    "51.0811": "Pathology/pathologist assistant",
+    "51.0812": "Respiratory therapy technician/assistant",
+    "51.0813": "Chiropractic assistant/technician",
+    "51.0814": "Radiologist assistant",
+    "51.0815": "Lactation consultant",
+    "51.0816": "Speech-language pathology assistant",
+    "51.0817": "Rehabilitation assistant",
+    "51.0899": "Allied health and medical assisting services, other",
+    "51.0901": "Cardiovascular technology/technologist",
+    "51.0902": "Electrocardiograph technology/technician",
+    "51.0903": "Electroneurodiagnostic/electroencephalographic technology/technologist",
+    "51.0904": "Emergency medical technology/technician (EMT paramedic)",
+    "51.0905": "Nuclear medical technology/technologist",
+    "51.0906": "Perfusion technology/perfusionist",
+    "51.0907": "Radiation therapist/therapeutic radiographer",
+    "51.0908": "Respiratory care therapy/therapist",
+    "51.0909": "Surgical technology/technologist",
+    "51.0910": "Diagnostic medical sonography/sonographer and ultrasound technician",
+    "51.0911": "Medical radiation technologist/radiographer",
+    "51.0912": "Physician assistant/associate",
+    "51.0913": "Athletic training/trainer",
+    "51.0914": "Gene/genetic therapy",
+    "51.0915": "Cardiopulmonary technology/technologist",
+    "51.0916": "Radiation protection/health physics technician",
+    "51.0917": "Polysomnography",
+    "51.0918": "Hearing instrument specialist",
+    "51.0919": "Mammography technology/technician",
+    "51.0920": "Magnetic resonance imaging (MRI) technology/technician",
+    "51.0921": "Hyperbaric medicine technology/technician",
+    "51.0922": "Intraoperative neuromonitoring technology/technician",
+    "51.0923": "Orthopedic technology/technician",
+    "51.0924": "Combined laboratory and X-ray technology",
+    "51.0999": "Allied health diagnostic, intervention and treatment professions, other",
+    "51.1001": "Blood bank technology specialist",
+    "51.1002": "Cytotechnology/cytotechnologist",
+    "51.1003": "Hematology technology/technician",
+    "51.1004": "Clinical/medical laboratory technician",
+    "51.1005": "Clinical laboratory science/medical technology/technologist",
+    "51.1006": "Ophthalmic laboratory technology/technician",
+    "51.1007": "Histologic technology/histotechnologist",
+    "51.1008": "Histologic technician",
+    "51.1009": "Phlebotomy technician/phlebotomist",
+    "51.1010": "Cytogenetics/genetics/clinical genetics technology/technologist",
+    "51.1011": "Renal/dialysis technologist/technician",
+    "51.1012": "Sterile processing technology/technician",
+    "51.1099": "Clinical/medical laboratory science/research and allied professions, other",
+    "51.1101": "Pre-dentistry studies",
+    "51.1102": "Pre-medicine/pre-medical studies",
+    "51.1103": "Pre-pharmacy studies",
+    "51.1105": "Pre-nursing studies",
+    "51.1106": "Pre-chiropractic studies",
+    "51.1107": "Pre-occupational therapy studies",
+    "51.1108": "Pre-optometry studies",
+    "51.1109": "Pre-physical therapy studies",
+    "51.1110": "Pre-art therapy studies",
+    "51.1111": "Pre-physician assistant studies",
+    "51.1199": "Health/medical preparatory programs, other",
+    "51.1201": "Medicine (MD)",
+    "51.1202": "Osteopathic medicine/osteopathy (DO)",
+    "51.1203": "Podiatric medicine/podiatry (DPM)",
+    "51.1299": "Medicine, other",
+    "51.1401": "Medical science/scientist (MS, MSc, PhD)",
+    "51.1402": "Clinical and translational science (Cert., MS, MSc, PhD)",
+    "51.1403": "Pain management (Cert., MS, MSc, PhD)",
+    "51.1404": "Temporomandibular disorders and orofacial pain (Cert., MS, MSc, PhD)",
+    "51.1405": "Tropical medicine (Cert., MS, MSc, PhD)",
+    "51.1499": "Medical clinical sciences/graduate medical studies, other",
+    "51.1501": "Substance abuse/addiction counselling",
+    "51.1502": "Psychiatric/mental health services technician",
+    "51.1503": "Clinical/medical social work",
+    "51.1504": "Community health services/liaison/counselling",
+    "51.1505": "Marriage and family therapy/counselling",
+    "51.1506": "Clinical pastoral counselling/patient counselling",
+    "51.1507": "Psychoanalysis and psychotherapy",
+    "51.1508": "Mental health counselling/counsellor",
+    "51.1509": "Genetic counselling/counsellor",
+    "51.1510": "Infant/toddler mental health services",
+    "51.1511": "Medical family therapy/therapist",
+    "51.1512": "Hospice and palliative care",
+    "51.1513": "Trauma counselling",
+    "51.1580": "Cannabis abuse/cannabis addiction counselling",
+    "51.1599": "Mental and social health services and allied professions, other",
+    "51.1701": "Optometry (OD)",
+    "51.1801": "Opticianry/ophthalmic dispensing optician",
+    "51.1802": "Optometric technician/assistant",
+    "51.1803": "Ophthalmic technician/technologist",
+    "51.1804": "Orthoptics/orthoptist",
+    "51.1899": "Ophthalmic and optometric support services and allied professions, other",
+    "51.2001": "Pharmacy (PharmD, BS, BSc, BPharm)",
+    "51.2002": "Pharmacy administration and pharmacy policy and regulatory affairs (MS, MSc, PhD)",
+    "51.2003": "Pharmaceutics and drug design (MS, MSc, PhD)",
+    "51.2004": "Medicinal and pharmaceutical chemistry (MS, MSc, PhD)",
+    "51.2005": "Natural products chemistry and pharmacognosy (MS, MSc, PhD)",
+    "51.2006": "Clinical and industrial drug development (MS, MSc, PhD)",
+    "51.2007": "Pharmacoeconomics/pharmaceutical economics (MS, MSc, PhD)",
+    "51.2008": "Clinical, hospital and managed care pharmacy (MS, MSc, PhD)",
+    "51.2009": "Industrial and physical pharmacy and cosmetic sciences (MS, MSc, PhD)",
+    "51.2010": "Pharmaceutical sciences",
+    "51.2011": "Pharmaceutical marketing and management",
+    "51.2099": "Pharmacy, pharmaceutical sciences and administration, other",
+    "51.2201": "Public health, general (BPH, MPH, DPH)",
+    "51.2202": "Environmental health",
+    "51.2205": "Health/medical physics",
+    "51.2206": "Occupational health and industrial hygiene",
+    "51.2207": "Public health education and promotion",
+    "51.2208": "Community health and preventive medicine",
+    "51.2209": "Maternal and child health",
+    "51.2210": "International public health/international health",
+    "51.2211": "Health services administration",
+    "51.2212": "Behavioural aspects of health",
+    "51.2213": "Patient safety and healthcare quality",
+    "51.2214": "Public health genetics",
+    "51.2280": "Cannabis-related public health",
+    "51.2299": "Public health, other",
+    "51.2300": "Rehabilitation and therapeutic professions, general",
+    "51.2301": "Art therapy/therapist",
+    "51.2302": "Dance therapy/therapist",
+    "51.2305": "Music therapy/therapist",
+    "51.2306": "Occupational therapy/therapist",
+    "51.2307": "Orthotist/prosthetist",
+    "51.2308": "Physical therapy/therapist",
+    "51.2309": "Therapeutic recreation/recreational therapy",
+    "51.2310": "Vocational rehabilitation counselling/counsellor",
+    "51.2311": "Kinesiotherapy/kinesiotherapist",
+    "51.2312": "Assistive/augmentative technology and rehabilitation engineering",
+    "51.2313": "Animal-assisted therapy",
+    "51.2314": "Rehabilitation science",
+    "51.2315": "Drama therapy/therapist",
+    "51.2316": "Horticulture therapy/therapist",
+    "51.2317": "Play therapy/therapist",
+    "51.2399": "Rehabilitation and therapeutic professions, other",
+    "51.2601": "Health aide",
+    "51.2602": "Home health aide/home attendant",
+    "51.2603": "Medication aide",
+    "51.2604": "Rehabilitation aide",
+    "51.2605": "Physical therapy technician/aide",
+    "51.2699": "Health aides/attendants/orderlies, other",
+    "51.2703": "Medical illustration/medical illustrator",
+    "51.2706": "Medical informatics",
+    "51.2799": "Medical illustration and informatics, other",
+    "51.3101": "Dietetics/dietitian (RD)",
+    "51.3102": "Clinical nutrition/nutritionist",
+    "51.3103": "Dietetic technician (DTR)",
+    "51.3104": "Dietitian assistant",
+    "51.3199": "Dietetics and clinical nutrition services, other",
+    "51.3201": "Bioethics/medical ethics",
+    "51.3202": "Health professions education",
+    "51.3203": "Nursing education",
+    "51.3204": "Medical/health humanities",
+    "51.3205": "History of medicine",
+    "51.3206": "Arts in medicine/health",
+    "51.3299": "Health professions education, ethics, and humanities, other",
+    "51.3300": "Alternative and complementary medicine and medical systems, general",
+    "51.3301": "Acupuncture and oriental medicine",
+    "51.3302": "Traditional Chinese medicine and Chinese herbology",
+    "51.3303": "Naturopathic medicine/naturopathy (ND, NMD)",
+    "51.3304": "Homeopathic medicine/homeopathy",
+    "51.3305": "Ayurvedic medicine/Ayurveda",
+    "51.3306": "Holistic/integrative health",
+    "51.3399": "Alternative and complementary medicine and medical systems, other",
+    "51.3401": "Direct entry midwifery (LM, CPM)",
+    "51.3499": "Alternative and complementary medical support services, other",
+    "51.3501": "Massage therapy/therapeutic massage",
+    "51.3502": "Asian bodywork therapy",
+    "51.3503": "Somatic bodywork",
+    "51.3599": "Somatic bodywork and related therapeutic services, other",
+    "51.3601": "Movement therapy",
+    "51.3602": "Yoga teacher training/yoga therapy",
+    "51.3603": "Hypnotherapy/hypnotherapist",
+    "51.3699": "Movement and mind-body therapies, other",
+    "51.3701": "Aromatherapy",
+    "51.3702": "Herbalism/herbalist",
+    "51.3703": "Polarity therapy",
+    "51.3704": "Reiki",
+    "51.3799": "Energy-based and biologically-based therapies, other",
+    "51.3801": "Registered nursing/registered nurse (RN, ASN, BSN, BScN, MSN, MScN)",
+    "51.3802": "Nursing administration (Cert., MSN, MS, MScN, MSc, PhD)",
+    "51.3803": "Adult health nurse/nursing",
+    "51.3804": "Nurse anesthetist",
+    "51.3805": "Primary health care nurse/nursing and family practice nurse/nursing",
+    "51.3806": "Maternal/child health and neonatal nurse/nursing",
+    "51.3807": "Nurse midwife/nursing midwifery",
+    "51.3808": "Nursing science (MS, MSc, PhD)",
+    "51.3809": "Pediatric nurse/nursing",
+    "51.3810": "Psychiatric/mental health nurse/nursing",
+    "51.3811": "Public health/community nurse/nursing",
+    "51.3812": "Perioperative/operating room and surgical nurse/nursing",
+    "51.3813": "Clinical nurse specialist",
+    "51.3814": "Critical care nurse/nursing",
+    "51.3815": "Occupational and environmental health nurse/nursing",
+    "51.3816": "Emergency room/trauma nurse/nursing",
+    "51.3818": "Nursing practice",
+    "51.3819": "Palliative care nurse/nursing",
+    "51.3820": "Clinical nurse leader",
+    "51.3821": "Geriatric nurse/nursing",
+    "51.3822": "Women's health nurse/nursing",
+    "51.3823": "Registered psychiatric nurse/nursing",
+    "51.3824": "Forensic nursing",
+    "51.3899": "Registered nursing, nursing administration, nursing research and clinical nursing, other",
+    "51.3901": "Licensed practical/vocational nurse training (LPN, LVN, RPN, Cert., Dipl., AAS)",
+    "51.3902": "Nursing assistant/aide and patient care assistant/aide",
+    "51.3999": "Practical nursing, vocational nursing and nursing assistants, other",
+    "51.9980": "Cannabis-related health professions and clinical sciences, other",
+    "51.9999": "Health professions and related programs, other",
+    "52.0101": "Business/commerce, general",
+    "52.0201": "Business administration and management, general",
+    "52.0202": "Purchasing, procurement/acquisitions and contracts management",
+    "52.0203": "Logistics, materials, and supply chain management",
+    "52.0204": "Office management and supervision",
+    "52.0205": "Operations management and supervision",
+    "52.0206": "Non-profit/public/organizational management",
+    "52.0207": "Customer service management",
+    "52.0208": "E-commerce/electronic commerce",
+    "52.0209": "Transportation/mobility management",
+    "52.0210": "Research and development management",
+    "52.0211": "Project management",
+    "52.0212": "Retail management",
+    "52.0213": "Organizational leadership",
+    "52.0214": "Research administration",
+    "52.0215": "Risk management",
+    "52.0216": "Science/technology management",
+    "52.0299": "Business administration, management and operations, other",
+    "52.0301": "Accounting",
+    "52.0302": "Accounting technology/technician and bookkeeping",
+    "52.0303": "Auditing",
+    "52.0304": "Accounting and finance",
+    "52.0305": "Accounting and business/management",
+    "52.0399": "Accounting and related services, other",
+    "52.0401": "Administrative assistant and secretarial science, general",
+    "52.0402": "Executive assistant/executive secretary",
+    "52.0406": "Receptionist",
+    "52.0407": "Business/office automation/technology/data entry",
+    "52.0408": "General office occupations and clerical services",
+    "52.0409": "Parts, warehousing and inventory management operations",
+    "52.0410": "Traffic, customs and transportation clerk/technician",
+    "52.0411": "Customer service support/call centre/teleservice operation",
+    "52.0499": "Business operations support and assistant services, other",
+    "52.0501": "Business/corporate communications, general",
+    "52.0502": "Grantsmanship",
+    "52.0599": "Business/corporate communications, other",
+    "52.0601": "Business/managerial economics",
+    "52.0701": "Entrepreneurship/entrepreneurial studies",
+    "52.0702": "Franchising and franchise operations",
+    "52.0703": "Small business administration/management",
+    "52.0704": "Social entrepreneurship",
+    "52.0799": "Entrepreneurial and small business operations, other",
+    "52.0801": "Finance, general",
+    "52.0803": "Banking and financial support services",
+    "52.0804": "Financial planning and services",
+    "52.0806": "International finance",
+    "52.0807": "Investments and securities",
+    "52.0808": "Public finance",
+    "52.0809": "Credit management",
+    "52.0810": "Financial risk management",
+    "52.0899": "Finance and financial management services, other",
+    "52.0901": "Hospitality administration/management, general",
+    "52.0903": "Tourism and travel services management",
+    "52.0904": "Hotel/motel administration/management",
+    "52.0905": "Restaurant/food services management",
+    "52.0906": "Resort management",
+    "52.0907": "Meeting and event planning",
+    "52.0908": "Casino management",
+    "52.0909": "Hotel, motel, and restaurant management",
+    "52.0910": "Brewery/brewpub management",
+    "52.0999": "Hospitality administration/management, other",
+    "52.1001": "Human resources management/personnel administration, general",
+    "52.1002": "Labour and industrial relations",
+    "52.1003": "Organizational behaviour studies",
+    "52.1004": "Labour studies",
+    "52.1005": "Human resources development",
+    "52.1006": "Executive/career coaching",
+    "52.1099": "Human resources management and services, other",
+    "52.1101": "International business/trade/commerce",
+    "52.1201": "Management information systems, general",
+    "52.1206": "Information resources management",
+    "52.1207": "Knowledge management",
+    "52.1299": "Management information systems and services, other",
+    "52.1301": "Management science",
+    "52.1302": "Business statistics",
+    "52.1304": "Actuarial science",
+    "52.1399": "Management sciences and quantitative methods, other",
+    "52.1401": "Marketing/marketing management, general",
+    "52.1402": "Marketing research",
+    "52.1403": "International marketing",
+    "52.1404": "Digital marketing",
+    "52.1499": "Marketing, other",
+    "52.1501": "Real estate",
+    "52.1601": "Taxation",
+    "52.1701": "Insurance",
+    "52.1801": "Sales, distribution and marketing operations, general",
+    "52.1802": "Merchandising and buying operations",
+    "52.1803": "Retailing and retail operations",
+    "52.1804": "Selling skills and sales operations",
+    "52.1880": "Cannabis-related selling skills and sales operations",
+    "52.1899": "General sales, merchandising and related marketing operations, other",
+    "52.1901": "Auctioneering",
+    "52.1902": "Fashion merchandising",
+    "52.1903": "Fashion modelling",
+    "52.1904": "Apparel and accessories marketing operations",
+    "52.1905": "Tourism and travel services marketing operations",
+    "52.1906": "Tourism promotion operations",
+    "52.1907": "Vehicle and vehicle parts and accessories marketing operations",
+    "52.1908": "Business and personal/financial services marketing operations",
+    "52.1909": "Special products marketing operations",
+    "52.1910": "Hospitality and recreation marketing operations",
+    "52.1980": "Cannabis-related marketing and marketing operations",
+    "52.1999": "Specialized sales, merchandising and marketing operations, other",
+    "52.2001": "Construction management, general",
+    "52.2002": "Construction project management",
+    "52.2099": "Construction management, other",
+    "52.2101": "Telecommunications management",
+    "52.9999": "Business, management, marketing and related support services, other",
+    "53.0101": "Regular/general high school/secondary diploma programs",
+    "53.0102": "College/university preparatory programs",
+    "53.0103": "Vocational high school and secondary business/vocational-industrial/occupational diploma programs",
+    "53.0104": "Honours/regents high school/secondary diploma programs",
+    "53.0105": "Adult high school/secondary diploma programs",
+    "53.0199": "High school/secondary diploma programs, other",
+    "53.0201": "High school equivalency/GED certificate programs",
+    "53.0202": "High school certificate of competence programs",
+    "53.0203": "Certificate of IEP completion programs",
+    "53.0299": "High school/secondary certificate programs, other",
+    "54.0101": "History, general",
+    "54.0102": "American history (United States)",
+    "54.0103": "European history",
+    "54.0104": "History and philosophy of science and technology",
+    "54.0105": "Public/applied history",
+    "54.0106": "Asian history",
+    "54.0107": "Canadian history",
+    "54.0108": "Military history",
+    "54.0199": "History, other",
+    "55.0101": "French language and literature, general",
+    "55.1301": "French writing, general",
+    "55.1302": "French creative writing",
+    "55.1303": "French professional, technical, business, and scientific writing",
+    "55.1304": "French rhetoric and composition",
+    "55.1399": "French rhetoric and composition/writing studies, other",
+    "55.1401": "French literature, general",
+    "55.1403": "Canadian literature, French",
+    "55.1404": "Literature of France and the French community, French",
+    "55.1405": "Children's and adolescent literature, French",
+    "55.1499": "French literature, other",
+    "55.9999": "French language and literature/letters, other",
+    "60.0101": "Oral and maxillofacial surgery residency programs",
+    "60.0102": "Dental public health residency programs",
+    "60.0103": "Endodontics residency programs",
+    "60.0104": "Oral and maxillofacial pathology residency programs",
+    "60.0105": "Orthodontics residency programs",
+    "60.0106": "Pediatric dentistry residency programs",
+    "60.0107": "Periodontology residency programs",
+    "60.0108": "Prosthodontics residency programs",
+    "60.0109": "Oral and maxillofacial radiology residency programs",
+    "60.0110": "Implantology fellowship programs",
+    "60.0199": "Dental residency/fellowship programs, other",
+    "60.0301": "Veterinary anesthesiology residency programs",
+    "60.0302": "Veterinary dentistry residency programs",
+    "60.0303": "Veterinary dermatology residency programs",
+    "60.0304": "Veterinary emergency and critical care medicine residency programs",
+    "60.0305": "Veterinary internal medicine residency programs",
+    "60.0306": "Laboratory animal medicine residency programs",
+    "60.0307": "Veterinary microbiology residency programs",
+    "60.0308": "Veterinary nutrition residency programs",
+    "60.0309": "Veterinary ophthalmology residency programs",
+    "60.0310": "Veterinary pathology residency programs",
+    "60.0311": "Veterinary practice residency programs",
+    "60.0312": "Veterinary preventive medicine residency programs",
+    "60.0313": "Veterinary radiology residency programs",
+    "60.0314": "Veterinary surgery residency programs",
+    "60.0315": "Theriogenology residency programs",
+    "60.0316": "Veterinary toxicology residency programs",
+    "60.0317": "Zoological medicine residency programs",
+    "60.0318": "Poultry veterinarian residency programs",
+    "60.0319": "Veterinary behaviourist residency programs",
+    "60.0320": "Veterinary clinical pharmacology residency programs",
+    "60.0399": "Veterinary residency/fellowship programs, other",
+    "60.0701": "Nurse practitioner residency/fellowship programs, general",
+    "60.0702": "Combined nurse practitioner residency/fellowship programs",
+    "60.0703": "Acute care nurse practitioner residency/fellowship programs",
+    "60.0704": "Adult/gerontology acute care nurse practitioner residency/fellowship programs",
+    "60.0705": "Adult/gerontology critical care nurse practitioner residency/fellowship programs",
+    "60.0706": "Cardiology/cardiovascular nurse practitioner residency/fellowship programs",
+    "60.0707": "Clinical informatics nurse practitioner residency/fellowship programs",
+    "60.0708": "Dermatology nurse practitioner residency/fellowship programs",
+    "60.0709": "Developmental and behavioural pediatrics nurse practitioner residency/fellowship programs",
+    "60.0710": "Diabetes nurse practitioner residency/fellowship programs",
+    "60.0711": "Emergency medicine nurse practitioner residency/fellowship programs",
+    "60.0712": "Endocrinology nurse practitioner residency/fellowship programs",
+    "60.0713": "Family medicine nurse practitioner residency/fellowship programs",
+    "60.0714": "Gastroenterology and hepatology nurse practitioner residency/fellowship programs",
+    "60.0715": "Gastroenterology nurse practitioner residency/fellowship programs",
+    "60.0716": "Genetics nurse practitioner residency/fellowship programs",
+    "60.0717": "Gerontology nurse practitioner residency/fellowship programs",
+    "60.0718": "Global health nurse practitioner residency/fellowship programs",
+    "60.0719": "Hematology-oncology nurse practitioner residency/fellowship programs",
+    "60.0720": "Hepatology nurse practitioner residency/fellowship programs",
+    "60.0721": "Home-based primary care nurse practitioner residency/fellowship programs",
+    "60.0722": "Hospice and palliative medicine nurse practitioner residency/fellowship programs",
+    "60.0723": "Hospital medicine nurse practitioner residency/fellowship programs",
+    "60.0724": "Infectious diseases nurse practitioner residency/fellowship programs",
+    "60.0725": "Neonatal nurse practitioner residency/fellowship programs",
+    "60.0726": "Nephrology nurse practitioner residency/fellowship programs",
+    "60.0727": "Neurology nurse practitioner residency/fellowship programs",
+    "60.0728": "Neuroscience nurse practitioner residency/fellowship programs",
+    "60.0729": "Obstetrics and gynecology nurse practitioner residency/fellowship programs",
+    "60.0730": "Occupational health nurse practitioner residency/fellowship programs",
+    "60.0731": "Orthopedic nurse practitioner residency/fellowship programs",
+    "60.0732": "Orthopedic surgery nurse practitioner residency/fellowship programs",
+    "60.0733": "Pain management nurse practitioner residency/fellowship programs",
+    "60.0734": "Palliative care nurse practitioner residency/fellowship programs",
+    "60.0735": "Pediatric hematology-oncology nurse practitioner residency/fellowship programs",
+    "60.0736": "Pediatric nurse practitioner residency/fellowship programs",
+    "60.0737": "Pediatric rehabilitation nurse practitioner residency/fellowship programs",
+    "60.0738": "Psychiatric/mental health nurse practitioner residency/fellowship programs",
+    "60.0739": "Public health/community health nurse practitioner residency/fellowship programs",
+    "60.0740": "Pulmonary nurse practitioner residency/fellowship programs",
+    "60.0741": "Rheumatology nurse practitioner residency/fellowship programs",
+    "60.0742": "Rural health nurse practitioner residency/fellowship programs",
+    "60.0743": "Sleep medicine nurse practitioner residency/fellowship programs",
+    "60.0744": "Surgical and critical care nurse practitioner residency/fellowship programs",
+    "60.0745": "Surgical wound and reconstruction nurse practitioner residency/fellowship programs",
+    "60.0746": "Transplantation nurse practitioner residency/fellowship programs",
+    "60.0747": "Trauma and critical care nurse practitioner residency/fellowship programs",
+    "60.0748": "Urgent care nurse practitioner residency/fellowship programs",
+    "60.0749": "Urology nurse practitioner residency/fellowship programs",
+    "60.0750": "Women's health nurse practitioner residency/fellowship programs",
+    "60.0751": "Wound care nurse practitioner residency/fellowship programs",
+    "60.0799": "Nurse practitioner residency/fellowship programs, other",
+    "60.0801": "Pharmacy residency/fellowship programs, general",
+    "60.0802": "Combined pharmacy residency/fellowship programs",
+    "60.0803": "Ambulatory care pharmacy residency/fellowship programs",
+    "60.0804": "Cardiology pharmacy residency/fellowship programs",
+    "60.0805": "Clinical pharmacogenomics pharmacy residency/fellowship programs",
+    "60.0806": "Community/community-based pharmacy residency/fellowship programs",
+    "60.0807": "Corporate pharmacy leadership residency/fellowship programs",
+    "60.0808": "Critical care pharmacy residency/fellowship programs",
+    "60.0809": "Drug information pharmacy residency/fellowship programs",
+    "60.0810": "Emergency medicine pharmacy residency/fellowship programs",
+    "60.0811": "Family medicine pharmacy residency/fellowship programs",
+    "60.0812": "Geriatric pharmacy residency/fellowship programs",
+    "60.0813": "Health system medication management pharmacy residency/fellowship programs",
+    "60.0814": "Health system pharmacy administration and leadership residency/fellowship programs",
+    "60.0815": "Infectious diseases pharmacy residency/fellowship programs",
+    "60.0816": "Internal medicine pharmacy residency/fellowship programs",
+    "60.0817": "Investigational drugs and research pharmacy residency/fellowship programs",
+    "60.0818": "Managed care pharmacy residency/fellowship programs",
+    "60.0819": "Medication systems and operations pharmacy residency/fellowship programs",
+    "60.0820": "Medication-use safety pharmacy residency/fellowship programs",
+    "60.0821": "Neonatal pharmacy residency/fellowship programs",
+    "60.0822": "Nephrology pharmacy residency/fellowship programs",
+    "60.0823": "Neurology pharmacy residency/fellowship programs",
+    "60.0824": "Nuclear pharmacy residency/fellowship programs",
+    "60.0825": "Nutrition support pharmacy residency/fellowship programs",
+    "60.0826": "Oncology pharmacy residency/fellowship programs",
+    "60.0827": "Palliative care/pain management pharmacy residency/fellowship programs",
+    "60.0828": "Pediatric pharmacy residency/fellowship programs",
+    "60.0829": "Pharmacotherapy pharmacy residency/fellowship programs",
+    "60.0830": "Pharmacy informatics pharmacy residency/fellowship programs",
+    "60.0831": "Psychiatric pharmacy residency/fellowship programs",
+    "60.0832": "Transplantation pharmacy residency/fellowship programs",
+    "60.0899": "Pharmacy residency/fellowship programs, other",
+    "60.0901": "Physician assistant residency/fellowship programs, general",
+    "60.0902": "Combined physician assistant residency/fellowship programs",
+    "60.0903": "Acute care medicine physician assistant residency/fellowship programs",
+    "60.0904": "Acute care surgery physician assistant residency/fellowship programs",
+    "60.0905": "Cardiology physician assistant residency/fellowship programs",
+    "60.0906": "Cardiothoracic surgery physician assistant residency/fellowship programs",
+    "60.0907": "Critical care physician assistant residency/fellowship programs",
+    "60.0908": "Critical care and trauma surgery physician assistant residency/fellowship programs",
+    "60.0909": "Emergency medicine physician assistant residency/fellowship programs",
+    "60.0910": "ENT surgery physician assistant residency/fellowship programs",
+    "60.0911": "Family medicine physician assistant residency/fellowship programs",
+    "60.0912": "Geriatrics physician assistant residency/fellowship programs",
+    "60.0913": "Hematology-oncology physician assistant residency/fellowship programs",
+    "60.0914": "Hepatobiliary surgery physician assistant residency/fellowship programs",
+    "60.0915": "Hospitalist physician assistant residency/fellowship programs",
+    "60.0916": "Neurosurgery physician assistant residency/fellowship programs",
+    "60.0917": "Orthopedic surgery physician assistant residency/fellowship programs",
+    "60.0918": "Pediatric surgery physician assistant residency/fellowship programs",
+    "60.0919": "Transplant surgery physician assistant residency/fellowship programs",
+    "60.0920": "Urology physician assistant residency/fellowship programs",
+    "60.0999": "Physician assistant residency/fellowship programs, other",
+    "60.9999": "Health professions residency/fellowship programs, other",
+    "61.0101": "Combined medical residency/fellowship programs, general",
+    "61.0102": "Diagnostic radiology/nuclear medicine combined specialty programs",
+    "61.0103": "Emergency medicine/anesthesiology combined specialty programs",
+    "61.0104": "Family medicine/emergency medicine combined specialty programs",
+    "61.0105": "Family medicine/osteopathic neuromusculoskeletal medicine combined specialty programs",
+    "61.0106": "Family medicine/preventive medicine combined specialty programs",
+    "61.0107": "Family medicine/psychiatry combined specialty programs",
+    "61.0108": "Internal medicine/anesthesiology combined specialty programs",
+    "61.0109": "Internal medicine/dermatology combined specialty programs",
+    "61.0110": "Internal medicine/emergency medicine combined specialty programs",
+    "61.0111": "Internal medicine/emergency medicine/critical care medicine combined specialty programs",
+    "61.0112": "Internal medicine/family medicine combined specialty programs",
+    "61.0113": "Internal medicine/medical genetics and genomics combined specialty programs",
+    "61.0114": "Internal medicine/neurology combined specialty programs",
+    "61.0115": "Internal medicine/pediatrics combined specialty programs",
+    "61.0116": "Internal medicine/preventive medicine combined specialty programs",
+    "61.0117": "Internal medicine/psychiatry combined specialty programs",
+    "61.0118": "Medical genetics and genomics/maternal-fetal medicine combined specialty programs",
+    "61.0119": "Pediatrics/anesthesiology combined specialty programs",
+    "61.0120": "Pediatrics/emergency medicine combined specialty programs",
+    "61.0121": "Pediatrics/medical genetics and genomics combined specialty programs",
+    "61.0122": "Pediatrics/physical medicine and rehabilitation combined specialty programs",
+    "61.0123": "Pediatrics/psychology/child and adolescent psychology combined specialty programs",
+    "61.0124": "Psychiatry/neurology combined specialty programs",
+    "61.0125": "Reproductive endocrinology and infertility/medical genetics and genomics combined specialty programs",
+    "61.0199": "Combined medical residency/fellowship programs, other",
+    "61.0202": "Critical care medicine fellowship programs",
+    "61.0203": "Geriatric medicine fellowship programs",
+    "61.0204": "Health policy fellowship programs",
+    "61.0205": "Hospice and palliative medicine fellowship programs",
+    "61.0206": "Integrative medicine fellowship programs",
+    "61.0207": "Medical education fellowship programs",
+    "61.0208": "Medical toxicology fellowship programs",
+    "61.0209": "Neuromuscular medicine fellowship programs",
+    "61.0210": "Pain medicine fellowship programs",
+    "61.0211": "Healthcare simulation fellowship programs",
+    "61.0212": "Sleep medicine fellowship programs",
+    "61.0213": "Sports medicine fellowship programs",
+    "61.0214": "Surgery of the hand fellowship programs",
+    "61.0215": "Telemedicine fellowship programs",
+    "61.0216": "Undersea and hyperbaric medicine fellowship programs",
+    "61.0217": "Wilderness medicine fellowship programs",
+    "61.0218": "Women's health fellowship programs",
+    "61.0299": "Multiple-pathway medical fellowship programs, other",
+    "61.0301": "Allergy and immunology fellowship programs",
+    "61.0399": "Allergy and immunology residency/fellowship programs, other",
+    "61.0401": "Anesthesiology residency programs",
+    "61.0499": "Anesthesiology residency/fellowship programs, other",
+    "61.0501": "Dermatology residency programs",
+    "61.0502": "Dermatopathology fellowship programs",
+    "61.0503": "Pediatric dermatology fellowship programs",
+    "61.0599": "Dermatology residency/fellowship programs, other",
+    "61.0601": "Emergency medicine residency programs",
+    "61.0602": "Disaster medicine fellowship programs",
+    "61.0603": "Emergency medical services fellowship programs",
+    "61.0699": "Emergency medicine residency/fellowship programs, other",
+    "61.0701": "Family medicine residency programs",
+    "61.0799": "Family medicine residency/fellowship programs, other",
+    "61.0801": "Internal medicine residency programs",
+    "61.0804": "Cardiovascular disease fellowship programs",
+    "61.0805": "Clinical cardiac electrophysiology fellowship programs",
+    "61.0806": "Endocrinology, diabetes and metabolism fellowship programs",
+    "61.0807": "Gastroenterology fellowship programs",
+    "61.0808": "Hematology fellowship programs",
+    "61.0809": "Hematology-oncology fellowship programs",
+    "61.0810": "Infectious disease fellowship programs",
+    "61.0811": "Interventional cardiology fellowship programs",
+    "61.0812": "Nephrology fellowship programs",
+    "61.0813": "Medical oncology fellowship programs",
+    "61.0814": "Pulmonary disease fellowship programs",
+    "61.0816": "Rheumatology fellowship programs",
+    "61.0818": "Transplant hepatology fellowship programs",
+    "61.0899": "Internal medicine residency/fellowship programs, other",
+    "61.0901": "Clinical biochemical genetics residency programs",
+    "61.0902": "Clinical genetics and genomics residency programs",
+    "61.0903": "Laboratory genetics and genomics residency programs",
+    "61.0904": "Medical biochemical genetics residency programs",
+    "61.0999": "Medical genetics and genomics residency/fellowship programs, other",
+    "61.1001": "Neurological surgery residency programs",
+    "61.1099": "Neurological surgery residency/fellowship programs, other",
+    "61.1101": "Neurology residency programs",
+    "61.1102": "Child neurology residency programs",
+    "61.1103": "Clinical neurophysiology fellowship programs",
+    "61.1104": "Epilepsy fellowship programs",
+    "61.1105": "Headache medicine fellowship programs",
+    "61.1106": "Neurodevelopmental disabilities fellowship programs",
+    "61.1107": "Vascular neurology fellowship programs",
+    "61.1199": "Neurology residency/fellowship programs, other",
+    "61.1201": "Nuclear medicine residency programs",
+    "61.1299": "Nuclear medicine residency/fellowship programs, other",
+    "61.1301": "Obstetrics and gynecology residency programs",
+    "61.1302": "Gynecologic oncology fellowship programs",
+    "61.1303": "Maternal and fetal medicine fellowship programs",
+    "61.1304": "Reproductive endocrinology/infertility fellowship programs",
+    "61.1399": "Obstetrics and gynecology residency/fellowship programs, other",
+    "61.1401": "Ophthalmology residency programs",
+    "61.1499": "Ophthalmology residency/fellowship programs, other",
+    "61.1501": "Orthopedic surgery residency programs",
+    "61.1502": "Musculoskeletal oncology fellowship programs",
+    "61.1503": "Orthopaedic sports medicine fellowship programs",
+    "61.1504": "Orthopedic surgery of the spine fellowship programs",
+    "61.1505": "Pediatric orthopedics fellowship programs",
+    "61.1599": "Orthopedic surgery residency/fellowship programs, other",
+    "61.1601": "Osteopathic neuromusculoskeletal medicine residency programs",
+    "61.1699": "Osteopathic medicine residency/fellowship programs, other",
+    "61.1701": "Otolaryngology residency programs",
+    "61.1702": "Neurotology fellowship programs",
+    "61.1703": "Pediatric otolaryngology fellowship programs",
+    "61.1799": "Otolaryngology residency/fellowship programs, other",
+    "61.1801": "Combined anatomic and clinical pathology residency programs",
+    "61.1802": "Anatomical pathology residency programs",
+    "61.1803": "Clinical pathology residency programs",
+    "61.1804": "Blood banking/transfusion medicine fellowship programs",
+    "61.1805": "Chemical pathology fellowship programs",
+    "61.1806": "Cytopathology fellowship programs",
+    "61.1807": "Forensic pathology fellowship programs",
+    "61.1808": "Hematological pathology fellowship programs",
+    "61.1809": "Immunopathology fellowship programs",
+    "61.1810": "Laboratory medicine fellowship programs",
+    "61.1811": "Medical microbiology fellowship programs",
+    "61.1812": "Molecular genetic pathology fellowship programs",
+    "61.1813": "Neuropathology fellowship programs",
+    "61.1814": "Pediatric pathology fellowship programs",
+    "61.1815": "Radioisotopic pathology fellowship programs",
+    "61.1899": "Pathology residency/fellowship programs, other",
+    "61.1901": "Pediatrics residency programs",
+    "61.1902": "Adolescent medicine fellowship programs",
+    "61.1903": "Child abuse pediatrics fellowship programs",
+    "61.1904": "Developmental-behavioural pediatrics fellowship programs",
+    "61.1905": "Neonatal-perinatal medicine fellowship programs",
+    "61.1906": "Pediatric cardiology fellowship programs",
+    "61.1907": "Pediatric critical care medicine fellowship programs",
+    "61.1908": "Pediatric emergency medicine fellowship programs",
+    "61.1909": "Pediatric endocrinology fellowship programs",
+    "61.1910": "Pediatric gastroenterology fellowship programs",
+    "61.1911": "Pediatric hematology-oncology fellowship programs",
+    "61.1912": "Pediatric infectious diseases fellowship programs",
+    "61.1913": "Pediatric nephrology fellowship programs",
+    "61.1914": "Pediatric pulmonology fellowship programs",
+    "61.1915": "Pediatric rheumatology fellowship programs",
+    "61.1917": "Pediatric transplant hepatology fellowship programs",
+    "61.1999": "Pediatrics residency/fellowship programs, other",
+    "61.2001": "Physical medicine and rehabilitation residency programs",
+    "61.2002": "Spinal cord injury medicine fellowship programs",
+    "61.2003": "Pediatric rehabilitation medicine fellowship programs",
+    "61.2099": "Physical medicine and rehabilitation residency/fellowship programs, other",
+    "61.2101": "Plastic surgery residency programs",
+    "61.2102": "Integrated plastic surgery residency programs",
+    "61.2103": "Plastic surgery within the head and neck fellowship programs",
+    "61.2199": "Plastic surgery residency/fellowship programs, other",
+    "61.2201": "Podiatric medicine and surgery residency programs",
+    "61.2299": "Podiatric medicine residency/fellowship programs, other",
+    "61.2301": "Public health and general preventive medicine residency programs",
+    "61.2302": "Aerospace medicine residency programs",
+    "61.2303": "Occupational medicine residency programs",
+    "61.2399": "Preventive medicine residency/fellowship programs, other",
+    "61.2401": "Psychiatry residency programs",
+    "61.2402": "Addiction psychiatry fellowship programs",
+    "61.2403": "Child and adolescent psychiatry fellowship programs",
+    "61.2404": "Consultation-liaison psychiatry fellowship programs",
+    "61.2405": "Forensic psychiatry fellowship programs",
+    "61.2406": "Geriatric psychiatry fellowship programs",
+    "61.2499": "Psychiatry residency/fellowship programs, other",
+    "61.2501": "Radiation oncology residency programs",
+    "61.2599": "Radiation oncology residency/fellowship programs, other",
+    "61.2601": "Diagnostic radiology residency programs",
+    "61.2602": "Integrated interventional radiology residency programs",
+    "61.2603": "Abdominal radiology fellowship programs",
+    "61.2604": "Diagnostic radiologic physics residency programs",
+    "61.2605": "Medical nuclear physics residency programs",
+    "61.2606": "Musculoskeletal radiology fellowship programs",
+    "61.2607": "Neuroradiology fellowship programs",
+    "61.2608": "Nuclear radiology fellowship programs",
+    "61.2609": "Pediatric radiology fellowship programs",
+    "61.2610": "Radiologic physics residency programs",
+    "61.2611": "Therapeutic radiologic physics residency programs",
+    "61.2612": "Vascular and interventional radiology fellowship programs",
+    "61.2699": "Radiology residency/fellowship programs, other",
+    "61.2701": "General surgery residency programs",
+    "61.2702": "Colon and rectal surgery residency programs",
+    "61.2703": "Complex general surgical oncology fellowship programs",
+    "61.2704": "Congenital cardiac surgery fellowship programs",
+    "61.2705": "Pediatric surgery fellowship programs",
+    "61.2706": "Surgical critical care fellowship programs",
+    "61.2707": "Thoracic surgery fellowship programs",
+    "61.2708": "Vascular surgery fellowship programs",
+    "61.2799": "Surgery residency/fellowship programs, other",
+    "61.2801": "Urology residency programs",
+    "61.2802": "Pediatric urology fellowship programs",
+    "61.2899": "Urology residency/fellowship programs, other",
+    "61.9999": "Medical residency/fellowship programs, other",
+}
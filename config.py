@@ -1,9 +1,22 @@
 """Configuration: API endpoints, table IDs, dimension mappings."""
 
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
+
+
+def _freeze(d: dict) -> MappingProxyType:
+    """Read-only view of d with interned string keys; nested dicts frozen too."""
+    return MappingProxyType({
+        (sys.intern(k) if isinstance(k, str) else k): (_freeze(v) if isinstance(v, dict) else v)
+        for k, v in d.items()
+    })
+
+
 API_BASE_URL = "https://www150.statcan.gc.ca/t1/wds/rest/"
 
 # Table keys → 8-digit Product IDs
-TABLES = {
+TABLES = _freeze({
     "labour_force": 98100445,
     "income": 98100409,
     "unemployment_trends": 14100020,
@@ -12,20 +25,24 @@ TABLES = {
     "graduate_outcomes_cip": 37100280,
     "cip_noc_distribution": 98100403,
     "noc_income": 98100412,
-}
+})
+
+# Canada, then provinces and territories in StatCan order; each table's geo
+# dict pairs these names with its own member IDs
+PROVINCES = tuple(map(sys.intern, (
+    "Canada", "Newfoundland and Labrador", "Prince Edward Island",
+    "Nova Scotia", "New Brunswick", "Quebec", "Ontario",
+    "Manitoba", "Saskatchewan", "Alberta", "British Columbia",
+    "Yukon", "Northwest Territories", "Nunavut",
+)))
 
 # ── Table 98100445: Labour force status ──
 # Dims: Geo(174), Education(16), LocationOfStudy(7), Age(15), Gender(3), FieldOfStudy(63), LabourForceStatus(8)
 # Coordinates: {geo}.{edu}.{loc}.{age}.{gender}.{field}.{status}.0.0.0
 
-LABOUR_FORCE_GEO = {
-    "Canada": 1, "Newfoundland and Labrador": 2, "Prince Edward Island": 7,
-    "Nova Scotia": 10, "New Brunswick": 16, "Quebec": 26, "Ontario": 56,
-    "Manitoba": 104, "Saskatchewan": 111, "Alberta": 121,
-    "British Columbia": 141, "Yukon": 170, "Northwest Territories": 172, "Nunavut": 174,
-}
+LABOUR_FORCE_GEO = _freeze(dict(zip(PROVINCES, (1, 2, 7, 10, 16, 26, 56, 104, 111, 121, 141, 170, 172, 174))))
 
-LABOUR_FORCE_EDU = {
+LABOUR_FORCE_EDU = _freeze({
     "Total": 1, "No certificate, diploma or degree": 2,
     "High school diploma": 3, "Postsecondary certificate, diploma or degree": 4,
     "Below bachelor level": 5,
@@ -36,10 +53,10 @@ LABOUR_FORCE_EDU = {
     "University certificate or diploma above bachelor level": 13,
     "Degree in medicine, dentistry, veterinary medicine or optometry": 14,
     "Master's degree": 15, "Earned doctorate": 16,
-}
+})
 
 # Field of study member IDs (broad categories)
-LABOUR_FORCE_FIELDS = {
+LABOUR_FORCE_FIELDS = _freeze({
     "Total": 1,
     "Education": 3,
     "Visual and performing arts, and communications technologies": 5,
@@ -52,10 +69,10 @@ LABOUR_FORCE_FIELDS = {
     "Agriculture, natural resources and conservation": 48,
     "Health and related fields": 51,
     "Personal, protective and transportation services": 57,
-}
+})
 
 # Detailed subfields (2-digit CIP mapped to member IDs)
-LABOUR_FORCE_SUBFIELDS = {
+LABOUR_FORCE_SUBFIELDS = _freeze({
     # Education
     "13. Education": 4,
     # Visual and performing arts
@@ -103,33 +120,28 @@ LABOUR_FORCE_SUBFIELDS = {
     "12. Culinary, entertainment, personal services": 58,
     "43. Security and protective services": 61,
     "49. Transportation and materials moving": 62,
-}
+})
 
-LABOUR_FORCE_STATUS = {
+LABOUR_FORCE_STATUS = _freeze({
     "Participation rate": 6,
     "Employment rate": 7,
     "Unemployment rate": 8,
     "In the labour force": 2,
     "Employed": 3,
     "Unemployed": 4,
-}
+})
 
 # ── Table 98100409: Income ──
 # Dims: Geo(14), Gender(3), Age(15), Education(16), WorkActivity(5), IncomeYear(2), FieldOfStudy(500), IncomeStats(7)
 # Coordinates: {geo}.{gender}.{age}.{edu}.{work}.{year}.{field}.{stat}.0.0
 
-INCOME_GEO = {
-    "Canada": 1, "Newfoundland and Labrador": 2, "Prince Edward Island": 3,
-    "Nova Scotia": 4, "New Brunswick": 5, "Quebec": 6, "Ontario": 7,
-    "Manitoba": 8, "Saskatchewan": 9, "Alberta": 10,
-    "British Columbia": 11, "Yukon": 12, "Northwest Territories": 13, "Nunavut": 14,
-}
+INCOME_GEO = _freeze(dict(zip(PROVINCES, range(1, 15))))
 
 # Same education IDs as labour force (they share the same 16-member dimension)
 INCOME_EDU = LABOUR_FORCE_EDU
 
 # Broad field member IDs in the income table (500-member dimension)
-INCOME_FIELDS = {
+INCOME_FIELDS = _freeze({
     "Total": 1,
     "Education": 3,
     "Visual and performing arts, and communications technologies": 20,
@@ -142,9 +154,9 @@ INCOME_FIELDS = {
     "Agriculture, natural resources and conservation": 371,
     "Health and related fields": 399,
     "Personal, protective and transportation services": 476,
-}
+})
 
-INCOME_SUBFIELDS = {
+INCOME_SUBFIELDS = _freeze({
     # Math, CS detailed
     "11. Computer and information sciences": 242,
     "11.07 Computer science": 249,
@@ -185,32 +197,29 @@ INCOME_SUBFIELDS = {
     "42. Psychology": 143,
     "45. Social sciences": 148,
     "45.06 Economics": 154,
-}
+})
 
-INCOME_STATS = {
+INCOME_STATS = _freeze({
     "Median employment income": 3,
     "Average employment income": 4,
     "Median wages, salaries and commissions": 6,
     "Average wages, salaries and commissions": 7,
-}
+})
 
 # ── Table 14100020: Unemployment trends ──
 # Dims: Geo(11), LabourForce(10), Education(9), Gender(3), AgeGroup(9)
 # Coordinates: {geo}.{lf}.{edu}.{gender}.{age}.0.0.0.0.0
 
-UNEMP_GEO = {
-    "Canada": 1, "Newfoundland and Labrador": 2, "Prince Edward Island": 3,
-    "Nova Scotia": 4, "New Brunswick": 5, "Quebec": 6, "Ontario": 7,
-    "Manitoba": 8, "Saskatchewan": 9, "Alberta": 10, "British Columbia": 11,
-}
+# No territories in this table
+UNEMP_GEO = _freeze(dict(zip(PROVINCES[:11], range(1, 12))))
 
-UNEMP_INDICATOR = {
+UNEMP_INDICATOR = _freeze({
     "Unemployment rate": 8,
     "Participation rate": 9,
     "Employment rate": 10,
-}
+})
 
-UNEMP_EDU = {
+UNEMP_EDU = _freeze({
     "Total, all education levels": 1,
     "0 to 8 years": 2,
     "Some high school": 3,
@@ -220,7 +229,7 @@ UNEMP_EDU = {
     "University degree": 7,
     "Bachelor's degree": 8,
     "Above bachelor's degree": 9,
-}
+})
 
 # ── Table 14100443: Job vacancies ──
 # Dims: Geo(14), NOC(824), Characteristics(48), Statistics(3)
@@ -228,7 +237,7 @@ UNEMP_EDU = {
 
 JOB_VAC_GEO = INCOME_GEO
 
-JOB_VAC_CHAR = {
+JOB_VAC_CHAR = _freeze({
     "All types": 1,
     "No minimum education required": 5,
     "High school diploma or equivalent": 6,
@@ -238,26 +247,22 @@ JOB_VAC_CHAR = {
     "University certificate below bachelor's": 10,
     "Bachelor's degree": 12,
     "Above bachelor's degree": 13,
-}
+})
 
-JOB_VAC_STAT = {
+JOB_VAC_STAT = _freeze({
     "Job vacancies": 1,
     "Proportion of job vacancies": 2,
     "Average offered hourly wage": 5,
-}
+})
 
 # ── Table 37100283: Graduate outcomes ──
 # Dims: Geo(12), EduQualification(13), Field(41), Gender(3), AgeGroup(3), StudentStatus(3), Characteristics(5), Stats(3)
 # Coordinates: {geo}.{qual}.{field}.{gender}.{age}.{status}.{char}.{stat}.0.0
 
-GRAD_GEO = {
-    "Canada": 1, "Newfoundland and Labrador": 2, "Prince Edward Island": 3,
-    "Nova Scotia": 4, "New Brunswick": 5, "Quebec": 6, "Ontario": 7,
-    "Manitoba": 8, "Saskatchewan": 9, "Alberta": 10,
-    "British Columbia": 11, "Territories": 12,
-}
+# The three territories are pooled into one member
+GRAD_GEO = _freeze(dict(zip(PROVINCES[:11] + ("Territories",), range(1, 13))))
 
-GRAD_QUAL = {
+GRAD_QUAL = _freeze({
     "Total": 1,
     "Short credential": 2,
     "Certificate": 3,
@@ -267,9 +272,9 @@ GRAD_QUAL = {
     "Professional degree": 9,
     "Master's degree": 11,
     "Doctoral degree": 12,
-}
+})
 
-GRAD_FIELDS = {
+GRAD_FIELDS = _freeze({
     "Total": 1,
     "STEM": 2,
     "Science and science technology": 3,
@@ -284,18 +289,18 @@ GRAD_FIELDS = {
     "Health care": 28,
     "Education and teaching": 33,
     "Trades, services, natural resources and conservation": 35,
-}
+})
 
-GRAD_STATS = {
+GRAD_STATS = _freeze({
     "Number of graduates": 1,
     "Median income 2yr after graduation": 2,
     "Median income 5yr after graduation": 3,
-}
+})
 
 # ── UI Dropdown Mappings ──
 
 # Maps user-friendly field names → (labour_force_member_id, income_member_id, grad_field_id)
-FIELD_OPTIONS = {
+FIELD_OPTIONS = _freeze({
     "Education": {
         "labour_force": 3, "income": 3, "graduate": 33,
         "subfields": {
@@ -398,9 +403,53 @@ FIELD_OPTIONS = {
             "43. Security and protective services": {"labour_force": 61, "income": 487},
         },
     },
-}
+})
+
+
+@dataclass(frozen=True, slots=True)
+class FieldIDs:
+    """Member IDs of one field choice in the labour force, income and graduate tables."""
+
+    labour_force: int = 1
+    income: int = 1
+    graduate: int = 1
+
+
+_TOTAL_IDS = FieldIDs()
+
 
-EDUCATION_OPTIONS = {
+def _build_field_ids() -> dict[tuple[str, str | None], FieldIDs]:
+    """Flatten FIELD_OPTIONS into (field, subfield or None) → FieldIDs.
+
+    A subfield inherits any ID it lacks from its broad field; a broad field
+    lacking an ID uses 1 (Total).
+    """
+    ids = {}
+    for field, info in FIELD_OPTIONS.items():
+        broad = FieldIDs(info.get("labour_force", 1), info.get("income", 1), info.get("graduate", 1))
+        ids[field, None] = broad
+        for sub, sub_info in info.get("subfields", {}).items():
+            ids[field, sub] = FieldIDs(
+                sub_info.get("labour_force", broad.labour_force),
+                sub_info.get("income", broad.income),
+                broad.graduate,
+            )
+    return ids
+
+
+_FIELD_IDS = _build_field_ids()
+
+
+def field_ids(field_name: str, subfield_name: str | None = None) -> FieldIDs:
+    """Labour force, income and graduate member IDs for a field/subfield choice.
+
+    One flat lookup instead of walking FIELD_OPTIONS; unknown subfields fall
+    back to the broad field and unknown fields to Total (1, 1, 1).
+    """
+    return _FIELD_IDS.get((field_name, subfield_name)) or _FIELD_IDS.get((field_name, None), _TOTAL_IDS)
+
+
+EDUCATION_OPTIONS = _freeze({
     "Bachelor's degree": {
         "labour_force": 12, "income": 12, "unemp": 8, "job_vac": 12, "grad": 7,
     },
@@ -425,47 +474,22 @@ EDUCATION_OPTIONS = {
     "University degree (any)": {
         "labour_force": 11, "income": 11, "unemp": 7,
     },
-}
+})
 
-GEO_OPTIONS = [
-    "Canada", "Newfoundland and Labrador", "Prince Edward Island",
-    "Nova Scotia", "New Brunswick", "Quebec", "Ontario",
-    "Manitoba", "Saskatchewan", "Alberta", "British Columbia",
-    "Yukon", "Northwest Territories", "Nunavut",
-]
+GEO_OPTIONS = list(PROVINCES)
 
 # ── Table 37100280: Graduate outcomes by CIP primary groupings ──
 # Dims: Geo(12), EduQualification(13), Field(64), Gender(3), AgeGroup(3),
 #        StudentStatus(3), Characteristics(5), Stats(3)
 # Coordinates: {geo}.{qual}.{field}.{gender}.{age}.{status}.{char}.{stat}.0.0
 
-GRAD_CIP_GEO = {
-    "Canada": 1, "Newfoundland and Labrador": 2, "Prince Edward Island": 3,
-    "Nova Scotia": 4, "New Brunswick": 5, "Quebec": 6, "Ontario": 7,
-    "Manitoba": 8, "Saskatchewan": 9, "Alberta": 10,
-    "British Columbia": 11, "Territories": 12,
-}
-
-GRAD_CIP_QUAL = {
-    "Total": 1,
-    "Short credential": 2,
-    "Certificate": 3,
-    "Diploma": 4,
-    "Undergraduate certificate": 6,
-    "Undergraduate degree": 7,
-    "Professional degree": 9,
-    "Master's degree": 11,
-    "Doctoral degree": 12,
-}
-
-GRAD_CIP_STATS = {
-    "Number of graduates": 1,
-    "Median income 2yr after graduation": 2,
-    "Median income 5yr after graduation": 3,
-}
+# Geo, qualification and stat members are the same as table 37100283
+GRAD_CIP_GEO = GRAD_GEO
+GRAD_CIP_QUAL = GRAD_QUAL
+GRAD_CIP_STATS = GRAD_STATS
 
 # CIP-based field of study member IDs (broad categories = parent nodes)
-GRAD_CIP_BROAD_FIELDS = {
+GRAD_CIP_BROAD_FIELDS = _freeze({
     "Total": 1,
     "Education": 2,
     "Visual and performing arts, and communications technologies": 4,
@@ -479,10 +503,10 @@ GRAD_CIP_BROAD_FIELDS = {
     "Health and related fields": 50,
     "Personal, protective and transportation services": 56,
     "Other instructional programs": 62,
-}
+})
 
 # Detailed CIP sub-fields (2-digit CIP → member IDs)
-GRAD_CIP_SUBFIELDS = {
+GRAD_CIP_SUBFIELDS = _freeze({
     # Education
     "13. Education": 3,
     # Visual and performing arts
@@ -546,11 +570,11 @@ GRAD_CIP_SUBFIELDS = {
     # Other
     "30.00 Inclusive postsecondary education": 63,
     "30.99 Multidisciplinary studies, other": 64,
-}
+})
 
 # Map 2-digit CIP prefix → member ID in table 37100280
 # Used to resolve a user's 6-digit CIP to the closest sub-field in this table
-CIP_PREFIX_TO_GRAD_CIP = {
+CIP_PREFIX_TO_GRAD_CIP = _freeze({
     "13": 3,   # Education
     "10": 5,   # Communications technologies
     "50": 6,   # Visual and performing arts
@@ -590,7 +614,7 @@ CIP_PREFIX_TO_GRAD_CIP = {
     "29": 59,  # Military technologies
     "43": 60,  # Security and protective services
     "49": 61,  # Transportation and materials moving
-}
+})
 
 # ── Table 98100403: Occupation by major field of study (CIP→NOC) ──
 # Dims: Geo(1), Age(4), CIP(500), Education(16), Gender(3), NOC(821), Statistics(6)
@@ -598,23 +622,10 @@ CIP_PREFIX_TO_GRAD_CIP = {
 # This table provides count and % distribution of graduates by NOC occupation
 
 # CIP field IDs in table 98100403 (same as INCOME_FIELDS — they share the CIP 2021 500-member dim)
-NOC_DIST_CIP_FIELDS = {
-    "Total": 1,
-    "Education": 3,
-    "Visual and performing arts, and communications technologies": 20,
-    "Humanities": 38,
-    "Social and behavioural sciences and law": 97,
-    "Business, management and public administration": 163,
-    "Physical and life sciences and technologies": 195,
-    "Mathematics, computer and information sciences": 241,
-    "Architecture, engineering, and related trades": 273,
-    "Agriculture, natural resources and conservation": 371,
-    "Health and related fields": 399,
-    "Personal, protective and transportation services": 476,
-}
+NOC_DIST_CIP_FIELDS = INCOME_FIELDS
 
 # 2-digit CIP → member IDs in table 98100403 (same as income table)
-NOC_DIST_CIP_SUBFIELDS = {
+NOC_DIST_CIP_SUBFIELDS = _freeze({
     "13": 4,    # Education
     "10": 21,   # Communications technologies
     "50": 26,   # Visual and performing arts
@@ -654,10 +665,10 @@ NOC_DIST_CIP_SUBFIELDS = {
     "29": 485,  # Military technologies
     "43": 487,  # Security and protective services
     "49": 493,  # Transportation and materials moving
-}
+})
 
 # NOC 2021 broad occupation categories (1-digit level)
-NOC_BROAD_CATEGORIES = {
+NOC_BROAD_CATEGORIES = _freeze({
     "0 Legislative and senior management": 4,
     "1 Business, finance and administration": 10,
     "2 Natural and applied sciences": 105,
@@ -668,10 +679,10 @@ NOC_BROAD_CATEGORIES = {
     "7 Trades, transport and equipment operators": 527,
     "8 Natural resources, agriculture and production": 671,
     "9 Manufacturing and utilities": 725,
-}
+})
 
 # NOC 2-digit sub-major groups
-NOC_SUBMAJOR_GROUPS = {
+NOC_SUBMAJOR_GROUPS = _freeze({
     # Under 0
     "00 Legislative and senior managers": 5,
     # Under 1
@@ -727,64 +738,65 @@ NOC_SUBMAJOR_GROUPS = {
     "93 Central control and process operators": 750,
     "94 Machine operators, assemblers and inspectors": 759,
     "95 Labourers in processing/manufacturing": 810,
-}
+})
 
-NOC_DIST_STATS = {
+NOC_DIST_STATS = _freeze({
     "pct_distribution": 1,
     "count": 4,
-}
-
-# 2-digit NOC → list of 5-digit children member IDs (for drill-down queries)
-NOC_2DIGIT_TO_5DIGIT = {
-    5: [8, 9],
-    11: [14, 15, 16, 17, 19, 20, 21, 22, 24],
-    25: [28, 29, 30, 31, 32, 35, 36, 37],
-    38: [41, 42, 43, 44, 47, 48, 49, 50, 51, 53, 54, 55, 56, 59, 60, 61, 62],
-    63: [66, 67, 68, 70, 71, 72, 75, 76],
-    77: [80, 81, 82, 83, 85, 86, 87, 90, 91, 92, 95, 96, 99, 100, 101, 102, 103, 104],
-    106: [109, 110, 111],
-    112: [115, 116, 117, 118, 119, 121, 122, 123, 125, 128, 129, 130, 131, 133, 134, 136, 137, 138, 139, 141, 142, 143, 144, 145, 148, 149, 151, 152, 154, 155, 156, 158, 159, 160, 162, 163],
-    164: [167, 168, 170, 171, 172, 173, 174, 177, 178, 179, 180, 181, 183, 184, 185, 187, 188, 189, 190, 193, 194, 195, 196, 198, 199, 200, 201],
-    203: [206],
-    207: [210, 211, 212, 213, 215, 216, 217, 219, 220, 223, 224, 225, 226, 227, 228, 231, 232, 233, 234],
-    235: [238, 239, 240, 241, 242, 243, 245, 246, 247, 249, 250, 251, 252, 253, 254, 257, 258, 259],
-    260: [263, 264, 265, 266, 267],
-    269: [272, 273, 274, 275, 277, 278, 280, 282, 283, 284],
-    285: [288, 289, 292, 293, 295, 297, 298, 301, 302, 303, 305, 306, 308, 309, 312, 313, 314, 315, 316, 317, 318, 319, 320],
-    321: [324, 325, 326, 329, 330, 331, 332, 333],
-    334: [337, 338, 341, 342, 343, 344, 345],
-    346: [349, 350, 353],
-    354: [357],
-    359: [362, 363, 364],
-    365: [368, 369, 370, 372, 373, 374, 375, 376, 378, 379, 380],
-    381: [384, 386, 387, 388, 389, 390, 391, 393, 394],
-    395: [398, 400, 401, 403, 404, 405, 406, 407, 408, 411, 412, 413],
-    414: [417],
-    418: [421],
-    423: [426, 428, 430, 431, 433],
-    434: [437, 439, 440, 441, 442, 443, 444, 447, 448, 451, 452, 453],
-    454: [457, 458, 459, 462, 463, 464, 466, 467, 469, 470],
-    471: [474, 475, 478, 479, 482, 483, 485, 486, 487, 488, 489, 491, 492, 493, 496, 497, 498, 500],
-    501: [504, 505, 506, 507, 510, 511, 512, 514, 515, 517, 518, 521, 522, 523, 525, 526],
-    528: [531, 532, 533, 535, 536],
-    537: [540, 541, 542, 543, 544, 546, 547, 548, 549, 550, 551, 554, 555, 556, 557, 558, 559, 560, 563, 564, 565, 566, 567, 568, 571, 572, 573, 575, 576, 578, 579, 582, 583, 584, 585, 586, 587, 588, 590, 591, 593, 594, 595, 596, 597, 600, 601, 604, 605, 606, 607, 608, 611],
-    612: [615, 616, 617, 619, 620, 621, 622, 625, 626, 627, 628, 631, 632, 634, 635, 638, 639, 640],
-    641: [644, 645, 646, 649, 650, 651, 652, 653, 654],
-    655: [658, 659, 661, 662, 665, 666, 668, 669, 670],
-    672: [675, 677, 678, 679],
-    680: [683, 685, 686, 688, 689],
-    690: [693, 694, 696, 698, 699],
-    700: [703, 704, 706, 707, 709, 710],
-    711: [714, 715, 716, 717, 718, 720, 721, 723, 724],
-    726: [729, 730],
-    731: [734, 735, 736, 737, 738, 739, 741, 742, 743, 744, 745, 748, 749],
-    750: [753, 754, 755, 758],
-    759: [762, 763, 764, 765, 766, 767, 768, 769, 771, 772, 773, 775, 776, 777, 778, 779, 780, 782, 783, 784, 785, 787, 788, 789, 790, 792, 793, 794, 795, 798, 799, 800, 801, 802, 803, 805, 806, 807, 808, 809],
-    810: [813, 814, 815, 816, 817, 818, 819, 820, 821],
-}
+})
+
+# 2-digit NOC → 5-digit children member IDs (for drill-down queries); tuples
+# of ints are stored as constants in the compiled module, not rebuilt on import
+NOC_2DIGIT_TO_5DIGIT = _freeze({
+    5: (8, 9),
+    11: (14, 15, 16, 17, 19, 20, 21, 22, 24),
+    25: (28, 29, 30, 31, 32, 35, 36, 37),
+    38: (41, 42, 43, 44, 47, 48, 49, 50, 51, 53, 54, 55, 56, 59, 60, 61, 62),
+    63: (66, 67, 68, 70, 71, 72, 75, 76),
+    77: (80, 81, 82, 83, 85, 86, 87, 90, 91, 92, 95, 96, 99, 100, 101, 102, 103, 104),
+    106: (109, 110, 111),
+    112: (115, 116, 117, 118, 119, 121, 122, 123, 125, 128, 129, 130, 131, 133, 134, 136, 137, 138, 139, 141, 142, 143, 144, 145, 148, 149, 151, 152, 154, 155, 156, 158, 159, 160, 162, 163),
+    164: (167, 168, 170, 171, 172, 173, 174, 177, 178, 179, 180, 181, 183, 184, 185, 187, 188, 189, 190, 193, 194, 195, 196, 198, 199, 200, 201),
+    203: (206,),
+    207: (210, 211, 212, 213, 215, 216, 217, 219, 220, 223, 224, 225, 226, 227, 228, 231, 232, 233, 234),
+    235: (238, 239, 240, 241, 242, 243, 245, 246, 247, 249, 250, 251, 252, 253, 254, 257, 258, 259),
+    260: (263, 264, 265, 266, 267),
+    269: (272, 273, 274, 275, 277, 278, 280, 282, 283, 284),
+    285: (288, 289, 292, 293, 295, 297, 298, 301, 302, 303, 305, 306, 308, 309, 312, 313, 314, 315, 316, 317, 318, 319, 320),
+    321: (324, 325, 326, 329, 330, 331, 332, 333),
+    334: (337, 338, 341, 342, 343, 344, 345),
+    346: (349, 350, 353),
+    354: (357,),
+    359: (362, 363, 364),
+    365: (368, 369, 370, 372, 373, 374, 375, 376, 378, 379, 380),
+    381: (384, 386, 387, 388, 389, 390, 391, 393, 394),
+    395: (398, 400, 401, 403, 404, 405, 406, 407, 408, 411, 412, 413),
+    414: (417,),
+    418: (421,),
+    423: (426, 428, 430, 431, 433),
+    434: (437, 439, 440, 441, 442, 443, 444, 447, 448, 451, 452, 453),
+    454: (457, 458, 459, 462, 463, 464, 466, 467, 469, 470),
+    471: (474, 475, 478, 479, 482, 483, 485, 486, 487, 488, 489, 491, 492, 493, 496, 497, 498, 500),
+    501: (504, 505, 506, 507, 510, 511, 512, 514, 515, 517, 518, 521, 522, 523, 525, 526),
+    528: (531, 532, 533, 535, 536),
+    537: (540, 541, 542, 543, 544, 546, 547, 548, 549, 550, 551, 554, 555, 556, 557, 558, 559, 560, 563, 564, 565, 566, 567, 568, 571, 572, 573, 575, 576, 578, 579, 582, 583, 584, 585, 586, 587, 588, 590, 591, 593, 594, 595, 596, 597, 600, 601, 604, 605, 606, 607, 608, 611),
+    612: (615, 616, 617, 619, 620, 621, 622, 625, 626, 627, 628, 631, 632, 634, 635, 638, 639, 640),
+    641: (644, 645, 646, 649, 650, 651, 652, 653, 654),
+    655: (658, 659, 661, 662, 665, 666, 668, 669, 670),
+    672: (675, 677, 678, 679),
+    680: (683, 685, 686, 688, 689),
+    690: (693, 694, 696, 698, 699),
+    700: (703, 704, 706, 707, 709, 710),
+    711: (714, 715, 716, 717, 718, 720, 721, 723, 724),
+    726: (729, 730),
+    731: (734, 735, 736, 737, 738, 739, 741, 742, 743, 744, 745, 748, 749),
+    750: (753, 754, 755, 758),
+    759: (762, 763, 764, 765, 766, 767, 768, 769, 771, 772, 773, 775, 776, 777, 778, 779, 780, 782, 783, 784, 785, 787, 788, 789, 790, 792, 793, 794, 795, 798, 799, 800, 801, 802, 803, 805, 806, 807, 808, 809),
+    810: (813, 814, 815, 816, 817, 818, 819, 820, 821),
+})
 
 # 5-digit NOC member ID → display name (NOC code + description)
-NOC_5DIGIT_NAMES = {
+NOC_5DIGIT_NAMES = _freeze({
     8: "00010 Legislators", 9: "00018 Senior managers",
     14: "10010 Financial managers", 15: "10011 Human resources managers",
     16: "10012 Purchasing managers", 17: "10019 Other administrative services managers",
@@ -1084,7 +1096,7 @@ NOC_5DIGIT_NAMES = {
     817: "95104 Labourers in rubber and plastic manufacturing",
     818: "95105 Labourers in textile processing", 819: "95106 Labourers in food processing",
     820: "95107 Labourers in fish processing", 821: "95109 Other labourers in manufacturing",
-}
+})
 
 # Education dimension IDs in table 98100403 (same 16 members as labour_force)
 NOC_DIST_EDU = LABOUR_FORCE_EDU
@@ -1098,18 +1110,33 @@ NOC_DIST_EDU = LABOUR_FORCE_EDU
 # NOC member IDs are the same as tables 98100403 (shared 821-member NOC 2021 dimension)
 # CIP member IDs are the same as tables 98100403/98100409 (shared 500-member CIP 2021 dimension)
 
-NOC_INCOME_AGE = {
+NOC_INCOME_AGE = _freeze({
     "Total": 1,
     "15-24": 2,
     "25-64": 3,
-}
+})
 
-NOC_INCOME_WORK_ACTIVITY = {
+NOC_INCOME_WORK_ACTIVITY = _freeze({
     "Total": 1,
     "Full-year-full-time": 4,
-}
+})
 
-NOC_INCOME_STATS = {
+NOC_INCOME_STATS = _freeze({
     "Median employment income": 3,
     "Average employment income": 4,
-}
+})
+
+# ── Reverse lookups (built once; consumers index instead of scanning) ──
+
+
+def _by_id(d) -> MappingProxyType:
+    """Invert a name → member ID table."""
+    return _freeze({mid: name for name, mid in d.items()})
+
+
+UNEMP_EDU_BY_ID = _by_id(UNEMP_EDU)
+GRAD_CIP_SUBFIELDS_BY_ID = _by_id(GRAD_CIP_SUBFIELDS)
+
+# 5-digit NOC display name → member ID, and the same extended with submajor groups
+NOC_5DIGIT_IDS = _by_id(NOC_5DIGIT_NAMES)
+NOC_IDS_BY_NAME = _freeze({**NOC_SUBMAJOR_GROUPS, **NOC_5DIGIT_IDS})
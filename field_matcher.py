@@ -13,7 +13,7 @@ Three-tier matching:
 import re
 from difflib import SequenceMatcher
 
-from cip_codes import CIP_CODES, CIP_TO_BROAD
+from cip_codes import CIP_CODES, cip_to_broad
 
 MAX_RESULTS = 8
 
@@ -83,7 +83,7 @@ def _build_candidates(field_options: dict) -> list[dict]:
 
     for cip_code, cip_name in CIP_CODES.items():
         prefix_2 = cip_code[:2]
-        default_broad = CIP_TO_BROAD.get(prefix_2)
+        default_broad = cip_to_broad(prefix_2)
         if not default_broad:
             continue
 
@@ -15,15 +15,15 @@ from config import (
     NOC_BROAD_CATEGORIES, NOC_SUBMAJOR_GROUPS, NOC_DIST_STATS, NOC_DIST_EDU,
     NOC_2DIGIT_TO_5DIGIT, NOC_5DIGIT_NAMES,
     NOC_INCOME_AGE, NOC_INCOME_STATS as NOC_INC_STATS,
-    FIELD_OPTIONS, EDUCATION_OPTIONS,
+    UNEMP_EDU_BY_ID, GRAD_CIP_SUBFIELDS_BY_ID, NOC_5DIGIT_IDS, NOC_IDS_BY_NAME,
+    FIELD_OPTIONS, EDUCATION_OPTIONS, field_ids,
 )
 from data_client import StatCanClient
 
 
 def _coord(parts: list[int], total: int = 10) -> str:
     """Build a 10-position coordinate string, padding with 0s."""
-    padded = parts + [0] * (total - len(parts))
-    return ".".join(str(p) for p in padded)
+    return ".".join(map(str, parts)) + ".0" * (total - len(parts))
 
 
 def _extract_value(coord_map: dict, coord: str) -> float | None:
@@ -56,12 +56,7 @@ def fetch_labour_force(field_name: str, subfield_name: str | None, education: st
 
     geo_id = LABOUR_FORCE_GEO.get(geo, 1)
     edu_id = EDUCATION_OPTIONS.get(education, {}).get("labour_force", 12)
-    field_info = FIELD_OPTIONS.get(field_name, {})
-
-    if subfield_name and subfield_name in field_info.get("subfields", {}):
-        field_id = field_info["subfields"][subfield_name].get("labour_force", field_info.get("labour_force", 1))
-    else:
-        field_id = field_info.get("labour_force", 1)
+    field_id = field_ids(field_name, subfield_name).labour_force
 
     # geo.edu.loc(1).age(5=25-64).gender(1).field.status.0.0.0
     def make_coord(fid, status_id):
@@ -113,12 +108,7 @@ def fetch_income(field_name: str, subfield_name: str | None, education: str, geo
 
     geo_id = INCOME_GEO.get(geo, 1)
     edu_id = EDUCATION_OPTIONS.get(education, {}).get("income", 12)
-    field_info = FIELD_OPTIONS.get(field_name, {})
-
-    if subfield_name and subfield_name in field_info.get("subfields", {}):
-        field_id = field_info["subfields"][subfield_name].get("income", field_info.get("income", 1))
-    else:
-        field_id = field_info.get("income", 1)
+    field_id = field_ids(field_name, subfield_name).income
 
     # geo.gender(1).age(5=25-64).edu.work(5=full-year-ft).year(1=2020).field.stat.0.0
     batch = []
@@ -211,11 +201,7 @@ def fetch_unemployment_trends(education: str, geo: str) -> dict:
 
     # Summary for user's education
     user_edu_id = EDUCATION_OPTIONS.get(education, {}).get("unemp")
-    user_edu_name = None
-    for ename, eid in UNEMP_EDU.items():
-        if eid == user_edu_id:
-            user_edu_name = ename
-            break
+    user_edu_name = UNEMP_EDU_BY_ID.get(user_edu_id)
 
     summary = {}
     if user_edu_name and user_edu_name in trends:
@@ -296,7 +282,7 @@ def fetch_graduate_outcomes(field_name: str, education: str, geo: str) -> dict:
 
     geo_id = GRAD_GEO.get(geo, 1)
     grad_qual = EDUCATION_OPTIONS.get(education, {}).get("grad", 1)
-    grad_field = FIELD_OPTIONS.get(field_name, {}).get("graduate", 1)
+    grad_field = field_ids(field_name).graduate
 
     # geo.qual.field.gender(1).age(1=15-64).student(1=all).char(4=reporting income).stat.0.0
     batch = []
@@ -462,14 +448,10 @@ def _resolve_cip_to_grad_member(cip_code: str | None, broad_field: str) -> tuple
     Returns (member_id, display_name).
     """
     if cip_code:
-        prefix = cip_code.split(".")[0]
-        if prefix in CIP_PREFIX_TO_GRAD_CIP:
-            member_id = CIP_PREFIX_TO_GRAD_CIP[prefix]
-            # Find display name
-            for name, mid in GRAD_CIP_SUBFIELDS.items():
-                if mid == member_id:
-                    return member_id, name
-            return member_id, f"CIP {prefix}"
+        prefix = cip_code.partition(".")[0]
+        member_id = CIP_PREFIX_TO_GRAD_CIP.get(prefix)
+        if member_id is not None:
+            return member_id, GRAD_CIP_SUBFIELDS_BY_ID.get(member_id, f"CIP {prefix}")
 
     # Fall back to broad field
     member_id = GRAD_CIP_BROAD_FIELDS.get(broad_field, 1)
@@ -632,9 +614,10 @@ def _resolve_cip_to_noc_dist_member(cip_code: str | None, broad_field: str) -> t
     Returns (member_id, display_name).
     """
     if cip_code:
-        prefix = cip_code.split(".")[0]
-        if prefix in NOC_DIST_CIP_SUBFIELDS:
-            return NOC_DIST_CIP_SUBFIELDS[prefix], f"CIP {prefix}"
+        prefix = cip_code.partition(".")[0]
+        member_id = NOC_DIST_CIP_SUBFIELDS.get(prefix)
+        if member_id is not None:
+            return member_id, f"CIP {prefix}"
 
     # Fall back to broad field
     member_id = NOC_DIST_CIP_FIELDS.get(broad_field, 1)
@@ -817,15 +800,6 @@ def fetch_noc_gender_breakdown(
     cip_id, _ = _resolve_cip_to_noc_dist_member(cip_code, broad_field)
     count_stat = NOC_DIST_STATS["count"]
 
-    # Build a reverse lookup: NOC name → member ID
-    # Combine submajor and 5-digit maps
-    all_noc_ids = {}
-    all_noc_ids.update(NOC_SUBMAJOR_GROUPS)
-    all_noc_ids.update(NOC_5DIGIT_NAMES)  # This is id→name, we need name→id
-    name_to_id = {}
-    name_to_id.update({name: mid for name, mid in NOC_SUBMAJOR_GROUPS.items()})
-    name_to_id.update({name: mid for mid, name in NOC_5DIGIT_NAMES.items()})
-
     entries = noc_entries[:top_n]
 
     def make_coord(gender_id, noc_id):
@@ -836,7 +810,7 @@ def fetch_noc_gender_breakdown(
 
     for i, entry in enumerate(entries):
         noc_name = entry["noc"]
-        noc_id = name_to_id.get(noc_name)
+        noc_id = NOC_IDS_BY_NAME.get(noc_name)
         if not noc_id:
             continue
         for gender_id, gender_label in [(1, "total"), (2, "male"), (3, "female")]:
@@ -918,9 +892,6 @@ def fetch_noc_income_for_quadrant(
     age_mature = NOC_INCOME_AGE["25-64"]
     median_stat = NOC_INC_STATS["Median employment income"]
 
-    # Reverse lookup: NOC name → member ID
-    name_to_id = {v: k for k, v in NOC_5DIGIT_NAMES.items()}
-
     # Coordinate: geo(1).gender(1).age.edu.cip.work_activity(1).noc.income_stat.0.0
     def make_coord(age_id, noc_member_id):
         return _coord([1, 1, age_id, edu_id, cip_id, 1, noc_member_id, median_stat])
@@ -930,7 +901,7 @@ def fetch_noc_income_for_quadrant(
 
     for entry in noc_entries:
         noc_name = entry["noc"]
-        member_id = name_to_id.get(noc_name)
+        member_id = NOC_5DIGIT_IDS.get(noc_name)
         if member_id is None:
             continue
 
@@ -245,6 +245,13 @@ hr {
     margin: 2rem 0 !important;
 }
 
+/* Section anchor that doubles as a divider (saves an st.divider element) */
+.yf-section-break {
+    height: 1px;
+    background: linear-gradient(90deg, transparent, #E2E8F0 20%, #E2E8F0 80%, transparent);
+    margin: 2rem 0;
+}
+
 /* ── Deep Analysis CTA card ──────────────────────────────── */
 .yf-cta {
     background: linear-gradient(135deg, #EEF2FF 0%, #F5F3FF 50%, #FDF4FF 100%);
@@ -337,6 +344,29 @@ hr {
     font-size: 0.85rem;
 }
 
+/* ── Education ROI banner ────────────────────────────────── */
+.yf-roi-banner {
+    background: #ECFDF5;
+    border-left: 4px solid #10B981;
+    border-radius: 0 12px 12px 0;
+    padding: 16px 20px;
+    margin-bottom: 20px;
+    color: #065F46;
+    font-size: 0.9rem;
+}
+.yf-roi-banner p {
+    margin: 0 0 8px;
+}
+.yf-roi-banner summary {
+    cursor: pointer;
+    font-weight: 600;
+}
+.yf-roi-banner ul {
+    margin: 6px 0 0;
+    padding-left: 18px;
+    line-height: 1.6;
+}
+
 /* ── Footer ──────────────────────────────────────────────── */
 .yf-footer {
     text-align: center;